@@ -2,7 +2,8 @@
 """
 Detailed analysis script for scraping results.
 
-This script provides comprehensive analysis of stats.jsonl including:
+This script provides comprehensive analysis of stats.jsonl (or
+stats.msgpack) including:
 - Status distribution breakdown
 - Block type analysis
 - CAPTCHA vendor identification
@@ -12,13 +13,205 @@ This script provides comprehensive analysis of stats.jsonl including:
 - Latency statistics per method
 """
 
+from __future__ import annotations
+
 # ==== STANDARD LIBRARY IMPORTS ==== #
 import argparse
-import json
+import sys
+from array import array
 from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+# ==== THIRD-PARTY IMPORTS ==== #
+import numpy as np
+import orjson
+
+# ==== CONSTANTS ==== #
+
+_ERR_SET: frozenset[str] = frozenset(
+    map(sys.intern, ("http_error", "captcha_detected"))
+)
+"""Statuses counted as errors for HTTP code and domain breakdowns."""
+
+_get_core_fields = itemgetter("status", "method", "domain")
+"""Fetch the always-present row fields in one C-level call."""
+
+_RowKey = tuple[str, str, str, bool, str | None, bool, int | None, str]
+"""(status, block_type, method, captcha, vendor, is_error, http_status, domain)."""
+
+# ==== AGGREGATION ==== #
+
+@dataclass
+class _Aggregates:
+    """
+    Counters and latency samples accumulated over one stats file.
+
+    Attributes:
+        total: Number of non-empty rows read
+        status_counts: Rows per status
+        block_counts: Rows per block type
+        vendors: CAPTCHA rows per vendor
+        codes: Error rows per HTTP status code
+        error_domains: Error rows per domain
+        method_counts: Rows per fetch method
+        httpx_latencies: Non-zero HTTP latencies in ms (packed C ints)
+        playwright_latencies: Non-zero browser latencies in ms (packed C ints)
+        has_captcha: Whether any row reported a CAPTCHA
+        has_errors: Whether any row had an error status
+    """
+
+    total: int = 0
+    status_counts: Counter[str] = field(default_factory=Counter)
+    block_counts: Counter[str] = field(default_factory=Counter)
+    vendors: Counter[str | None] = field(default_factory=Counter)
+    codes: Counter[int] = field(default_factory=Counter)
+    error_domains: Counter[str] = field(default_factory=Counter)
+    method_counts: Counter[str] = field(default_factory=Counter)
+    httpx_latencies: array[int] = field(default_factory=lambda: array("i"))
+    playwright_latencies: array[int] = field(default_factory=lambda: array("i"))
+    has_captcha: bool = False
+    has_errors: bool = False
+
+
+
+
+def _iter_rows(stats_file: Path) -> Iterator[dict[str, Any]]:
+    """
+    Yield stats rows as dicts in the format implied by the file suffix.
+
+    Args:
+        stats_file: Path to a stats .jsonl or .msgpack file
+
+    Yields:
+        dict: One row per fetched URL, keyed by UrlStats field name
+    """
+    if stats_file.suffix == ".msgpack":
+        import msgspec
+
+        from tavily_scraper.utils.io import read_stats
+
+        for stat in read_stats(stats_file):
+            yield msgspec.structs.asdict(stat)
+        return
+
+    with stats_file.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+
+
+def _aggregate_stats(stats_file: Path) -> _Aggregates:
+    """
+    Fold every row of a stats file into counters in a single pass.
+
+    Each row is parsed (orjson for JSONL) and reduced to one combined key
+    holding every categorical field the report needs, so the hot loop
+    performs a single Counter update per row. The per-column breakdowns are then
+    derived from that pre-aggregate, whose size is bounded by the number
+    of distinct field combinations rather than by the row count.
+
+    Args:
+        stats_file: Path to stats .jsonl or .msgpack file
+
+    Returns:
+        _Aggregates with all breakdowns needed by main()
+    """
+    agg = _Aggregates()
+    combined: Counter[_RowKey] = Counter()
+    intern = sys.intern
+
+    for row in _iter_rows(stats_file):
+        agg.total += 1
+
+        status, method, domain = _get_core_fields(row)
+        # Low-cardinality values are interned so set membership and
+        # combined-key equality short-circuit on identity and reuse
+        # the cached hash instead of rehashing a fresh string per row.
+        status = intern(status)
+        method = intern(method)
+        captcha = bool(row.get("captcha_detected"))
+        is_error = status in _ERR_SET
+        combined[
+            (
+                status,
+                row.get("block_type", "none"),
+                method,
+                captcha,
+                row.get("block_vendor") if captcha else None,
+                is_error,
+                row.get("http_status") if is_error else None,
+                domain if is_error else "",
+            )
+        ] += 1
+
+        latency = row.get("latency_ms")
+        if latency:
+            if method == "httpx":
+                agg.httpx_latencies.append(latency)
+            elif method == "playwright":
+                agg.playwright_latencies.append(latency)
+
+        del row
+
+    # --► DERIVE PER-COLUMN BREAKDOWNS
+    # Insertion order of `combined` follows first occurrence in the file,
+    # so most_common() tie ordering matches a direct per-row count.
+    for key, count in combined.items():
+        status, block, method, captcha, vendor, is_error, code, domain = key
+        agg.status_counts[status] += count
+        agg.block_counts[block] += count
+        agg.method_counts[method] += count
+
+        if captcha:
+            agg.has_captcha = True
+            agg.vendors[vendor] += count
+
+        if is_error:
+            agg.has_errors = True
+            agg.error_domains[domain] += count
+            if code:
+                agg.codes[code] += count
+
+    return agg
+
+
+
+
+def _format_latency_stats(label: str, latencies: array[int]) -> list[str]:
+    """
+    Format min/P50/P95/max for a non-empty latency sample.
+
+    Percentiles use numpy's selection-based "lower" method, which avoids a
+    full sort and always reports an observed latency value. The samples
+    are viewed zero-copy from the packed array buffer.
+
+    Args:
+        label: Method label shown in the heading (e.g. "HTTP")
+        latencies: Latency values in milliseconds, as array("i")
+
+    Returns:
+        Output lines, without trailing newlines
+    """
+    arr = np.frombuffer(latencies, dtype=np.intc)
+    p50, p95 = np.percentile(arr, [50, 95], method="lower")
+
+    return [
+        f"\n{label} latencies (ms):",
+        f"  Min:  {arr.min()}",
+        f"  P50:  {p50}",
+        f"  P95:  {p95}",
+        f"  Max:  {arr.max()}",
+    ]
+
+
+
+
 # ==== ANALYSIS LOGIC ==== #
 
 def main() -> None:
@@ -37,13 +230,13 @@ def main() -> None:
         Exits early if stats file doesn't exist.
     """
     parser = argparse.ArgumentParser(
-        description="Analyze stats JSONL file for scraping results."
+        description="Analyze a stats file (JSONL or MessagePack) for scraping results."
     )
     parser.add_argument(
         "--file",
         "-f",
         default="data/stats.jsonl",
-        help="Path to stats JSONL file (default: data/stats.jsonl)",
+        help="Path to stats .jsonl or .msgpack file (default: data/stats.jsonl)",
     )
     args = parser.parse_args()
 
@@ -54,113 +247,90 @@ def main() -> None:
         print(f"No stats file found at {stats_file}. Run the pipeline first.")
         return
 
-    # --► LOAD STATISTICS
-    stats: list[dict[str, Any]] = []
-
-    with stats_file.open() as f:
-        for line in f:
-            if line.strip():
-                stats.append(json.loads(line))
+    # --► SINGLE-PASS AGGREGATION
+    agg = _aggregate_stats(stats_file)
 
     # --► DISPLAY HEADER
-    print(f"\n{'=' * 60}")
-    print("DETAILED ANALYSIS")
-    print(f"{'=' * 60}\n")
+    buf: list[str] = []
+    w = buf.append
+    inv_total = 100.0 / agg.total if agg.total else 0.0
+
+    w(f"\n{'=' * 60}")
+    w("DETAILED ANALYSIS")
+    w(f"{'=' * 60}\n")
 
     # --► STATUS BREAKDOWN
-    print("Status breakdown:")
-    status_counts = Counter(s["status"] for s in stats)
+    w("Status breakdown:")
 
-    for status, count in status_counts.most_common():
-        pct = count / len(stats) * 100
-        print(f"  {status:20s} {count:5d} ({pct:5.1f}%)")
+    buf.extend(
+        [
+            f"  {status:20s} {count:5d} ({count * inv_total:5.1f}%)"
+            for status, count in agg.status_counts.most_common()
+        ]
+    )
 
     # --► BLOCK TYPE ANALYSIS
-    print("\nBlock types:")
-    block_counts = Counter(s.get("block_type", "none") for s in stats)
+    w("\nBlock types:")
 
-    for block, count in block_counts.most_common():
-        pct = count / len(stats) * 100
-        print(f"  {block:20s} {count:5d} ({pct:5.1f}%)")
+    buf.extend(
+        [
+            f"  {block:20s} {count:5d} ({count * inv_total:5.1f}%)"
+            for block, count in agg.block_counts.most_common()
+        ]
+    )
 
     # --► CAPTCHA VENDOR BREAKDOWN
-    captcha_stats = [s for s in stats if s.get("captcha_detected")]
-
-    if captcha_stats:
-        print("\nCAPTCHA vendors:")
-        vendors = Counter(s.get("block_vendor") for s in captcha_stats)
-
-        for vendor, count in vendors.most_common():
-            print(f"  {vendor:20s} {count:5d}")
+    if agg.has_captcha:
+        w("\nCAPTCHA vendors:")
+
+        buf.extend(
+            [
+                f"  {vendor:20s} {count:5d}"
+                for vendor, count in agg.vendors.most_common()
+            ]
+        )
 
     # --► HTTP STATUS CODE PATTERNS
-    error_stats = [
-        s
-        for s in stats
-        if s["status"] in ("http_error", "captcha_detected")
-    ]
+    if agg.has_errors:
+        w("\nHTTP status codes (errors):")
 
-    if error_stats:
-        print("\nHTTP status codes (errors):")
-        codes = Counter(
-            s.get("http_status")
-            for s in error_stats
-            if s.get("http_status")
+        buf.extend(
+            [f"  {code:5} {count:5d}" for code, count in agg.codes.most_common(10)]
         )
 
-        for code, count in codes.most_common(10):
-            print(f"  {code:5} {count:5d}")
-
     # --► TOP ERROR DOMAINS
-    print("\nTop 10 domains with errors:")
-    error_domains = Counter(s["domain"] for s in error_stats)
+    w("\nTop 10 domains with errors:")
 
-    for domain, count in error_domains.most_common(10):
-        print(f"  {domain:40s} {count:3d}")
+    buf.extend(
+        [
+            f"  {domain:40s} {count:3d}"
+            for domain, count in agg.error_domains.most_common(10)
+        ]
+    )
 
     # --► METHOD DISTRIBUTION
-    print("\nMethod breakdown:")
-    method_counts = Counter(s["method"] for s in stats)
+    w("\nMethod breakdown:")
 
-    for method, count in method_counts.items():
-        pct = count / len(stats) * 100
-        print(f"  {method:20s} {count:5d} ({pct:5.1f}%)")
+    buf.extend(
+        [
+            f"  {method:20s} {count:5d} ({count * inv_total:5.1f}%)"
+            for method, count in agg.method_counts.items()
+        ]
+    )
 
     # --► HTTP LATENCY STATISTICS
-    httpx_latencies = [
-        s["latency_ms"]
-        for s in stats
-        if s["method"] == "httpx" and s.get("latency_ms")
-    ]
-
-    if httpx_latencies:
-        httpx_latencies.sort()
-        print("\nHTTP latencies (ms):")
-        print(f"  Min:  {min(httpx_latencies)}")
-        print(f"  P50:  {httpx_latencies[len(httpx_latencies) // 2]}")
-        print(f"  P95:  {httpx_latencies[int(len(httpx_latencies) * 0.95)]}")
-        print(f"  Max:  {max(httpx_latencies)}")
+    if agg.httpx_latencies:
+        buf.extend(_format_latency_stats("HTTP", agg.httpx_latencies))
 
     # --► BROWSER LATENCY STATISTICS
-    playwright_latencies = [
-        s["latency_ms"]
-        for s in stats
-        if s["method"] == "playwright" and s.get("latency_ms")
-    ]
-
-    if playwright_latencies:
-        playwright_latencies.sort()
-        print("\nBrowser latencies (ms):")
-        print(f"  Min:  {min(playwright_latencies)}")
-        print(f"  P50:  {playwright_latencies[len(playwright_latencies) // 2]}")
-        print(
-            f"  P95:  "
-            f"{playwright_latencies[int(len(playwright_latencies) * 0.95)]}"
-        )
-        print(f"  Max:  {max(playwright_latencies)}")
+    if agg.playwright_latencies:
+        buf.extend(_format_latency_stats("Browser", agg.playwright_latencies))
 
     # --► DISPLAY FOOTER
-    print(f"\n{'=' * 60}\n")
+    w(f"\n{'=' * 60}\n")
+
+    # Emit the whole report with one write instead of one per line
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
 
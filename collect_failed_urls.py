@@ -6,25 +6,25 @@ This script runs all URLs through httpx-only (no browser fallback),
 then extracts failed URLs into a separate CSV for targeted browser testing.
 """
 
-import json
 from pathlib import Path
 
+import orjson
+
 from tavily_scraper.config.env import load_run_config
 from tavily_scraper.pipelines.batch_runner import run_batch
-from tavily_scraper.utils.io import load_urls_from_csv
+from tavily_scraper.utils.io import load_urls_from_csv, read_stats
 
 
 async def main() -> None:
     input_file = Path(".sdd/raw/urls.csv")
     output_file = Path(".sdd/raw/failed_urls.csv")
-    stats_file = Path("data/stats_httpx_only.jsonl")
-    
     print(f"Loading URLs from {input_file}...")
     urls = load_urls_from_csv(input_file)
     print(f"Loaded {len(urls)} URLs")
     
     # Run with browser disabled
     config = load_run_config()
+    stats_file = config.data_dir / f"stats_httpx_only.{config.stats_format}"
     
     print("\n🔍 Running HTTP-only pass (no browser fallback)...")
     await run_batch(
@@ -34,28 +34,32 @@ async def main() -> None:
         stats_suffix="_httpx_only",
     )
     
-    # Extract failed URLs
+    # Stream failed URLs straight into the CSV; no intermediate list
     print(f"\n📊 Analyzing results from {stats_file}...")
-    failed_urls = []
-    
-    with open(stats_file) as f:
-        for line in f:
-            if not line.strip():
-                continue
-            row = json.loads(line)
-            # Collect anything that's not success
-            if row["status"] != "success":
-                failed_urls.append(row["url"])
-    
-    print(f"Found {len(failed_urls)} failed URLs")
-    
-    # Save to CSV
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w") as f:
-        f.write("url\n")
-        for url in failed_urls:
-            f.write(f"{url}\n")
-    
+    failed = 0
+
+    with output_file.open("w", buffering=1 << 20) as out:
+        out.write("url\n")
+        if stats_file.suffix == ".msgpack":
+            for stat in read_stats(stats_file):
+                if stat.status != "success":
+                    out.write(stat.url)
+                    out.write("\n")
+                    failed += 1
+        else:
+            with stats_file.open("rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    row = orjson.loads(line)
+                    # Collect anything that's not success
+                    if row["status"] != "success":
+                        out.write(row["url"])
+                        out.write("\n")
+                        failed += 1
+
+    print(f"Found {failed} failed URLs")
     print(f"✓ Saved failed URLs to {output_file}")
     print("\nNext steps:")
     print(f"  1. Test without stealth: ./run.sh compare-browser {output_file}")
@@ -7,40 +7,43 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+
+import msgspec
 
 from tavily_scraper.config.env import load_run_config
-from tavily_scraper.core.models import RunSummary
+from tavily_scraper.core.models import RunConfig, RunSummary
 from tavily_scraper.pipelines.batch_runner import run_batch
 from tavily_scraper.stealth.config import StealthConfig
 from tavily_scraper.utils.io import load_urls_from_csv
-from tavily_scraper.utils.metrics import compute_run_summary
 
 URLS_FILE = Path(".sdd/raw/urls.csv")
-DATA_DIR = Path("data")
 
 
 async def run_once(
     urls: list[str],
     *,
+    config: RunConfig,
     enable_stealth: bool,
     stats_suffix: str,
     use_browser: bool,
 ) -> RunSummary:
     """
     Run a single batch with the requested stealth configuration.
+
+    The shared ``config`` is never mutated; a copy with the requested
+    stealth flag is derived so both runs start from identical settings.
     """
-    config = load_run_config()
-    if config.stealth_config is None:
-        config.stealth_config = StealthConfig()
-    config.stealth_config.enabled = enable_stealth
+    stealth = config.stealth_config or StealthConfig()
+    run_config = msgspec.structs.replace(
+        config,
+        stealth_config=msgspec.structs.replace(stealth, enabled=enable_stealth),
+    )
 
     summary = await run_batch(
         urls,
-        config=config,
+        config=run_config,
         max_urls=len(urls),
         use_browser=use_browser,
         stats_suffix=stats_suffix,
@@ -48,16 +51,6 @@ async def run_once(
     return summary
 
 
-def _load_stats(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        raise FileNotFoundError(f"Stats file not found: {path}")
-    return [
-        json.loads(line)
-        for line in path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
-
-
 def _format_pct(value: float) -> str:
     return f"{value * 100:.2f}%"
 
@@ -88,8 +81,8 @@ def compare_summaries(
             f"{_format_pct(ste):>12s} {_format_pct(delta):>12s}"
         )
 
-    base_success = int(baseline["total_urls"] * baseline["success_rate"])
-    ste_success = int(stealth["total_urls"] * stealth["success_rate"])
+    base_success = baseline["success_count"]
+    ste_success = stealth["success_count"]
     print(
         f"\nSuccessful URLs: baseline={base_success}, "
         f"stealth={ste_success}, delta={ste_success - base_success}"
@@ -118,16 +111,18 @@ async def main() -> None:
     )
     args = parser.parse_args()
 
-    urls = load_urls_from_csv(Path(args.urls_file))
-    if len(urls) < args.count:
+    subset = load_urls_from_csv(Path(args.urls_file), limit=args.count)
+    if len(subset) < args.count:
         raise RuntimeError(
-            f"Requested {args.count} URLs, but only {len(urls)} available."
+            f"Requested {args.count} URLs, but only {len(subset)} available."
         )
-    subset = urls[: args.count]
+
+    config = load_run_config()
 
     print(f"Running baseline (no stealth) for {args.count} URLs...")
     baseline_summary = await run_once(
         subset,
+        config=config,
         enable_stealth=False,
         stats_suffix="",
         use_browser=not args.no_browser,
@@ -136,18 +131,14 @@ async def main() -> None:
     print(f"Running stealth for {args.count} URLs...")
     stealth_summary = await run_once(
         subset,
+        config=config,
         enable_stealth=True,
         stats_suffix="_stealth",
         use_browser=not args.no_browser,
     )
 
-    baseline_stats_raw = _load_stats(DATA_DIR / "stats.jsonl")
-    stealth_stats_raw = _load_stats(DATA_DIR / "stats_stealth.jsonl")
-
-    # Recompute summaries to make sure we compare on-disk stats
-    baseline_summary = compute_run_summary([s for s in baseline_stats_raw])  # type: ignore[misc]
-    stealth_summary = compute_run_summary([s for s in stealth_stats_raw])  # type: ignore[misc]
-
+    # run_batch summarizes exactly the rows it writes to disk, so the
+    # returned summaries already reflect the on-disk stats.
     compare_summaries(baseline_summary, stealth_summary)
 
 
@@ -7,6 +7,7 @@ supporting both total URL count and success-based processing modes.
 """
 
 # ==== STANDARD LIBRARY IMPORTS ==== #
+import argparse
 import asyncio
 import random
 import sys
@@ -16,11 +17,17 @@ from pathlib import Path
 from tavily_scraper.config.env import load_run_config
 from tavily_scraper.core.models import RunSummary
 from tavily_scraper.pipelines.batch_runner import run_batch
-from tavily_scraper.utils.io import load_urls_from_csv
+from tavily_scraper.utils.event_loop import install_event_loop
+from tavily_scraper.utils.io import load_urls_from_csv, sample_urls_from_csv
+
+# ==== CONSTANTS ==== #
+
+_NUMPY_SHUFFLE_MIN = 100_000
+"""List size above which shuffling is delegated to numpy."""
 
 # ==== CORE PIPELINE ORCHESTRATION ==== #
 
-async def main() -> None:
+async def main(argv: list[str] | None = None) -> None:
     """
     Execute the scraping pipeline with configurable parameters.
 
@@ -31,52 +38,52 @@ async def main() -> None:
     4. Runs the batch pipeline
     5. Displays formatted results
 
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+
     Returns:
         None
 
     Raises:
-        SystemExit: If invalid arguments are provided
+        SystemExit: If invalid arguments are provided or the URL file
+            does not exist
     """
     # --► ARGUMENT PARSING
-    use_browser: bool = "--browser" in sys.argv
-    use_random: bool = "--random" in sys.argv
-    target_mode: bool = "--success" in sys.argv
-    stealth_enabled: bool = "--stealth" in sys.argv
-    
-    # Parse --urls
-    urls_file: Path = Path(".sdd/raw/urls.csv")
-    if "--urls" in sys.argv:
-        idx = sys.argv.index("--urls")
-        if idx + 1 < len(sys.argv):
-            urls_file = Path(sys.argv[idx + 1])
-    
-    # Parse --count
-    target: int | None = None
-    if "--count" in sys.argv:
-        idx = sys.argv.index("--count")
-        if idx + 1 < len(sys.argv):
-            target = int(sys.argv[idx + 1])
-    elif len(sys.argv) >= 2 and sys.argv[1].isdigit():
-        target = int(sys.argv[1])
-    
-    # Parse --stats-suffix
-    custom_suffix: str | None = None
-    if "--stats-suffix" in sys.argv:
-        idx = sys.argv.index("--stats-suffix")
-        if idx + 1 < len(sys.argv):
-            custom_suffix = sys.argv[idx + 1]
-    
-    if target is None and not urls_file.exists():
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
         print_usage()
         return
 
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    use_browser: bool = args.browser
+    use_random: bool = args.random
+    target_mode: bool = args.success
+    stealth_enabled: bool = args.stealth
+    urls_file: Path = args.urls
+    target: int | None = args.count if args.count is not None else args.count_pos
+    custom_suffix: str | None = args.stats_suffix
+
+    if not urls_file.exists():
+        parser.error(f"URL file not found: {urls_file}")
+
     # --► URL LOADING & PREPARATION
-    urls: list[str] = load_urls_from_csv(urls_file)
-    print(f"Loaded {len(urls)} URLs from {urls_file}")
+    urls: list[str]
 
-    if use_random:
-        random.shuffle(urls)
-        print("Shuffled URLs randomly")
+    if use_random and target and not target_mode:
+        # Streaming reservoir: O(target) memory instead of loading all N
+        urls, total = sample_urls_from_csv(urls_file, target)
+        print(f"Loaded {total} URLs from {urls_file}")
+        print(f"Sampled {len(urls)} URLs randomly")
+    else:
+        urls = load_urls_from_csv(urls_file)
+        print(f"Loaded {len(urls)} URLs from {urls_file}")
+
+        if use_random:
+            # Success mode needs the whole pool: final N is unknown
+            urls = _shuffle_urls(urls)
+            print("Shuffled URLs randomly")
 
     # --► MODE CONFIGURATION
     max_urls: int | None
@@ -122,7 +129,7 @@ async def main() -> None:
     )
 
     # --► RESULTS DISPLAY
-    stats_filename = f"stats{stats_suffix}.jsonl" if stats_suffix else "stats.jsonl"
+    stats_filename = f"stats{stats_suffix}.{config.stats_format}"
     summary_filename = (
         f"run_summary{stats_suffix}.json"
         if stats_suffix
@@ -133,6 +140,32 @@ async def main() -> None:
 
 
 
+def _shuffle_urls(urls: list[str]) -> list[str]:
+    """
+    Return URLs in uniformly random order.
+
+    Args:
+        urls: URLs to shuffle
+
+    Returns:
+        Shuffled list (the input list itself for small inputs)
+
+    Note:
+        Large lists are permuted via a numpy index permutation computed
+        in C, which avoids N Python-level swaps in random.shuffle.
+    """
+    if len(urls) <= _NUMPY_SHUFFLE_MIN:
+        random.shuffle(urls)
+        return urls
+
+    import numpy as np
+
+    order = np.random.default_rng().permutation(len(urls))
+    return [urls[i] for i in order.tolist()]
+
+
+
+
 # ==== RESULTS FORMATTING & DISPLAY ==== #
 
 def _display_results(
@@ -146,11 +179,11 @@ def _display_results(
     Args:
         summary: Dictionary containing execution metrics including:
             - total_urls: Total number of URLs processed
-            - success_rate: Fraction of successful fetches
-            - http_error_rate: Fraction of HTTP errors
-            - timeout_rate: Fraction of timeouts
-            - captcha_rate: Fraction of CAPTCHA detections
-            - robots_block_rate: Fraction of robots.txt blocks
+            - success_count: Number of successful fetches
+            - http_error_count: Number of HTTP errors
+            - timeout_count: Number of timeouts
+            - captcha_count: Number of CAPTCHA detections
+            - robots_count: Number of robots.txt blocks
             - httpx_share: Fraction using HTTP-only path
             - playwright_share: Fraction requiring browser
             - p50_latency_httpx_ms: HTTP P50 latency
@@ -161,80 +194,55 @@ def _display_results(
     Returns:
         None
     """
-    successful: int = int(summary["total_urls"] * summary["success_rate"])
-
-    print(f"\n{'=' * 60}")
-    print("RESULTS")
-    print(f"{'=' * 60}")
-    print(f"Total processed:     {summary['total_urls']}")
-    print(
-        f"Successful:          {successful} "
-        f"({summary['success_rate']:.1%})"
-    )
-    print(
-        f"HTTP errors:         "
-        f"{int(summary['total_urls'] * summary['http_error_rate'])} "
-        f"({summary['http_error_rate']:.1%})"
-    )
-    print(
-        f"Timeouts:            "
-        f"{int(summary['total_urls'] * summary['timeout_rate'])} "
-        f"({summary['timeout_rate']:.1%})"
-    )
-    print(
-        f"CAPTCHAs:            "
-        f"{int(summary['total_urls'] * summary['captcha_rate'])} "
-        f"({summary['captcha_rate']:.1%})"
-    )
-    print(
-        f"Robots blocked:      "
-        f"{int(summary['total_urls'] * summary['robots_block_rate'])} "
-        f"({summary['robots_block_rate']:.1%})"
-    )
-
-    print("\nMethod breakdown:")
-    print(f"  HTTP only:         {summary['httpx_share']:.1%}")
-    print(f"  Browser fallback:  {summary['playwright_share']:.1%}")
-
-    print("\nLatency (HTTP):")
-    print(f"  P50: {summary['p50_latency_httpx_ms']}ms")
-    print(f"  P95: {summary['p95_latency_httpx_ms']}ms")
+    total: int = summary["total_urls"]
+    inv_total: float = 1.0 / total if total else 0.0
+    buf: list[str] = []
+    w = buf.append
+
+    w(f"\n{'=' * 60}")
+    w("RESULTS")
+    w(f"{'=' * 60}")
+    w(f"Total processed:     {total}")
+
+    # Exact counts from the summary; each rate is derived once from them
+    for label, count in (
+        ("Successful:", summary["success_count"]),
+        ("HTTP errors:", summary["http_error_count"]),
+        ("Timeouts:", summary["timeout_count"]),
+        ("CAPTCHAs:", summary["captcha_count"]),
+        ("Robots blocked:", summary["robots_count"]),
+    ):
+        w(f"{label:<21}{count} ({count * inv_total:.1%})")
+
+    w("\nMethod breakdown:")
+    w(f"  HTTP only:         {summary['httpx_share']:.1%}")
+    w(f"  Browser fallback:  {summary['playwright_share']:.1%}")
+
+    w("\nLatency (HTTP):")
+    w(f"  P50: {summary['p50_latency_httpx_ms']}ms")
+    w(f"  P95: {summary['p95_latency_httpx_ms']}ms")
 
     if summary["playwright_share"] > 0:
-        print("\nLatency (Browser):")
-        print(f"  P50: {summary['p50_latency_playwright_ms']}ms")
-        print(f"  P95: {summary['p95_latency_playwright_ms']}ms")
+        w("\nLatency (Browser):")
+        w(f"  P50: {summary['p50_latency_playwright_ms']}ms")
+        w(f"  P95: {summary['p95_latency_playwright_ms']}ms")
 
-    print(f"\nStats saved to: data/{stats_filename}")
-    print(f"Summary saved to: data/{summary_filename}")
-    print(f"{'=' * 60}\n")
+    if summary.get("cache_hit_rate"):
+        w(f"\nHTTP cache hits:     {summary['cache_hit_rate']:.1%}")
 
+    w(f"\nStats saved to: data/{stats_filename}")
+    w(f"Summary saved to: data/{summary_filename}")
+    w(f"{'=' * 60}\n")
 
+    # Single write: one stdio lock/flush instead of one per line
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
-# ==== USAGE DOCUMENTATION ==== #
 
-def print_usage() -> None:
-    """
-    Display command-line usage information and examples.
 
-    Returns:
-        None
-    """
-    print(
-        """
-Usage:
-  python run_pipeline.py [--count N] [--urls FILE] [OPTIONS]
-
-Options:
-  --count N              Process N URLs total (or use positional: python run_pipeline.py 100)
-  --urls FILE            Use custom URLs file (default: .sdd/raw/urls.csv)
-  --success              Process until N successful URLs (requires --count)
-  --browser              Enable Playwright browser fallback
-  --random               Shuffle URLs randomly
-  --stealth              Enable stealth anti-detection
-  --stats-suffix SUFFIX  Custom suffix for stats files
+# ==== ARGUMENT PARSING & USAGE ==== #
 
+_EXAMPLES = """
 Examples:
   python run_pipeline.py 100                              # Process 100 URLs
   python run_pipeline.py --count 100 --stealth            # With stealth
@@ -242,7 +250,77 @@ Examples:
   python run_pipeline.py --urls failed.csv --stats-suffix _test  # Custom suffix
   python run_pipeline.py 50 --success --browser           # Until 50 successes
 """
+
+
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line parser for the pipeline.
+
+    Returns:
+        Configured ArgumentParser (legacy positional count included)
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the hybrid HTTP + Playwright scraping pipeline.",
+        epilog=_EXAMPLES,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "count_pos",
+        nargs="?",
+        type=int,
+        metavar="N",
+        help="Process N URLs total (same as --count N)",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        help="Process N URLs total",
+    )
+    parser.add_argument(
+        "--urls",
+        type=Path,
+        default=Path(".sdd/raw/urls.csv"),
+        help="Use custom URLs file (default: .sdd/raw/urls.csv)",
+    )
+    parser.add_argument(
+        "--success",
+        action="store_true",
+        help="Process until N successful URLs (requires --count)",
+    )
+    parser.add_argument(
+        "--browser",
+        action="store_true",
+        help="Enable Playwright browser fallback",
     )
+    parser.add_argument(
+        "--random",
+        action="store_true",
+        help="Shuffle URLs randomly",
+    )
+    parser.add_argument(
+        "--stealth",
+        action="store_true",
+        help="Enable stealth anti-detection",
+    )
+    parser.add_argument(
+        "--stats-suffix",
+        help="Custom suffix for stats files",
+    )
+    return parser
+
+
+
+
+def print_usage() -> None:
+    """
+    Display command-line usage information and examples.
+
+    Returns:
+        None
+    """
+    _build_parser().print_help()
 
 
 
@@ -250,7 +328,5 @@ Examples:
 # ==== SCRIPT ENTRY POINT ==== #
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2 or sys.argv[1] in ["-h", "--help"]:
-        print_usage()
-    else:
-        asyncio.run(main())
+    install_event_loop(load_run_config().event_loop)
+    asyncio.run(main())
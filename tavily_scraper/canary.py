@@ -8,9 +8,12 @@ import sys
 from pathlib import Path
 
 # Configure logging
-from typing import Literal
+from typing import Any, Literal
+
+from playwright.async_api import Browser
 
 from tavily_scraper.config.env import load_run_config
+from tavily_scraper.core.models import RunConfig
 from tavily_scraper.pipelines.browser_fetcher import (
     browser_lifecycle,
     create_page_with_blocking,
@@ -22,10 +25,16 @@ logger = logging.getLogger("canary")
 
 async def run_canary(
     headless: bool = True, 
-    mode: Literal["minimal", "moderate", "aggressive"] = "moderate"
+    mode: Literal["minimal", "moderate", "aggressive"] = "moderate",
+    browser: Browser | None = None,
 ) -> None:
     """
     Run a canary check against bot.sannysoft.com.
+
+    Pass an already-running ``browser`` when checking in a batch; only a
+    fresh context is opened and closed on it. Without one, a browser is
+    launched for this single check. A failed check raises, leaving the
+    caller (and the browser it owns) in control.
     """
     logger.info(f"Starting canary check (headless={headless}, mode={mode})...")
     
@@ -40,7 +49,7 @@ async def run_canary(
     # We don't need a full proxy manager for this simple check unless testing proxies
     proxy_manager = None # ProxyManager() if needed
 
-    results = {
+    results: dict[str, Any] = {
         "webdriver_hidden": False,
         "chrome_object": False,
         "permissions": False,
@@ -48,38 +57,60 @@ async def run_canary(
         "overall_score": 0
     }
 
-    async with browser_lifecycle(config, proxy_manager) as browser:
-        page = await create_page_with_blocking(browser, config)
+    if browser is not None:
+        await _check_page(browser, config, results)
+        return
+
+    async with browser_lifecycle(config, proxy_manager) as owned:
+        await _check_page(owned, config, results)
+
+
+
+
+async def _check_page(
+    browser: Browser,
+    config: RunConfig,
+    results: dict[str, Any],
+) -> None:
+    """
+    Open a fresh context on ``browser``, run the checks, then close it.
+    """
+    page = await create_page_with_blocking(browser, config)
+    
+    try:
+        await page.goto("https://bot.sannysoft.com/", wait_until="networkidle")
+        
+        # Take a screenshot for manual verification
+        screenshot_path = Path("canary_screenshot.png")
+        await page.screenshot(path=screenshot_path)
+        logger.info(f"Screenshot saved to {screenshot_path}")
+
+        # Extract metrics from the page
+        # Note: Sannysoft renders results in tables. We'll do some basic text extraction.
+        content = await page.content()
+        
+        # Check for specific success indicators
+        results["webdriver_hidden"] = "WebDriver (New)" not in content and "present (failed)" not in content
+        results["chrome_object"] = "window.chrome" in content and "missing" not in content
+        
+        # Evaluate specific JS properties
+        is_webdriver = await page.evaluate("navigator.webdriver")
+        results["webdriver_prop"] = is_webdriver # Should be false/undefined
         
-        try:
-            await page.goto("https://bot.sannysoft.com/", wait_until="networkidle")
-            
-            # Take a screenshot for manual verification
-            screenshot_path = Path("canary_screenshot.png")
-            await page.screenshot(path=screenshot_path)
-            logger.info(f"Screenshot saved to {screenshot_path}")
-
-            # Extract metrics from the page
-            # Note: Sannysoft renders results in tables. We'll do some basic text extraction.
-            content = await page.content()
-            
-            # Check for specific success indicators
-            results["webdriver_hidden"] = "WebDriver (New)" not in content and "present (failed)" not in content
-            results["chrome_object"] = "window.chrome" in content and "missing" not in content
-            
-            # Evaluate specific JS properties
-            is_webdriver = await page.evaluate("navigator.webdriver")
-            results["webdriver_prop"] = is_webdriver # Should be false/undefined
-            
-            plugins_len = await page.evaluate("navigator.plugins.length")
-            results["plugins_length"] = plugins_len
-            
-            logger.info("Canary check completed.")
-            print(json.dumps(results, indent=2))
-            
-        except Exception as e:
-            logger.error(f"Canary check failed: {e}")
-            sys.exit(1)
+        plugins_len = await page.evaluate("navigator.plugins.length")
+        results["plugins_length"] = plugins_len
+        
+        logger.info("Canary check completed.")
+        print(json.dumps(results, indent=2))
+        
+    except Exception as e:
+        logger.error(f"Canary check failed: {e}")
+        raise
+    finally:
+        await page.context.close()
+
+
+
 
 if __name__ == "__main__":
     import argparse
@@ -88,4 +119,7 @@ if __name__ == "__main__":
     parser.add_argument("--mode", default="moderate", choices=["minimal", "moderate", "aggressive"])
     args = parser.parse_args()
     
-    asyncio.run(run_canary(headless=not args.no_headless, mode=args.mode))
+    try:
+        asyncio.run(run_canary(headless=not args.no_headless, mode=args.mode))
+    except Exception:
+        sys.exit(1)
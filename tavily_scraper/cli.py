@@ -10,6 +10,7 @@ from pathlib import Path
 from tavily_scraper.config.env import load_run_config
 from tavily_scraper.pipelines.batch_runner import run_all
 from tavily_scraper.stealth.config import StealthConfig
+from tavily_scraper.utils.event_loop import install_event_loop
 from tavily_scraper.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -103,4 +104,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    install_event_loop(load_run_config().event_loop)
     asyncio.run(main())
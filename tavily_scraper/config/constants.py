@@ -3,12 +3,14 @@ Configuration constants and type aliases for the Tavily scraper.
 
 This module defines:
 - Type literals for method, stage, and status enumerations
+- Integer status codes for array-indexed tallies
 - Default configuration values for HTTP and browser operations
 - Resource limits and constraints
 """
 
 from __future__ import annotations
 
+from enum import IntEnum
 from typing import Literal
 
 # ==== TYPE DEFINITIONS ==== #
@@ -31,6 +33,35 @@ Processing stage indicator.
 """
 
 
+EventLoop = Literal["asyncio", "uvloop"]
+"""
+Event loop implementation used by the entry points.
+
+- 'asyncio': Stock selector-based asyncio loop
+- 'uvloop': libuv-backed loop (falls back to 'asyncio' when unavailable)
+"""
+
+
+NavWaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
+"""
+Playwright navigation milestone that page.goto() waits for.
+
+- 'commit': Response headers received
+- 'domcontentloaded': HTML parsed (then a bounded settle wait)
+- 'load': Load event fired, including subresources
+- 'networkidle': No network activity for 500 ms (slowest)
+"""
+
+
+StatsFormat = Literal["jsonl", "msgpack"]
+"""
+On-disk format for per-URL statistics.
+
+- 'jsonl': One JSON object per line (stats.jsonl)
+- 'msgpack': Length-prefixed MessagePack frames (stats.msgpack)
+"""
+
+
 Status = Literal[
     "success",
     "captcha_detected",
@@ -55,6 +86,54 @@ URL processing outcome status.
 """
 
 
+BlockType = Literal["none", "captcha", "rate_limit", "robots", "other"]
+"""
+Kind of block behind a failed fetch.
+
+- 'none': Not blocked
+- 'captcha': CAPTCHA or bot challenge
+- 'rate_limit': Throttled by the origin
+- 'robots': Disallowed by robots.txt
+- 'other': Any other block
+"""
+
+
+class StatusCode(IntEnum):
+    """
+    Integer code for each Status, used to index tally arrays.
+
+    Records and JSON output keep the Status string; aggregators map it
+    through STATUS_CODES once per row and count into ``[0] * len(StatusCode)``.
+    """
+
+    SUCCESS = 0
+    CAPTCHA = 1
+    ROBOTS = 2
+    HTTP_ERROR = 3
+    TIMEOUT = 4
+    INVALID = 5
+    TOO_LARGE = 6
+    OTHER = 7
+
+
+STATUS_NAMES: tuple[Status, ...] = (
+    "success",
+    "captcha_detected",
+    "robots_blocked",
+    "http_error",
+    "timeout",
+    "invalid_url",
+    "too_large",
+    "other_error",
+)
+"""Status string for each StatusCode, indexed by code."""
+
+STATUS_CODES: dict[str, StatusCode] = {
+    name: StatusCode(code) for code, name in enumerate(STATUS_NAMES)
+}
+"""StatusCode for each Status string (inverse of STATUS_NAMES)."""
+
+
 
 
 # ==== HTTP CLIENT DEFAULTS ==== #
@@ -63,7 +142,50 @@ DEFAULT_HTTPX_TIMEOUT_SECONDS: int = 10
 """Default timeout for HTTP requests in seconds."""
 
 DEFAULT_HTTPX_MAX_CONCURRENCY: int = 32
-"""Default maximum concurrent HTTP requests."""
+"""Default starting number of concurrent HTTP requests."""
+
+DEFAULT_HTTPX_MAX_CONN_PER_HOST: int = 4
+"""Default concurrent requests per host (DomainScheduler slot count)."""
+
+DEFAULT_CONCURRENCY_MIN: int = 4
+"""Lowest concurrency the adaptive (AIMD) gate may shrink to."""
+
+DEFAULT_CONCURRENCY_MAX: int = 128
+"""Highest concurrency the adaptive (AIMD) gate may grow to."""
+
+DEFAULT_LATENCY_TARGET_MS: int = 3_000
+"""Mean response latency above which the adaptive gate backs off."""
+
+DEFAULT_RATE_LIMIT_FLOOR: int = 2
+"""Remaining-request count at which a domain is paused until reset."""
+
+DEFAULT_DOMAIN_RPS: float = 0.0
+"""Per-domain token-bucket request rate (requests/second); 0 disables it."""
+
+
+
+
+# ==== RUNTIME DEFAULTS ==== #
+
+DEFAULT_EVENT_LOOP: EventLoop = "uvloop"
+"""Default event loop implementation (override with TAVILY_EVENT_LOOP)."""
+
+DEFAULT_STATS_FORMAT: StatsFormat = "jsonl"
+"""Default statistics file format (override with TAVILY_STATS_FORMAT)."""
+
+DEFAULT_NAV_WAIT_UNTIL: NavWaitUntil = "domcontentloaded"
+"""Default browser navigation milestone (override with TAVILY_NAV_WAIT_UNTIL)."""
+
+
+
+
+# ==== HTTP CACHE DEFAULTS ==== #
+
+DEFAULT_CACHE_TTL_SECONDS: int = 0
+"""Lifetime of cached HTTP responses; 0 disables the cache."""
+
+DEFAULT_CACHE_FILENAME: str = "http_cache.sqlite"
+"""SQLite cache file name, created under the data directory by default."""
 
 
 
@@ -81,6 +203,15 @@ DEFAULT_PLAYWRIGHT_MAX_CONCURRENCY: int = 2
 DEFAULT_SHARD_SIZE: int = 500
 """Default number of URLs per processing shard."""
 
+SHARD_MIN_SIZE: int = 50
+"""Smallest shard, whether configured or chosen adaptively."""
+
+SHARD_MAX_SIZE: int = 5_000
+"""Largest shard, whether configured or chosen adaptively."""
+
+DEFAULT_SHARD_BYTES_TARGET: int = 256 * 1024 * 1024
+"""Content bytes a shard should fetch; sizes later shards (0 = fixed size)."""
+
 
 
 
@@ -93,3 +224,6 @@ Maximum content size in bytes (5 MiB).
 Content exceeding this limit will be marked as 'too_large'
 to prevent memory exhaustion.
 """
+
+DEFAULT_STREAM_CHUNK_BYTES: int = 64 * 1024
+"""Chunk size for streamed HTTP body reads (64 KiB)."""
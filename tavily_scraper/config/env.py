@@ -10,15 +10,36 @@ This module provides:
 
 from __future__ import annotations
 
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import get_args
+
+import orjson
 
 from tavily_scraper.config.constants import (
+    DEFAULT_CACHE_FILENAME,
+    DEFAULT_CACHE_TTL_SECONDS,
+    DEFAULT_CONCURRENCY_MAX,
+    DEFAULT_CONCURRENCY_MIN,
+    DEFAULT_DOMAIN_RPS,
+    DEFAULT_EVENT_LOOP,
     DEFAULT_HTTPX_MAX_CONCURRENCY,
+    DEFAULT_HTTPX_MAX_CONN_PER_HOST,
     DEFAULT_HTTPX_TIMEOUT_SECONDS,
+    DEFAULT_LATENCY_TARGET_MS,
+    DEFAULT_NAV_WAIT_UNTIL,
     DEFAULT_PLAYWRIGHT_MAX_CONCURRENCY,
+    DEFAULT_RATE_LIMIT_FLOOR,
+    DEFAULT_SHARD_BYTES_TARGET,
     DEFAULT_SHARD_SIZE,
+    DEFAULT_STATS_FORMAT,
+    DEFAULT_STREAM_CHUNK_BYTES,
+    SHARD_MAX_SIZE,
+    SHARD_MIN_SIZE,
+    EventLoop,
+    NavWaitUntil,
+    StatsFormat,
 )
 from tavily_scraper.core.models import ProxyConfig, RunConfig
 from tavily_scraper.stealth.config import StealthConfig
@@ -39,12 +60,28 @@ def _env_int(name: str, default: int) -> int:
     Note:
         Raises ValueError if environment value cannot be parsed as int.
     """
-    value = os.getenv(name)
+    environ = os.environ
+    return int(environ[name]) if name in environ else default
+
+
+
+
+def _env_float(name: str, default: float) -> float:
+    """
+    Read float from environment variable with fallback.
 
-    if value is None:
-        return default
+    Args:
+        name: Environment variable name
+        default: Default value if variable not set
 
-    return int(value)
+    Returns:
+        Float value from environment or default
+
+    Note:
+        Raises ValueError if environment value cannot be parsed as float.
+    """
+    environ = os.environ
+    return float(environ[name]) if name in environ else default
 
 
 
@@ -85,11 +122,24 @@ def load_run_config() -> RunConfig:
         TAVILY_ENV: Execution environment (local/ci/colab)
         TAVILY_DATA_DIR: Data directory path
         HTTPX_TIMEOUT_SECONDS: HTTP request timeout (clamped 5-20)
-        HTTPX_MAX_CONCURRENCY: HTTP concurrency (clamped 1-128)
+        HTTPX_MAX_CONCURRENCY: Initial HTTP concurrency (clamped 1-128)
+        TAVILY_CONCURRENCY_MIN: Adaptive concurrency floor (clamped 1-128)
+        TAVILY_CONCURRENCY_MAX: Adaptive concurrency ceiling (clamped 1-512)
+        TAVILY_LATENCY_TARGET_MS: Adaptive latency target (clamped 100-60000)
+        HTTPX_MAX_KEEPALIVE: Idle pooled connections (default: concurrency max)
+        HTTPX_MAX_CONN_PER_HOST: Concurrent requests per host (default: 4)
+        TAVILY_RATE_LIMIT_FLOOR: Rate-limit budget floor (clamped 0-1000)
+        TAVILY_CACHE_TTL_SECONDS: HTTP cache lifetime, 0 = off (max 30 days)
+        TAVILY_CACHE_PATH: HTTP cache SQLite file (default: data/http_cache.sqlite)
+        TAVILY_STREAM_CHUNK_BYTES: HTTP body read chunk (clamped 4 KiB-4 MiB)
         PLAYWRIGHT_HEADLESS: Browser headless mode (true/false)
         PLAYWRIGHT_MAX_CONCURRENCY: Browser concurrency (clamped 1-4)
         SHARD_SIZE: URLs per shard (clamped 50-5000)
+        TAVILY_SHARD_BYTES_TARGET: Content bytes per shard, 0 = fixed size
+            (clamped 1 MiB-4 GiB)
         PROXY_CONFIG_PATH: Optional proxy config file path
+        TAVILY_EVENT_LOOP: Event loop implementation (uvloop/asyncio)
+        TAVILY_STATS_FORMAT: Stats file format (jsonl/msgpack)
 
     Returns:
         RunConfig with validated configuration values
@@ -119,6 +169,67 @@ def load_run_config() -> RunConfig:
     # Clamp to keep Colab and local environments safe
     httpx_max_concurrency = _clamp(httpx_max_concurrency_raw, 1, 128)
 
+    # --► ADAPTIVE CONCURRENCY BOUNDS
+    # HTTPX_MAX_CONCURRENCY is the starting point; AIMD moves within these
+    concurrency_min = _clamp(
+        _env_int("TAVILY_CONCURRENCY_MIN", DEFAULT_CONCURRENCY_MIN), 1, 128
+    )
+    concurrency_max = _clamp(
+        _env_int("TAVILY_CONCURRENCY_MAX", DEFAULT_CONCURRENCY_MAX),
+        concurrency_min,
+        512,
+    )
+    latency_target_ms = _clamp(
+        _env_int("TAVILY_LATENCY_TARGET_MS", DEFAULT_LATENCY_TARGET_MS),
+        100,
+        60_000,
+    )
+
+    # --► CONNECTION POOL SIZING
+    # Keep-alive defaults to the AIMD ceiling (httpx's own default is 20)
+    # so connections idle between rounds are reused, not re-dialled
+    httpx_max_keepalive = _clamp(
+        _env_int("HTTPX_MAX_KEEPALIVE", concurrency_max),
+        0,
+        concurrency_max * 2,
+    )
+    httpx_max_connections_per_host = _clamp(
+        _env_int("HTTPX_MAX_CONN_PER_HOST", DEFAULT_HTTPX_MAX_CONN_PER_HOST),
+        1,
+        concurrency_max,
+    )
+
+    # --► RATE-LIMIT HEADER THRESHOLD
+    rate_limit_floor = _clamp(
+        _env_int("TAVILY_RATE_LIMIT_FLOOR", DEFAULT_RATE_LIMIT_FLOOR), 0, 1_000
+    )
+
+    # --► PER-DOMAIN REQUEST RATE
+    domain_rps = min(
+        max(_env_float("TAVILY_DOMAIN_RPS", DEFAULT_DOMAIN_RPS), 0.0),
+        1_000.0,
+    )
+
+    # --► HTTP RESPONSE CACHE
+    cache_ttl_seconds = _clamp(
+        _env_int("TAVILY_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS),
+        0,
+        30 * 24 * 3600,
+    )
+    cache_path_env = os.getenv("TAVILY_CACHE_PATH")
+    cache_path = (
+        Path(cache_path_env).resolve()
+        if cache_path_env
+        else data_dir / DEFAULT_CACHE_FILENAME
+    )
+
+    # --► STREAMED BODY READS
+    stream_chunk_bytes = _clamp(
+        _env_int("TAVILY_STREAM_CHUNK_BYTES", DEFAULT_STREAM_CHUNK_BYTES),
+        4 * 1024,
+        4 * 1024 * 1024,
+    )
+
     # --► BROWSER CONCURRENCY CONFIGURATION
     playwright_max_concurrency_raw = _env_int(
         "PLAYWRIGHT_MAX_CONCURRENCY",
@@ -130,7 +241,14 @@ def load_run_config() -> RunConfig:
     # --► SHARD SIZE CONFIGURATION
     shard_size_raw = _env_int("SHARD_SIZE", DEFAULT_SHARD_SIZE)
     # Avoid pathological shard sizes while allowing tuning
-    shard_size = _clamp(shard_size_raw, 50, 5_000)
+    shard_size = _clamp(shard_size_raw, SHARD_MIN_SIZE, SHARD_MAX_SIZE)
+    shard_bytes_target = _env_int(
+        "TAVILY_SHARD_BYTES_TARGET", DEFAULT_SHARD_BYTES_TARGET
+    )
+    if shard_bytes_target > 0:
+        shard_bytes_target = _clamp(shard_bytes_target, 1 << 20, 4 << 30)
+    else:
+        shard_bytes_target = 0
 
     # --► PROXY CONFIGURATION
     proxy_config_path_env = os.getenv("PROXY_CONFIG_PATH")
@@ -138,6 +256,33 @@ def load_run_config() -> RunConfig:
         Path(proxy_config_path_env).resolve() if proxy_config_path_env else None
     )
 
+    # --► EVENT LOOP CONFIGURATION
+    event_loop_raw = os.getenv("TAVILY_EVENT_LOOP", DEFAULT_EVENT_LOOP).lower()
+    # Unknown values fall back to the stock loop so CI never breaks on typos
+    event_loop: EventLoop = (
+        event_loop_raw  # type: ignore[assignment]
+        if event_loop_raw in get_args(EventLoop)
+        else "asyncio"
+    )
+
+    # --► STATISTICS FORMAT
+    stats_format_raw = os.getenv("TAVILY_STATS_FORMAT", DEFAULT_STATS_FORMAT).lower()
+    stats_format: StatsFormat = (
+        stats_format_raw  # type: ignore[assignment]
+        if stats_format_raw in get_args(StatsFormat)
+        else DEFAULT_STATS_FORMAT
+    )
+
+    # --► BROWSER NAVIGATION
+    nav_wait_until_raw = os.getenv(
+        "TAVILY_NAV_WAIT_UNTIL", DEFAULT_NAV_WAIT_UNTIL
+    ).lower()
+    nav_wait_until: NavWaitUntil = (
+        nav_wait_until_raw  # type: ignore[assignment]
+        if nav_wait_until_raw in get_args(NavWaitUntil)
+        else DEFAULT_NAV_WAIT_UNTIL
+    )
+
     # --► CONSTRUCT RUNCONFIG
     return RunConfig(
         env=env,  # type: ignore[arg-type]
@@ -145,12 +290,26 @@ def load_run_config() -> RunConfig:
         data_dir=data_dir,
         httpx_timeout_seconds=httpx_timeout_seconds,
         httpx_max_concurrency=httpx_max_concurrency,
+        httpx_max_keepalive=httpx_max_keepalive,
+        httpx_max_connections_per_host=httpx_max_connections_per_host,
         playwright_headless=(
             os.getenv("PLAYWRIGHT_HEADLESS", "true").lower() == "true"
         ),
         playwright_max_concurrency=playwright_max_concurrency,
         shard_size=shard_size,
+        shard_bytes_target=shard_bytes_target,
         proxy_config_path=proxy_config_path,
+        event_loop=event_loop,
+        concurrency_min=concurrency_min,
+        concurrency_max=concurrency_max,
+        latency_target_ms=latency_target_ms,
+        rate_limit_floor=rate_limit_floor,
+        domain_rps=domain_rps,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_path=cache_path,
+        stream_chunk_bytes=stream_chunk_bytes,
+        stats_format=stats_format,
+        nav_wait_until=nav_wait_until,
         stealth_config=StealthConfig(
             enabled=False,  # Default to False, CLI can override
             mode="moderate",
@@ -186,13 +345,32 @@ def load_proxy_config_from_json(path: Path) -> ProxyConfig:
 
     Raises:
         FileNotFoundError: If path does not exist
-        json.JSONDecodeError: If file is not valid JSON
+        orjson.JSONDecodeError: If file is not valid JSON
         KeyError: If required fields are missing
 
     Note:
-        Username and password are optional fields.
+        Username and password are optional fields. Parsed configs are
+        memoized per (path, mtime), so reloading an unchanged file is a
+        stat() call; editing the file invalidates the entry.
+    """
+    return _read_proxy_file(str(path), path.stat().st_mtime_ns)
+
+
+
+
+@lru_cache(maxsize=8)
+def _read_proxy_file(path: str, mtime_ns: int) -> ProxyConfig:
+    """
+    Parse a proxy configuration file (cached by path and mtime).
+
+    Args:
+        path: Proxy configuration file path
+        mtime_ns: File modification time, used only as a cache key
+
+    Returns:
+        ProxyConfig with parsed proxy settings
     """
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = orjson.loads(Path(path).read_bytes())
     proxy = raw["proxy"]
 
     # Extract hostname (strip port if included)
@@ -10,25 +10,39 @@ This module provides:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from tavily_scraper.core.models import ProxyConfig
 
 # ==== PROXY MANAGER ==== #
 
-@dataclass
+@dataclass(frozen=True)
 class ProxyManager:
     """
     Manages proxy configuration for different HTTP clients.
 
     This manager handles the differences between proxy formats
-    required by httpx (URL string) and Playwright (dict).
+    required by httpx (URL string) and Playwright (dict). Both
+    formats are computed once at construction; the manager is
+    immutable, so they can never go stale.
 
     Attributes:
         config: Proxy configuration with host, ports, and credentials
+        _httpx_url: Precomputed httpx proxy URL
+        _playwright: Precomputed Playwright proxy settings
     """
 
     config: ProxyConfig
+    _httpx_url: str = field(init=False, repr=False, compare=False)
+    _playwright: dict[str, str] = field(init=False, repr=False, compare=False)
+
+
+
+
+    def __post_init__(self) -> None:
+        """Precompute client-specific proxy formats."""
+        object.__setattr__(self, "_httpx_url", self._format_httpx_proxy())
+        object.__setattr__(self, "_playwright", self._format_playwright_proxy())
 
 
 
@@ -68,6 +82,34 @@ class ProxyManager:
         """
         Get proxy URL for httpx client.
 
+        Returns:
+            Precomputed SOCKS5 proxy URL (see _format_httpx_proxy)
+        """
+        return self._httpx_url
+
+
+
+
+    def playwright_proxy(self) -> dict[str, str]:
+        """
+        Get proxy configuration dict for Playwright.
+
+        Returns:
+            Precomputed proxy settings (see _format_playwright_proxy)
+
+        Note:
+            The same dict is returned on every call; treat it as
+            read-only.
+        """
+        return self._playwright
+
+
+
+
+    def _format_httpx_proxy(self) -> str:
+        """
+        Format proxy URL for httpx client.
+
         Uses SOCKS5 protocol which provides better compatibility
         and performance for HTTP/HTTPS traffic.
 
@@ -95,9 +137,9 @@ class ProxyManager:
 
 
 
-    def playwright_proxy(self) -> dict[str, str]:
+    def _format_playwright_proxy(self) -> dict[str, str]:
         """
-        Get proxy configuration dict for Playwright.
+        Format proxy configuration dict for Playwright.
 
         Uses HTTP protocol because Playwright's SOCKS5 support
         doesn't handle authentication reliably.
@@ -0,0 +1,253 @@
+"""
+Adaptive (AIMD) concurrency control for the fetch pipeline.
+
+This module implements a resizable concurrency gate with:
+- Additive increase while responses stay under a latency target
+- Multiplicative decrease on timeouts, resets, 429s and 5xx responses
+- At most one decrease per epoch (one limit's worth of responses)
+- Floor/ceiling bounds taken from RunConfig
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tavily_scraper.core.models import RunConfig
+
+
+
+
+# ==== TUNING CONSTANTS ==== #
+
+_MIN_WINDOW_SAMPLES: int = 8
+"""Latency samples required before the window mean is trusted."""
+
+
+
+
+# ==== AIMD CONCURRENCY GATE ==== #
+
+class AdaptiveConcurrency:
+    """
+    Concurrency gate whose permit ceiling adapts to observed load.
+
+    The gate behaves like an asyncio.Semaphore whose size moves between
+    ``minimum`` and ``maximum``. Each completed request reports its
+    latency (or a congestion signal) through record():
+
+    - Healthy response and window mean <= target: limit += increase / limit
+      (roughly +increase per round of ``limit`` responses)
+    - Congestion or window mean > target: limit *= decrease, at most once
+      per epoch so a burst of failures from one round counts once
+
+    Attributes:
+        _limit: Current (fractional) permit ceiling
+        _minimum: Lowest permitted ceiling
+        _maximum: Highest permitted ceiling
+        _latency_target_ms: Window mean latency considered healthy
+        _increase: Additive increase step (alpha)
+        _decrease: Multiplicative decrease factor (beta)
+        _window: Recent healthy latencies in milliseconds
+        _window_sum: Running sum of _window
+        _in_flight: Permits currently held
+        _since_decrease: Responses recorded since the last decrease
+        _waiters: Futures of tasks blocked in acquire()
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        minimum: int,
+        maximum: int,
+        latency_target_ms: int,
+        window: int = 64,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+    ) -> None:
+        """
+        Initialize gate with starting limit and AIMD parameters.
+
+        Args:
+            initial: Starting permit ceiling (clamped into [minimum, maximum])
+            minimum: Lowest ceiling the gate will shrink to
+            maximum: Highest ceiling the gate will grow to
+            latency_target_ms: Window mean latency considered healthy
+            window: Number of recent latencies averaged (default: 64)
+            increase: Additive increase step alpha (default: 0.5)
+            decrease: Multiplicative decrease factor beta (default: 0.5)
+
+        Note:
+            Passing minimum == maximum yields a fixed-size gate.
+        """
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._limit = float(max(self._minimum, min(self._maximum, initial)))
+        self._latency_target_ms = latency_target_ms
+        self._increase = increase
+        self._decrease = decrease
+        self._window: deque[int] = deque(maxlen=window)
+        self._window_sum = 0
+        self._in_flight = 0
+        self._since_decrease = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+
+
+
+    @classmethod
+    def from_config(cls, config: RunConfig) -> AdaptiveConcurrency:
+        """
+        Build gate from runtime configuration.
+
+        Args:
+            config: Runtime configuration
+
+        Returns:
+            Gate starting at httpx_max_concurrency within configured bounds
+        """
+        return cls(
+            config.httpx_max_concurrency,
+            minimum=config.concurrency_min,
+            maximum=config.concurrency_max,
+            latency_target_ms=config.latency_target_ms,
+        )
+
+
+
+
+    @property
+    def limit(self) -> int:
+        """Current integer permit ceiling."""
+        return int(self._limit)
+
+
+
+
+    @property
+    def in_flight(self) -> int:
+        """Number of permits currently held."""
+        return self._in_flight
+
+
+
+
+    # --► PERMIT MANAGEMENT
+
+    async def acquire(self) -> None:
+        """
+        Wait for a permit under the current ceiling.
+
+        Returns:
+            None
+
+        Note:
+            Always pair with release() in a try/finally, or use
+            ``async with gate:``.
+        """
+        while self._in_flight >= self.limit:
+            fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            try:
+                await fut
+            except asyncio.CancelledError:
+                if not fut.cancelled():
+                    # Woken but cancelled before running: pass the wakeup on
+                    self._wake()
+                elif fut in self._waiters:
+                    self._waiters.remove(fut)
+                raise
+
+        self._in_flight += 1
+
+
+
+
+    def release(self) -> None:
+        """
+        Return a permit and wake waiters that now fit under the ceiling.
+
+        Returns:
+            None
+        """
+        self._in_flight -= 1
+        self._wake()
+
+
+
+
+    def _wake(self) -> None:
+        """Wake as many waiters as there are free permits."""
+        free = self.limit - self._in_flight
+
+        while free > 0 and self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                free -= 1
+
+
+
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+
+
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+
+
+    # --► FEEDBACK
+
+    def record(self, latency_ms: int | None, *, congested: bool = False) -> None:
+        """
+        Feed one response outcome into the AIMD controller.
+
+        Args:
+            latency_ms: Observed request latency (None if unknown)
+            congested: True for timeouts, resets, 429 and 5xx responses
+
+        Returns:
+            None
+        """
+        self._since_decrease += 1
+
+        if not congested and latency_ms is not None:
+            if len(self._window) == self._window.maxlen:
+                self._window_sum -= self._window[0]
+            self._window.append(latency_ms)
+            self._window_sum += latency_ms
+
+            samples = len(self._window)
+            congested = (
+                samples >= _MIN_WINDOW_SAMPLES
+                and self._window_sum > self._latency_target_ms * samples
+            )
+
+        if congested:
+            # One multiplicative cut per epoch of `limit` responses
+            if self._since_decrease >= self.limit:
+                self._limit = max(float(self._minimum), self._limit * self._decrease)
+                self._since_decrease = 0
+                self._window.clear()
+                self._window_sum = 0
+            return
+
+        self._limit = min(
+            float(self._maximum),
+            self._limit + self._increase / self._limit,
+        )
+        self._wake()
@@ -7,10 +7,12 @@ This module defines:
 - Summary and checkpoint types (RunSummary, ShardCheckpoint)
 - Shared runtime context (RunnerContext)
 - Utility functions for model creation and conversion
+- Schema-bound JSON encoding and decoding of UrlStats
 """
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -18,13 +20,23 @@ from typing import TYPE_CHECKING, Any, Literal, NewType, TypedDict
 
 import msgspec
 
-from tavily_scraper.config.constants import Method, Stage, Status
+from tavily_scraper.config.constants import (
+    DEFAULT_CONCURRENCY_MAX,
+    BlockType,
+    EventLoop,
+    Method,
+    NavWaitUntil,
+    Stage,
+    StatsFormat,
+    Status,
+)
 from tavily_scraper.stealth.config import StealthConfig
 
 if TYPE_CHECKING:
     import httpx
 
     from tavily_scraper.config.proxies import ProxyManager
+    from tavily_scraper.core.concurrency import AdaptiveConcurrency
     from tavily_scraper.core.robots import RobotsClient
     from tavily_scraper.core.scheduler import DomainScheduler
 
@@ -34,7 +46,11 @@ if TYPE_CHECKING:
 # ==== TYPE ALIASES ==== #
 
 UrlStr = NewType("UrlStr", str)
-"""Type alias for URL strings with semantic meaning."""
+"""
+Type alias for URL strings with semantic meaning.
+
+A NewType is a plain str at runtime, so values never need a str() wrap.
+"""
 
 
 
@@ -50,11 +66,28 @@ class RunConfig(msgspec.Struct, omit_defaults=True):
         urls_path: Path to input URLs file
         data_dir: Directory for output data
         httpx_timeout_seconds: HTTP request timeout
-        httpx_max_concurrency: Maximum concurrent HTTP requests
+        httpx_max_concurrency: Initial concurrent HTTP requests
+        httpx_max_keepalive: Idle connections kept open in the httpx pool
+        httpx_max_connections_per_host: Concurrent requests per host
         playwright_headless: Run browser in headless mode
         playwright_max_concurrency: Maximum concurrent browser instances
-        shard_size: Number of URLs per processing shard
+        shard_size: Number of URLs per processing shard (first shard
+            when shard_bytes_target is set)
+        shard_bytes_target: Content bytes per shard used to size later
+            shards (0 keeps every shard at shard_size)
         proxy_config_path: Optional path to proxy configuration file
+        event_loop: Event loop implementation for the entry points
+        concurrency_min: Floor for adaptive concurrency
+        concurrency_max: Ceiling for adaptive concurrency
+        latency_target_ms: Mean latency target for adaptive concurrency
+        rate_limit_floor: Remaining-request budget that triggers a pause
+        domain_rps: Per-domain request rate cap in requests/second
+            (0 disables the token bucket)
+        cache_ttl_seconds: HTTP response cache lifetime (0 disables caching)
+        cache_path: SQLite file backing the HTTP response cache
+        stream_chunk_bytes: Chunk size for streamed HTTP body reads
+        stats_format: On-disk format for per-URL statistics
+        nav_wait_until: Navigation milestone browser fetches wait for
     """
 
     env: Literal["local", "ci", "colab"] = "local"
@@ -62,12 +95,26 @@ class RunConfig(msgspec.Struct, omit_defaults=True):
     data_dir: Path = Path("data")
     httpx_timeout_seconds: int = 10
     httpx_max_concurrency: int = 32
+    httpx_max_keepalive: int = 128
+    httpx_max_connections_per_host: int = 4
     playwright_headless: bool = True
     playwright_max_concurrency: int = 2
     shard_size: int = 500
+    shard_bytes_target: int = 268_435_456
     proxy_config_path: Path | None = None
     stealth_config: StealthConfig | None = None
     session_id: str | None = None
+    event_loop: EventLoop = "uvloop"
+    concurrency_min: int = 4
+    concurrency_max: int = 128
+    latency_target_ms: int = 3_000
+    rate_limit_floor: int = 2
+    domain_rps: float = 0.0
+    cache_ttl_seconds: int = 0
+    cache_path: Path | None = None
+    stream_chunk_bytes: int = 65_536
+    stats_format: StatsFormat = "jsonl"
+    nav_wait_until: NavWaitUntil = "domcontentloaded"
 
 
 
@@ -110,10 +157,13 @@ class ProxyConfig(msgspec.Struct, omit_defaults=True):
 
 # ==== JOB & RESULT MODELS ==== #
 
-class UrlJob(TypedDict):
+class UrlJob(msgspec.Struct, kw_only=True, gc=False, array_like=True):
     """
     URL processing job specification.
 
+    Encodes as a positional array (no field names), so jobs handed
+    to other processes or queues serialize to a few bytes each.
+
     Attributes:
         url: Target URL to fetch
         is_dynamic_hint: Optional hint that URL requires JavaScript
@@ -122,14 +172,14 @@ class UrlJob(TypedDict):
     """
 
     url: UrlStr
-    is_dynamic_hint: bool | None
-    shard_id: int
-    index_in_shard: int
+    is_dynamic_hint: bool | None = None
+    shard_id: int = -1
+    index_in_shard: int = 0
 
 
 
 
-class FetchResult(TypedDict, total=False):
+class FetchResult(msgspec.Struct, kw_only=True, gc=False):
     """
     In-memory fetch result with full content.
 
@@ -154,32 +204,42 @@ class FetchResult(TypedDict, total=False):
         started_at: ISO timestamp when fetch started
         finished_at: ISO timestamp when fetch completed
         shard_id: Shard identifier
+        block_type: Type of blocking encountered
+        block_vendor: Vendor of blocking mechanism (e.g., Cloudflare)
+        from_cache: Whether the response was served from the HTTP cache
         content: Full HTML content (in-memory only, never persisted)
+
+    Note:
+        gc=False is safe because every field is a scalar or string, so
+        instances can never take part in a reference cycle.
     """
 
     url: UrlStr
-    domain: str
-    method: Method
-    stage: Stage
-    status: Status
-    http_status: int | None
-    latency_ms: int | None
-    content_len: int
-    encoding: str | None
-    retries: int
-    captcha_detected: bool
-    robots_disallowed: bool
-    error_kind: str | None
-    error_message: str | None
-    started_at: str
-    finished_at: str
-    shard_id: int
-    content: str | None
-
-
-
-
-class UrlStats(TypedDict):
+    domain: str = ""
+    method: Method = "httpx"
+    stage: Stage = "primary"
+    status: Status = "other_error"
+    http_status: int | None = None
+    latency_ms: int | None = None
+    content_len: int = 0
+    encoding: str | None = None
+    retries: int = 0
+    captcha_detected: bool = False
+    robots_disallowed: bool = False
+    error_kind: str | None = None
+    error_message: str | None = None
+    started_at: str = ""
+    finished_at: str = ""
+    shard_id: int = -1
+    block_type: BlockType | None = "none"
+    block_vendor: str | None = None
+    from_cache: bool = False
+    content: str | None = None
+
+
+
+
+class UrlStats(msgspec.Struct, kw_only=True, gc=False):
     """
     Per-URL statistics for persistence.
 
@@ -205,6 +265,11 @@ class UrlStats(TypedDict):
         shard_id: Shard identifier
         block_type: Type of blocking encountered
         block_vendor: Vendor of blocking mechanism (e.g., Cloudflare)
+        from_cache: Whether the response was served from the HTTP cache
+
+    Note:
+        Every field is always encoded, so stats.jsonl keeps a fixed
+        schema. Defaults exist only so older files still decode.
     """
 
     url: str
@@ -212,19 +277,20 @@ class UrlStats(TypedDict):
     method: Method
     stage: Stage
     status: Status
-    http_status: int | None
-    latency_ms: int | None
-    content_len: int
-    encoding: str | None
-    retries: int
-    captcha_detected: bool
-    robots_disallowed: bool
-    error_kind: str | None
-    error_message: str | None
-    timestamp: str
-    shard_id: int
-    block_type: Literal["none", "captcha", "rate_limit", "robots", "other"] | None
-    block_vendor: str | None
+    http_status: int | None = None
+    latency_ms: int | None = None
+    content_len: int = 0
+    encoding: str | None = None
+    retries: int = 0
+    captcha_detected: bool = False
+    robots_disallowed: bool = False
+    error_kind: str | None = None
+    error_message: str | None = None
+    timestamp: str = ""
+    shard_id: int = -1
+    block_type: BlockType | None = None
+    block_vendor: str | None = None
+    from_cache: bool = False
 
 
 
@@ -240,6 +306,11 @@ class RunSummary(TypedDict):
     Attributes:
         total_urls: Total number of URLs processed
         stats_rows: Number of statistics rows generated
+        success_count: Number of successful fetches
+        http_error_count: Number of HTTP errors
+        timeout_count: Number of timeouts
+        captcha_count: Number of CAPTCHA detections
+        robots_count: Number of robots.txt blocks
         success_rate: Fraction of successful fetches
         http_error_rate: Fraction of HTTP errors
         timeout_rate: Fraction of timeouts
@@ -253,10 +324,16 @@ class RunSummary(TypedDict):
         p95_latency_playwright_ms: Browser P95 latency
         avg_content_len_httpx: Average HTTP content size
         avg_content_len_playwright: Average browser content size
+        cache_hit_rate: Fraction of responses served from the HTTP cache
     """
 
     total_urls: int
     stats_rows: int
+    success_count: int
+    http_error_count: int
+    timeout_count: int
+    captcha_count: int
+    robots_count: int
     success_rate: float
     stealth_stats: dict[str, Any] | None
     http_error_rate: float
@@ -271,6 +348,7 @@ class RunSummary(TypedDict):
     p95_latency_playwright_ms: int | None
     avg_content_len_httpx: int | None
     avg_content_len_playwright: int | None
+    cache_hit_rate: float
 
 
 
@@ -302,17 +380,20 @@ class ShardCheckpoint(TypedDict):
 
 # ==== RUNTIME CONTEXT ==== #
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunnerContext:
     """
     Shared context for scraping pipeline execution.
 
-    This dataclass holds all shared resources needed by fetchers:
+    This slotted, frozen dataclass holds all shared resources needed
+    by fetchers (read on every URL, so attribute access skips the
+    instance __dict__ and hot loops can cache fields in locals):
     - Configuration
     - Proxy manager
     - Domain scheduler
     - Robots.txt client
     - HTTP client
+    - Adaptive concurrency gate
 
     Attributes:
         run_config: Runtime configuration
@@ -320,6 +401,7 @@ class RunnerContext:
         scheduler: Domain-aware rate limiter
         robots_client: Robots.txt compliance checker
         http_client: Shared async HTTP client
+        concurrency: Optional AIMD gate fed by the HTTP fetcher
     """
 
     run_config: RunConfig
@@ -327,23 +409,52 @@ class RunnerContext:
     scheduler: DomainScheduler
     robots_client: RobotsClient
     http_client: httpx.AsyncClient
+    concurrency: AdaptiveConcurrency | None = None
 
 
 
 
 # ==== UTILITY FUNCTIONS ==== #
 
+_iso_tick: int = -1
+"""Millisecond tick of the cached timestamp string."""
+
+_iso_cached: str = ""
+"""ISO 8601 string for _iso_tick."""
+
+_FETCH_RESULT_POOL_MAX: int = 2 * DEFAULT_CONCURRENCY_MAX
+"""Upper bound on recycled FetchResult instances kept for reuse."""
+
+_fetch_result_pool: list[FetchResult] = []
+"""Free list of released FetchResult instances."""
+
+
+
+
 def _utc_now_iso() -> str:
     """
     Get current UTC time as ISO 8601 string.
 
     Returns:
-        ISO 8601 formatted timestamp string
+        ISO 8601 formatted timestamp string (millisecond precision)
 
     Example:
-        '2025-11-15T10:30:45.123456+00:00'
+        '2025-11-15T10:30:45.123+00:00'
+
+    Note:
+        The string is formatted once per wall-clock millisecond and
+        reused for every call in that tick, so hot paths creating
+        many results skip the datetime allocation and formatting.
     """
-    return datetime.now(UTC).isoformat()
+    global _iso_tick, _iso_cached
+
+    tick = time.time_ns() // 1_000_000
+    if tick != _iso_tick:
+        _iso_cached = datetime.fromtimestamp(tick / 1000, UTC).isoformat(
+            timespec="milliseconds"
+        )
+        _iso_tick = tick
+    return _iso_cached
 
 
 
@@ -370,30 +481,67 @@ def make_initial_fetch_result(
 
     Note:
         Status is initially set to 'other_error' and should be
-        updated to reflect actual outcome.
+        updated to reflect actual outcome. Instances handed back via
+        release_fetch_result() are reused, with every field reset.
     """
     started_at = _utc_now_iso()
 
-    return FetchResult(
-        url=url_job["url"],
-        domain="",
-        method=method,
-        stage=stage,
-        status="other_error",
-        http_status=None,
-        latency_ms=None,
-        content_len=0,
-        encoding=None,
-        retries=0,
-        captcha_detected=False,
-        robots_disallowed=False,
-        error_kind=None,
-        error_message=None,
-        started_at=started_at,
-        finished_at=started_at,
-        shard_id=url_job["shard_id"],
-        content=None,
-    )
+    if not _fetch_result_pool:
+        return FetchResult(
+            url=url_job.url,
+            method=method,
+            stage=stage,
+            started_at=started_at,
+            finished_at=started_at,
+            shard_id=url_job.shard_id,
+        )
+
+    result = _fetch_result_pool.pop()
+    result.url = url_job.url
+    result.domain = ""
+    result.method = method
+    result.stage = stage
+    result.status = "other_error"
+    result.http_status = None
+    result.latency_ms = None
+    result.content_len = 0
+    result.encoding = None
+    result.retries = 0
+    result.captcha_detected = False
+    result.robots_disallowed = False
+    result.error_kind = None
+    result.error_message = None
+    result.started_at = started_at
+    result.finished_at = started_at
+    result.shard_id = url_job.shard_id
+    result.block_type = "none"
+    result.block_vendor = None
+    result.from_cache = False
+    result.content = None
+    return result
+
+
+
+
+def release_fetch_result(result: FetchResult) -> None:
+    """
+    Return a FetchResult to the free list for reuse.
+
+    Args:
+        result: Result the caller no longer references
+
+    Returns:
+        None
+
+    Note:
+        Only release a result once it has been converted (e.g. by
+        fetch_result_to_url_stats) and no other reference to it is
+        kept. Content is dropped immediately so the page body can be
+        freed; the pool is bounded by _FETCH_RESULT_POOL_MAX.
+    """
+    result.content = None
+    if len(_fetch_result_pool) < _FETCH_RESULT_POOL_MAX:
+        _fetch_result_pool.append(result)
 
 
 
@@ -417,22 +565,67 @@ def fetch_result_to_url_stats(result: FetchResult) -> UrlStats:
         Full content can be persisted separately if needed.
     """
     return UrlStats(
-        url=str(result["url"]),
-        domain=result["domain"],
-        method=result["method"],
-        stage=result["stage"],
-        status=result["status"],
-        http_status=result.get("http_status"),
-        latency_ms=result.get("latency_ms"),
-        content_len=result.get("content_len", 0),
-        encoding=result.get("encoding"),
-        retries=result.get("retries", 0),
-        captcha_detected=result.get("captcha_detected", False),
-        robots_disallowed=result.get("robots_disallowed", False),
-        error_kind=result.get("error_kind"),
-        error_message=result.get("error_message"),
-        timestamp=result.get("finished_at", _utc_now_iso()),
-        shard_id=result.get("shard_id", -1),
-        block_type=result.get("block_type", "none"),  # type: ignore[typeddict-item]
-        block_vendor=result.get("block_vendor"),  # type: ignore[typeddict-item]
+        url=result.url,
+        domain=result.domain,
+        method=result.method,
+        stage=result.stage,
+        status=result.status,
+        http_status=result.http_status,
+        latency_ms=result.latency_ms,
+        content_len=result.content_len,
+        encoding=result.encoding,
+        retries=result.retries,
+        captcha_detected=result.captcha_detected,
+        robots_disallowed=result.robots_disallowed,
+        error_kind=result.error_kind,
+        error_message=result.error_message,
+        timestamp=result.finished_at or _utc_now_iso(),
+        shard_id=result.shard_id,
+        block_type=result.block_type,
+        block_vendor=result.block_vendor,
+        from_cache=result.from_cache,
     )
+
+
+
+
+# ==== STATS SERIALIZATION ==== #
+
+URL_STATS_ENCODER = msgspec.json.Encoder()
+"""Shared JSON encoder for UrlStats (reused to avoid per-call setup)."""
+
+_URL_STATS_DECODER = msgspec.json.Decoder(UrlStats)
+"""Typed JSON decoder that builds UrlStats directly, skipping dicts."""
+
+
+
+
+def encode_url_stats(stats: UrlStats) -> bytes:
+    """
+    Encode one UrlStats record as JSON.
+
+    Args:
+        stats: Record to encode
+
+    Returns:
+        UTF-8 JSON bytes (no trailing newline)
+    """
+    return URL_STATS_ENCODER.encode(stats)
+
+
+
+
+def decode_url_stats(data: bytes | bytearray | memoryview | str) -> UrlStats:
+    """
+    Decode one JSON document into a validated UrlStats record.
+
+    Args:
+        data: JSON text or bytes for a single record
+
+    Returns:
+        Decoded UrlStats
+
+    Raises:
+        msgspec.ValidationError: If fields are missing or mistyped
+    """
+    return _URL_STATS_DECODER.decode(data)
@@ -3,19 +3,25 @@ Robots.txt compliance checking with caching.
 
 This module implements:
 - Async robots.txt fetching and parsing
-- Per-domain caching to avoid repeated fetches
+- Bounded LRU per-domain caching to avoid repeated fetches
 - Graceful fallback when robots.txt is unavailable
 - Proxy support for robots.txt requests
-- Thread-safe access with async locks
+- Single-flight fetches: concurrent misses for a domain share one
+  in-flight task, while different domains fetch in parallel
 """
 
 from __future__ import annotations
 
 import asyncio
-from urllib.parse import urlparse
-from urllib.robotparser import RobotFileParser
+import math
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urlsplit
 
 import httpx
+from protego import Protego
 
 from tavily_scraper.config.proxies import ProxyManager
 from tavily_scraper.core.models import ProxyConfig, RunConfig
@@ -23,20 +29,112 @@ from tavily_scraper.utils.logging import get_logger
 
 # ==== ROBOTS.TXT CLIENT ==== #
 
+DEFAULT_ROBOTS_CACHE_SIZE: int = 10_000
+"""Parsed robots.txt files kept before least-recently-used eviction."""
+
+ROBOTS_TTL_SECONDS: float = 86_400.0
+"""Lifetime of a successfully fetched robots.txt (RFC 9309 suggests <= 24h)."""
+
+ROBOTS_RETRY_SECONDS: float = 300.0
+"""Lifetime of an allow-all entry after a 5xx, timeout or network error."""
+
+_ROBOTS_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+"""Connection pool bounds for a standalone robots.txt client."""
+
+_FetchOutcome = tuple["Protego | None", float]
+"""Parser (None = allow all) and how long to cache it, in seconds."""
+
+_DEFAULT_PORTS: dict[str, int] = {"http": 80, "https": 443}
+"""Ports dropped from cache keys because they are implied by the scheme."""
+
+_DISALLOW_LINE_RE = re.compile(r"^\s*di\w*\s*:", re.IGNORECASE | re.MULTILINE)
+"""Any Disallow directive, including the misspellings protego accepts."""
+
+_SCHEME_NETLOC_RE = re.compile(r"([A-Za-z][A-Za-z0-9+\-.]*)://([^/?#]*)")
+"""Leading scheme and authority of an absolute URL."""
+
+
+
+
+def _scheme_netloc(url: str) -> tuple[str, str]:
+    """
+    Extract scheme and netloc without building a full SplitResult.
+
+    Args:
+        url: Absolute target URL
+
+    Returns:
+        (scheme, netloc), or ("", "") if url is not absolute
+    """
+    m = _SCHEME_NETLOC_RE.match(url)
+    return (m[1], m[2]) if m else ("", "")
+
+
+
+
+@lru_cache(maxsize=65_536)
+def _cache_key(scheme: str, netloc: str) -> str:
+    """
+    Build the robots.txt cache key for a URL's scheme and netloc.
+
+    Args:
+        scheme: URL scheme
+        netloc: URL authority (host, optional userinfo and port)
+
+    Returns:
+        "scheme://host[:port]" with the host lower-cased, a leading
+        "www." removed and the scheme's default port dropped
+
+    Example:
+        ('https', 'WWW.Example.com:443') -> 'https://example.com'
+
+    Note:
+        Only the "www." alias is folded. Other subdomains keep their
+        own entry because RFC 9309 scopes robots.txt to one authority;
+        IP literals are never folded. Memoized because most URLs in a
+        crawl share a few hosts.
+    """
+    parts = urlsplit(f"{scheme}://{netloc}")
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ""
+
+    if host.startswith("www."):
+        host = host[4:]
+    elif ":" in host:
+        # IPv6 literal: restore the brackets urlsplit() strips
+        host = f"[{host}]"
+
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+
+    if port is None or port == _DEFAULT_PORTS.get(scheme):
+        return f"{scheme}://{host}"
+    return f"{scheme}://{host}:{port}"
+
+
+
+
 class RobotsClient:
     """
     Async robots.txt client with per-domain caching.
 
     This client:
     - Fetches robots.txt files asynchronously
-    - Caches parsed rules per domain
-    - Uses thread-safe locking for cache access
+    - Caches parsed rules per domain in a bounded LRU
+    - Coalesces concurrent misses for a domain onto one in-flight
+      fetch, so one slow robots.txt never blocks other domains
     - Falls back to "allow" if robots.txt unavailable
 
     Attributes:
         _client: Async HTTP client for fetching robots.txt
-        _parsers: Cache of parsed robots.txt per domain
-        _lock: Async lock for thread-safe cache access
+        _owns_client: Whether aclose() closes _client
+        _parsers: LRU cache of (parser, expiry) per domain; parser is
+            None when the domain allows everything, expiry is a
+            time.monotonic() deadline
+        _max_domains: Maximum number of cached domains
+        _inflight: Shared fetch tasks for domains not yet cached
         _user_agent: Default User-Agent for robots.txt checks
         _logger: Logger instance
     """
@@ -45,6 +143,9 @@ class RobotsClient:
         self,
         client: httpx.AsyncClient,
         user_agent: str = "TavilyScraper",
+        max_domains: int = DEFAULT_ROBOTS_CACHE_SIZE,
+        *,
+        owns_client: bool = True,
     ) -> None:
         """
         Initialize robots.txt client.
@@ -52,14 +153,19 @@ class RobotsClient:
         Args:
             client: Configured async HTTP client
             user_agent: Default User-Agent string for checks
+            max_domains: Cached domains before LRU eviction (default: 10000)
+            owns_client: Whether aclose() should close the client
+                (False when it is shared with the scraper)
 
         Note:
             The client should be configured with appropriate
             timeout and proxy settings before passing here.
         """
         self._client = client
-        self._parsers: dict[str, RobotFileParser] = {}
-        self._lock = asyncio.Lock()
+        self._owns_client = owns_client
+        self._parsers: OrderedDict[str, tuple[Protego | None, float]] = OrderedDict()
+        self._max_domains = max(1, max_domains)
+        self._inflight: dict[str, asyncio.Task[_FetchOutcome]] = {}
         self._user_agent = user_agent
         self._logger = get_logger(__name__)
 
@@ -93,20 +199,24 @@ class RobotsClient:
             defaults to True (allow) to avoid blocking legitimate requests.
         """
         ua = user_agent or self._user_agent
-        parsed = urlparse(url)
-        domain = parsed.netloc
+        scheme, domain = _scheme_netloc(url)
+        key = _cache_key(scheme, domain)
 
-        # --► CACHE LOOKUP WITH LOCK
-        async with self._lock:
-            parser = self._parsers.get(domain)
+        # --► CACHE LOOKUP (NO LOCK ON HIT)
+        entry = self._parsers.get(key)
 
-            if parser is None:
-                parser = await self._fetch_and_parse(domain, parsed.scheme)
-                self._parsers[domain] = parser
+        if entry is not None and entry[1] > time.monotonic():
+            parser = entry[0]
+            self._parsers.move_to_end(key)
+        else:
+            parser = await self._load(key, domain, scheme)
 
         # --► PERMISSION CHECK
+        if parser is None:
+            return True
+
         try:
-            return parser.can_fetch(ua, url)
+            return parser.can_fetch(url, ua)
         except Exception:
             self._logger.warning(
                 "robots_check_failed",
@@ -117,47 +227,131 @@ class RobotsClient:
 
 
 
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client if this instance owns it.
+
+        Returns:
+            None
+        """
+        if self._owns_client:
+            await self._client.aclose()
+
+
+
+
     # --► INTERNAL HELPERS
 
+    async def _load(self, key: str, domain: str, scheme: str) -> Protego | None:
+        """
+        Fetch robots.txt for a cache key once, even under concurrent misses.
+
+        Args:
+            key: Cache key from _cache_key()
+            domain: Netloc of the URL that missed, used for the fetch
+            scheme: URL scheme (http or https)
+
+        Returns:
+            Cached or freshly parsed Protego, or None if all URLs
+            on the domain are allowed
+
+        Note:
+            The first caller starts a fetch task; concurrent callers for
+            the same key await that task instead of fetching again. The
+            task is shielded, so a cancelled caller does not abort the
+            fetch for the others. Also used to refresh expired entries.
+        """
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_parse(domain, scheme))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+
+        parser, _ = await asyncio.shield(task)
+        return parser
+
+
+
+
+    def _store(self, key: str, task: asyncio.Task[_FetchOutcome]) -> None:
+        """
+        Move a finished fetch from the in-flight map into the LRU cache.
+
+        Args:
+            key: Cache key the task was fetching
+            task: Completed fetch task
+
+        Note:
+            Runs as the task's first done callback, so the parser is
+            cached before any waiter resumes.
+        """
+        del self._inflight[key]
+
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        parser, ttl = task.result()
+        self._parsers[key] = (parser, time.monotonic() + ttl)
+        self._parsers.move_to_end(key)
+        if len(self._parsers) > self._max_domains:
+            self._parsers.popitem(last=False)
+
+
+
+
     async def _fetch_and_parse(
         self,
         domain: str,
         scheme: str,
-    ) -> RobotFileParser:
+    ) -> _FetchOutcome:
         """
         Fetch and parse robots.txt for domain.
 
         This method:
         1. Constructs robots.txt URL
         2. Fetches content with timeout
-        3. Parses rules using RobotFileParser
-        4. Returns empty parser if fetch fails
+        3. Parses rules using Protego when any Disallow is present
+        4. Returns None (allow all) otherwise or if fetch fails
 
         Args:
             domain: Target domain name
             scheme: URL scheme (http or https)
 
         Returns:
-            RobotFileParser with parsed rules or empty rules on failure
+            (parser, ttl): Protego parser with the domain's rules, or
+            None when nothing can be disallowed, and its cache lifetime
 
         Note:
-            Failures (404, timeout, proxy errors) result in empty
-            parser which allows all requests by default.
+            Failures (404, timeout, proxy errors) and files without
+            Disallow lines are cached as None, so can_fetch() answers
+            for those domains without running the rule matcher.
+            A 4xx means there is no robots.txt and is kept for the run;
+            5xx and network errors may be transient and are retried
+            after ROBOTS_RETRY_SECONDS.
         """
         robots_url = f"{scheme}://{domain}/robots.txt"
-        parser = RobotFileParser()
-        parser.set_url(robots_url)
 
         try:
-            resp = await self._client.get(robots_url, timeout=5.0)
+            # Identify as the agent the rules are evaluated for, not as
+            # whatever browser-like UA a shared scraper client sends
+            resp = await self._client.get(
+                robots_url,
+                headers={"User-Agent": self._user_agent},
+                timeout=5.0,
+            )
 
             # --► HANDLE HTTP ERRORS
+            if resp.status_code >= 500:
+                return None, ROBOTS_RETRY_SECONDS
             if resp.status_code >= 400:
-                parser.parse([])
-                return parser
+                return None, math.inf
 
             # --► PARSE SUCCESSFUL RESPONSE
-            parser.parse(resp.text.splitlines())
+            text = resp.text
+            if not _DISALLOW_LINE_RE.search(text):
+                return None, ROBOTS_TTL_SECONDS
+            return Protego.parse(text), ROBOTS_TTL_SECONDS
 
         except Exception as e:
             # ⚠️ GRACEFUL FALLBACK ON FETCH FAILURE
@@ -166,9 +360,7 @@ class RobotsClient:
             self._logger.debug(
                 f"robots_fetch_failed for {domain}: {type(e).__name__}"
             )
-            parser.parse([])
-
-        return parser
+            return None, ROBOTS_RETRY_SECONDS
 
 
 
@@ -178,33 +370,51 @@ class RobotsClient:
 async def make_robots_client(
     run_config: RunConfig,
     proxy_config: ProxyConfig | None,
+    *,
+    shared_client: httpx.AsyncClient | None = None,
 ) -> RobotsClient:
     """
     Create RobotsClient with optional proxy configuration.
 
     This factory function:
-    1. Creates HTTP client with or without proxy
-    2. Configures redirect following
+    1. Reuses shared_client if given, else creates an HTTP/2 client
+       with or without proxy
+    2. Configures redirect following and keep-alive pooling
     3. Returns initialized RobotsClient
 
     Args:
         run_config: Runtime configuration
         proxy_config: Optional proxy configuration
+        shared_client: Scraper client to send robots.txt requests
+            through (shares its connection pool, TLS sessions and proxy)
 
     Returns:
         Configured RobotsClient instance
 
     Note:
-        The HTTP client created here is separate from the main
-        scraping client to avoid interference with rate limiting.
+        robots.txt requests never pass through the DomainScheduler,
+        so sharing the connection pool does not affect rate limiting.
+        A shared client is left open by RobotsClient.aclose(). A
+        standalone client multiplexes robots.txt requests per host
+        over HTTP/2; httpx already advertises every content encoding
+        it can decode, so Accept-Encoding is left at its default.
     """
-    client: httpx.AsyncClient
+    if shared_client is not None:
+        return RobotsClient(client=shared_client, owns_client=False)
+
+    proxy_url: str | None = None
 
     if proxy_config is not None:
         proxy_manager = ProxyManager.from_proxy_config(proxy_config)
         proxy_url = proxy_manager.httpx_proxy()
-        client = httpx.AsyncClient(follow_redirects=True, proxy=proxy_url, verify=False)
-    else:
-        client = httpx.AsyncClient(follow_redirects=True, verify=False)
+
+    client = httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        limits=_ROBOTS_LIMITS,
+        headers={"User-Agent": "TavilyScraper"},
+        proxy=proxy_url,
+        verify=False,
+    )
 
     return RobotsClient(client=client)
@@ -3,9 +3,11 @@ Domain-aware scheduling and concurrency control.
 
 This module implements intelligent rate limiting with:
 - Global concurrency limits across all domains
-- Per-domain concurrency limits for high-volume targets
-- Optional request jitter to avoid burst patterns
-- Adaptive browser fallback decisions based on error rates
+- Per-domain AIMD concurrency gates capped at configured limits
+- Per-domain token-bucket request rates with jittered waits
+- Per-domain "not before" deadlines from rate-limit headers
+- Per-domain circuit breaker (closed / open / half-open) deciding
+  whether browser fallback is worth attempting
 - CAPTCHA and error tracking per domain
 """
 
@@ -13,8 +15,66 @@ from __future__ import annotations
 
 import asyncio
 import random
-from collections import defaultdict
-from collections.abc import Mapping
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Literal, TypeVar
+
+from tavily_scraper.core.concurrency import AdaptiveConcurrency
+
+# ==== CIRCUIT BREAKER ==== #
+
+BreakerState = Literal["open", "half_open"]
+"""
+Tripped browser-fallback breaker states (closed domains have no entry).
+
+- 'open': Browser fallback is skipped until the cool-down expires
+- 'half_open': One probe has been let through; its outcome decides
+"""
+
+NON_RETRIABLE_STATUSES: frozenset[int] = frozenset({401, 403})
+"""Deterministic refusals that say nothing about a domain's health."""
+
+
+
+
+# ==== DOMAIN TIERS ==== #
+
+_T = TypeVar("_T")
+
+
+
+
+def _lookup_tier(tiers: Mapping[str, _T], domain: str) -> _T | None:
+    """
+    Find domain's entry in a table of exact hosts and "*.suffix" patterns.
+
+    An exact host entry wins, then the most specific "*.suffix"
+    pattern ("*.example.com" covers example.com and its subdomains).
+
+    Args:
+        tiers: Per-domain settings keyed by host or "*.suffix"
+        domain: Target domain name (host[:port])
+
+    Returns:
+        Matching setting, or None if no entry applies
+    """
+    exact = tiers.get(domain)
+    if exact is not None:
+        return exact
+
+    labels = domain.rsplit(":", 1)[0].split(".")
+    for i in range(len(labels)):
+        value = tiers.get("*." + ".".join(labels[i:]))
+        if value is not None:
+            return value
+
+    return None
+
+
+
 
 # ==== DOMAIN-AWARE SCHEDULER ==== #
 
@@ -24,55 +84,110 @@ class DomainScheduler:
 
     This scheduler manages request concurrency at two levels:
     1. Global: Total concurrent requests across all domains
-    2. Per-domain: Concurrent requests to specific domains
+    2. Per-domain: Concurrent requests to specific domains, adapted
+       by an AIMD gate that shrinks on congestion (timeouts, resets,
+       429/5xx, CAPTCHAs flagged as congestion) and slow responses and
+       grows back toward the configured limit
 
     It also tracks errors and CAPTCHAs per domain to make intelligent
     decisions about whether browser fallback is worth attempting.
 
     Attributes:
-        _global_semaphore: Global concurrency limiter
-        _per_domain_limits: Configured per-domain limits
-        _domain_semaphores: Active per-domain semaphores
+        _global_semaphore: Global concurrency limiter (None if the
+            caller already bounds total concurrency)
+        _per_domain_limits: Configured per-domain limits (exact hosts
+            or "*.suffix" patterns)
+        _default_domain_limit: Limit for domains not in _per_domain_limits
+        _limit_for: Cached domain -> concurrency limit classifier
+        _domain_latency_target_ms: Per-domain mean latency considered healthy
+        _domain_gates: Per-domain AIMD gates, kept while a domain has
+            requests in flight or waiting, or is backed off
+        _domain_users: Requests holding or waiting for each domain's gate
         _error_counts: Error count tracker per domain
         _captcha_counts: CAPTCHA count tracker per domain
-        _jitter_range: Optional delay range for request jitter
+        _domain_rates: Configured requests/second per domain (exact
+            hosts or "*.suffix" patterns)
+        _default_domain_rate: Requests/second for unlisted domains (0 = no cap)
+        _rate_for: Cached domain -> request rate classifier
+        _domain_buckets: Per-domain (tokens, last refill time) buckets
+        _jitter_range: Optional extra delay range added to rate waits
+        _rng: Scheduler-private random source for jitter
+        _not_before: Per-domain earliest dispatch time (loop clock)
         _max_errors_for_browser: Error threshold for browser attempts
         _max_captchas_for_browser: CAPTCHA threshold for browser attempts
+        _browser_cooldown: Seconds a tripped breaker stays open
+        _breakers: Tripped breakers per domain as (state, until), with
+            until on the time.monotonic() clock
     """
 
     def __init__(
         self,
-        global_limit: int,
+        global_limit: int | None,
         per_domain_limits: Mapping[str, int] | None = None,
         jitter_range: tuple[float, float] | None = None,
         max_errors_for_browser: int = 5,
         max_captchas_for_browser: int = 5,
+        default_domain_limit: int = 4,
+        domain_latency_target_ms: int = 3_000,
+        per_domain_rates: Mapping[str, float] | None = None,
+        default_domain_rate: float = 0.0,
+        seed: int | None = None,
+        browser_cooldown_seconds: float = 300.0,
     ) -> None:
         """
         Initialize domain scheduler with concurrency limits.
 
         Args:
-            global_limit: Maximum concurrent requests across all domains
-            per_domain_limits: Optional dict mapping domains to their limits
-            jitter_range: Optional (min, max) delay range in seconds
+            global_limit: Maximum concurrent requests across all domains,
+                or None when an outer gate already enforces it
+            per_domain_limits: Optional dict mapping domains to their
+                limits; "*.example.com" keys cover example.com and all
+                of its subdomains
+            jitter_range: Optional (min, max) seconds added to each
+                rate-limited wait so throttled requests do not align
             max_errors_for_browser: Error threshold before disabling browser
             max_captchas_for_browser: CAPTCHA threshold before disabling browser
+            default_domain_limit: Concurrent requests for unlisted domains
+            domain_latency_target_ms: Mean latency above which a
+                domain's concurrency is cut (default: 3000)
+            per_domain_rates: Optional dict mapping domains to a request
+                rate in requests/second; keys match like per_domain_limits
+            default_domain_rate: Request rate for unlisted domains
+                (default: 0, no rate cap)
+            seed: Optional seed making jitter reproducible
+            browser_cooldown_seconds: How long browser fallback stays
+                disabled after a breaker trips (default: 300)
 
         Example:
             scheduler = DomainScheduler(
                 global_limit=32,
-                per_domain_limits={"google.com": 1, "bing.com": 1},
+                per_domain_limits={"*.google.com": 1, "bing.com": 1},
+                per_domain_rates={"*.google.com": 0.5},
                 jitter_range=(0.1, 0.5),
             )
         """
-        self._global_semaphore = asyncio.Semaphore(global_limit)
+        self._global_semaphore = (
+            asyncio.Semaphore(global_limit) if global_limit is not None else None
+        )
         self._per_domain_limits = dict(per_domain_limits or {})
-        self._domain_semaphores: dict[str, asyncio.Semaphore] = {}
-        self._error_counts: dict[str, int] = defaultdict(int)
-        self._captcha_counts: dict[str, int] = defaultdict(int)
+        self._limit_for = lru_cache(maxsize=4096)(self._classify_limit)
+        self._default_domain_limit = default_domain_limit
+        self._domain_latency_target_ms = domain_latency_target_ms
+        self._domain_gates: dict[str, AdaptiveConcurrency] = {}
+        self._domain_users: dict[str, int] = {}
+        self._error_counts: Counter[str] = Counter()
+        self._captcha_counts: Counter[str] = Counter()
+        self._domain_rates = dict(per_domain_rates or {})
+        self._default_domain_rate = default_domain_rate
+        self._rate_for = lru_cache(maxsize=4096)(self._classify_rate)
+        self._domain_buckets: dict[str, tuple[float, float]] = {}
         self._jitter_range = jitter_range
+        self._rng = random.Random(seed)
+        self._not_before: dict[str, float] = {}
         self._max_errors_for_browser = max_errors_for_browser
         self._max_captchas_for_browser = max_captchas_for_browser
+        self._browser_cooldown = browser_cooldown_seconds
+        self._breakers: dict[str, tuple[BreakerState, float]] = {}
 
 
 
@@ -84,9 +199,10 @@ class DomainScheduler:
         Acquire concurrency slot for domain.
 
         This method:
-        1. Acquires global semaphore slot
-        2. Acquires domain-specific semaphore slot
-        3. Optionally adds random jitter delay
+        1. Waits out any rate-limit deadline set for the domain
+        2. Waits for a token from the domain's rate bucket, if any
+        3. Acquires global semaphore slot (if configured)
+        4. Acquires a slot under the domain's current AIMD limit
 
         Args:
             domain: Target domain name
@@ -96,19 +212,121 @@ class DomainScheduler:
 
         Note:
             This method blocks until both global and domain slots
-            are available. Always pair with release() in a try/finally.
+            are available. Always pair with release() in a try/finally,
+            or use ``async with scheduler.slot(domain):``.
+            Rate-limit waits happen before any slot is taken, so a
+            throttled domain never holds global capacity while idle.
         """
-        await self._global_semaphore.acquire()
+        # Re-check after each sleep: a defer() or record_throttle() may
+        # push the deadline out while this request is waiting
+        loop = asyncio.get_running_loop()
+        while (delay := self._not_before.get(domain, 0.0) - loop.time()) > 0:
+            await asyncio.sleep(delay)
+        self._not_before.pop(domain, None)
+
+        delay = self._take_token(domain)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._global_semaphore is not None:
+            await self._global_semaphore.acquire()
+
+        gate = self._domain_gates.get(domain)
+        if gate is None:
+            limit = self._limit_for(domain)
+            gate = AdaptiveConcurrency(
+                limit,
+                minimum=1,
+                maximum=limit,
+                latency_target_ms=self._domain_latency_target_ms,
+            )
+            self._domain_gates[domain] = gate
+
+        self._domain_users[domain] = self._domain_users.get(domain, 0) + 1
+        try:
+            await gate.acquire()
+        except BaseException:
+            if self._global_semaphore is not None:
+                self._global_semaphore.release()
+            self._leave(domain)
+            raise
+
+
+
+
+    def _classify_limit(self, domain: str) -> int:
+        """
+        Resolve domain's concurrency limit from the configured tiers.
+
+        An exact host entry wins, then the most specific "*.suffix"
+        pattern, then the default. Wrapped per instance in an LRU
+        cache (_limit_for), so each host is classified once.
+
+        Args:
+            domain: Target domain name (host[:port])
+
+        Returns:
+            Concurrency limit for domain
+        """
+        limit = _lookup_tier(self._per_domain_limits, domain)
+        return self._default_domain_limit if limit is None else limit
+
+
 
-        sem = self._domain_semaphores.setdefault(
-            domain,
-            asyncio.Semaphore(self._per_domain_limits.get(domain, 4)),
-        )
-        await sem.acquire()
 
+    def _classify_rate(self, domain: str) -> float:
+        """
+        Resolve domain's request rate from the configured tiers.
+
+        Matches like _classify_limit and is cached per instance as
+        _rate_for.
+
+        Args:
+            domain: Target domain name (host[:port])
+
+        Returns:
+            Requests/second for domain (0 = no cap)
+        """
+        rate = _lookup_tier(self._domain_rates, domain)
+        return self._default_domain_rate if rate is None else rate
+
+
+
+
+    def _take_token(self, domain: str) -> float:
+        """
+        Reserve one request token from domain's bucket.
+
+        The bucket refills at the domain's rate up to a burst of the
+        domain's concurrency limit. A token is always reserved, so the
+        balance may go negative; the caller sleeps off the deficit and
+        concurrent callers queue up behind each other in O(1).
+
+        Args:
+            domain: Target domain name
+
+        Returns:
+            Seconds to wait before sending (0.0 if a token was free or
+            the domain has no rate cap)
+        """
+        rate = self._rate_for(domain)
+        if rate <= 0:
+            return 0.0
+
+        now = asyncio.get_running_loop().time()
+        burst = float(self._limit_for(domain))
+        tokens, last = self._domain_buckets.get(domain, (burst, now))
+        tokens = min(burst, tokens + (now - last) * rate) - 1.0
+        self._domain_buckets[domain] = (tokens, now)
+
+        if tokens >= 0:
+            return 0.0
+
+        delay = -tokens / rate
         if self._jitter_range:
             low, high = self._jitter_range
-            await asyncio.sleep(random.uniform(low, high))
+            delay += low + (high - low) * self._rng.random()
+        return delay
 
 
 
@@ -117,7 +335,7 @@ class DomainScheduler:
         """
         Release concurrency slot for domain.
 
-        This method releases both global and domain-specific semaphores.
+        This method releases both the global and the domain slot.
 
         Args:
             domain: Target domain name
@@ -129,18 +347,163 @@ class DomainScheduler:
             Should always be called in a finally block to ensure
             slots are released even if errors occur.
         """
-        self._global_semaphore.release()
+        if self._global_semaphore is not None:
+            self._global_semaphore.release()
+
+        gate = self._domain_gates.get(domain)
+        if gate is not None:
+            gate.release()
+        self._leave(domain)
+
+
+
+
+    @asynccontextmanager
+    async def slot(self, domain: str) -> AsyncIterator[None]:
+        """
+        Hold domain's concurrency slot for the ``async with`` body.
+
+        Args:
+            domain: Target domain name
+
+        Yields:
+            None
+
+        Note:
+            The slot is released exactly once however the body exits,
+            including cancellation mid-request.
+        """
+        await self.acquire(domain)
+        try:
+            yield
+        finally:
+            self.release(domain)
+
+
+
+
+    def _leave(self, domain: str) -> None:
+        """
+        Drop one user of domain's gate, evicting the gate once unused.
+
+        A gate is evicted when nothing holds or waits on it, it is at
+        the domain's configured limit and the domain has never logged
+        an error or CAPTCHA. Memory then follows active and troubled
+        domains rather than every domain ever seen, while a domain
+        that fails keeps its AIMD state (reduced limit, epoch progress)
+        across idle gaps.
+
+        Args:
+            domain: Target domain name
+
+        Returns:
+            None
+        """
+        users = self._domain_users.get(domain, 0) - 1
+        if users > 0:
+            self._domain_users[domain] = users
+            return
+
+        self._domain_users.pop(domain, None)
+        gate = self._domain_gates.get(domain)
+        limit = self._limit_for(domain)
+        if (
+            gate is not None
+            and gate.limit >= limit
+            and domain not in self._error_counts
+            and domain not in self._captcha_counts
+        ):
+            del self._domain_gates[domain]
+
+
+
+
+    def defer(self, domain: str, delay_seconds: float) -> None:
+        """
+        Hold back further requests to domain for delay_seconds.
 
-        sem = self._domain_semaphores.get(domain)
-        if sem is not None:
-            sem.release()
+        Used when a response carries Retry-After or shows the rate-limit
+        budget is nearly spent. Deadlines only ever move later.
+
+        Args:
+            domain: Target domain name
+            delay_seconds: Minimum wait before the next request
+
+        Returns:
+            None
+        """
+        if delay_seconds <= 0:
+            return
+
+        deadline = asyncio.get_running_loop().time() + delay_seconds
+        if deadline > self._not_before.get(domain, 0.0):
+            self._not_before[domain] = deadline
+
+
+
+
+    def record_throttle(self, domain: str, delay_seconds: float) -> None:
+        """
+        React to an origin's rate-limit signal before it turns into 429s.
+
+        Defers the domain by delay_seconds and reports congestion to its
+        AIMD gate, so requests resume after the pause at reduced
+        concurrency instead of in a full-width burst.
+
+        Args:
+            domain: Target domain name
+            delay_seconds: Pause requested by Retry-After or derived
+                from an exhausted X-RateLimit-Remaining budget
+
+        Returns:
+            None
+        """
+        if delay_seconds <= 0:
+            return
+
+        self.defer(domain, delay_seconds)
+
+        gate = self._domain_gates.get(domain)
+        if gate is not None:
+            gate.record(None, congested=True)
 
 
 
 
     # --► ERROR & CAPTCHA TRACKING
 
-    def record_error(self, domain: str) -> None:
+    def record_latency(
+        self,
+        domain: str,
+        latency_ms: int,
+        *,
+        congested: bool = False,
+    ) -> None:
+        """
+        Feed one attempt's outcome into the domain's AIMD gate.
+
+        Args:
+            domain: Target domain name
+            latency_ms: Attempt latency in milliseconds
+            congested: True for timeouts, resets, 429 and 5xx responses
+
+        Returns:
+            None
+        """
+        gate = self._domain_gates.get(domain)
+        if gate is not None:
+            gate.record(latency_ms, congested=congested)
+
+
+
+
+    def record_error(
+        self,
+        domain: str,
+        status: int | None = None,
+        *,
+        browser: bool = False,
+    ) -> None:
         """
         Record HTTP error for domain.
 
@@ -149,16 +512,36 @@ class DomainScheduler:
 
         Args:
             domain: Target domain name
+            status: HTTP status code, if the error had one
+            browser: True if a browser fetch failed (only these re-open
+                a half-open breaker)
 
         Returns:
             None
+
+        Note:
+            401/403 responses are deterministic refusals, not signs of
+            an overloaded or failing host, and are not counted.
+            Errors do not touch the domain's AIMD gate: congestion is
+            reported per attempt through record_latency(), so a 404 or
+            DNS failure never shrinks the domain's concurrency.
         """
+        if status in NON_RETRIABLE_STATUSES:
+            return
+
         self._error_counts[domain] += 1
+        self._update_breaker(domain, browser)
 
 
 
 
-    def record_captcha(self, domain: str) -> None:
+    def record_captcha(
+        self,
+        domain: str,
+        *,
+        browser: bool = False,
+        congested: bool = False,
+    ) -> None:
         """
         Record CAPTCHA detection for domain.
 
@@ -168,11 +551,77 @@ class DomainScheduler:
 
         Args:
             domain: Target domain name
+            browser: True if a browser fetch hit the CAPTCHA (only these
+                re-open a half-open breaker)
+            congested: True to also cut the domain's AIMD gate, backing
+                off before the block hardens; leave False when the
+                response was already reported through record_latency()
 
         Returns:
             None
         """
         self._captcha_counts[domain] += 1
+        self._update_breaker(domain, browser)
+
+        if congested:
+            gate = self._domain_gates.get(domain)
+            if gate is not None:
+                gate.record(None, congested=True)
+
+
+
+
+    def record_success(self, domain: str) -> None:
+        """
+        Record a successful fetch for domain.
+
+        A success while the breaker is half-open closes it and clears
+        the domain's error and CAPTCHA counts.
+
+        Args:
+            domain: Target domain name
+
+        Returns:
+            None
+        """
+        breaker = self._breakers.get(domain)
+        if breaker is not None and breaker[0] == "half_open":
+            del self._breakers[domain]
+            self._error_counts.pop(domain, None)
+            self._captcha_counts.pop(domain, None)
+
+
+
+
+    def _update_breaker(self, domain: str, browser: bool) -> None:
+        """
+        Trip a closed breaker at a threshold, or re-open a failed probe.
+
+        Args:
+            domain: Target domain name
+            browser: True if the failure came from a browser fetch
+
+        Returns:
+            None
+
+        Note:
+            An open breaker keeps its deadline. HTTP-path failures keep
+            arriving while it is open (each URL tries HTTP before the
+            browser), and pushing the deadline out on each of them would
+            keep the breaker from ever reaching half-open.
+        """
+        breaker = self._breakers.get(domain)
+        if breaker is None:
+            if (
+                self._error_counts.get(domain, 0) < self._max_errors_for_browser
+                and self._captcha_counts.get(domain, 0)
+                < self._max_captchas_for_browser
+            ):
+                return
+        elif breaker[0] != "half_open" or not browser:
+            return
+
+        self._breakers[domain] = ("open", time.monotonic() + self._browser_cooldown)
 
 
 
@@ -183,9 +632,11 @@ class DomainScheduler:
         """
         Determine if browser fallback is worth attempting for domain.
 
-        This method checks if the domain has accumulated too many
-        errors or CAPTCHAs, indicating hard blocking where browser
-        attempts are unlikely to succeed.
+        Each domain has a circuit breaker. It is closed (no entry)
+        until errors or CAPTCHAs reach their thresholds, then open for
+        browser_cooldown_seconds. After the cool-down a single probe
+        is let through (half-open): a success closes the breaker, a
+        failure re-opens it for another cool-down.
 
         Args:
             domain: Target domain name
@@ -195,12 +646,18 @@ class DomainScheduler:
 
         Note:
             This prevents wasting expensive browser resources on
-            domains that are clearly blocking all automated access.
+            domains that are clearly blocking all automated access,
+            without writing them off for the whole run. A half-open
+            probe that never reports back is retried after another
+            cool-down.
         """
-        if self._error_counts[domain] >= self._max_errors_for_browser:
-            return False
+        breaker = self._breakers.get(domain)
+        if breaker is None:
+            return True
 
-        if self._captcha_counts[domain] >= self._max_captchas_for_browser:
+        now = time.monotonic()
+        if now < breaker[1]:
             return False
 
+        self._breakers[domain] = ("half_open", now + self._browser_cooldown)
         return True
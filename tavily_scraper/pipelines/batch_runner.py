@@ -11,13 +11,16 @@ This module orchestrates the hybrid scraping pipeline, managing:
 from __future__ import annotations
 
 import asyncio
-import json
+import logging
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from playwright.async_api import Browser
 
 from tavily_scraper.config.env import load_proxy_config_from_json, load_run_config
 from tavily_scraper.config.proxies import ProxyManager
+from tavily_scraper.core.concurrency import AdaptiveConcurrency
 from tavily_scraper.core.models import (
     FetchResult,
     RunConfig,
@@ -26,18 +29,26 @@ from tavily_scraper.core.models import (
     UrlJob,
     UrlStats,
     fetch_result_to_url_stats,
+    release_fetch_result,
 )
 from tavily_scraper.core.robots import make_robots_client
 from tavily_scraper.core.scheduler import DomainScheduler
 from tavily_scraper.pipelines.fast_http_fetcher import make_http_client
 from tavily_scraper.pipelines.router import route_and_fetch
 from tavily_scraper.utils.io import (
+    CheckpointJournal,
+    ResultStore,
+    adaptive_shard_size,
     load_urls_from_txt,
     make_url_jobs,
-    write_stats_jsonl,
+    write_run_summary,
+    write_stats,
 )
 from tavily_scraper.utils.logging import get_logger
-from tavily_scraper.utils.metrics import compute_run_summary
+from tavily_scraper.utils.metrics import SummaryAccumulator, compute_run_summary
+
+if TYPE_CHECKING:
+    from tavily_scraper.pipelines.browser_fetcher import BrowserPool
 
 logger = get_logger(__name__)
 
@@ -49,63 +60,72 @@ logger = get_logger(__name__)
 async def _process_jobs(
     jobs: list[UrlJob],
     ctx: RunnerContext,
-    browser: Browser | None,
+    browser: Browser | BrowserPool | None,
     config: RunConfig,
     target_success: int | None,
-) -> list[FetchResult]:
+    on_result: Callable[[FetchResult], None],
+) -> int:
     """
     Process URL jobs with concurrency control and optional early termination.
 
     This function:
-    1. Creates a semaphore to limit concurrent requests
-    2. Processes jobs asynchronously with configurable parallelism
+    1. Starts a fixed pool of workers pulling jobs from a shared iterator
+    2. Gates each fetch through the adaptive (AIMD) concurrency limiter
     3. Tracks success count for early termination
     4. Logs progress at regular intervals
 
     Args:
         jobs: List of URL jobs to process
         ctx: Runner context containing shared resources
-        browser: Optional Playwright browser instance for fallback
+        browser: Optional Playwright browser or pool for fallback
         config: Runtime configuration
         target_success: Optional success count threshold for early stop
+        on_result: Called with each FetchResult as soon as it completes
 
     Returns:
-        List of fetch results for all processed jobs
+        Number of jobs processed
 
     Note:
-        When target_success is reached, remaining jobs are cancelled
-        to avoid unnecessary processing.
+        Only concurrency_max workers (the AIMD ceiling) exist at any
+        time, so task and coroutine overhead is O(concurrency) rather
+        than O(jobs). When target_success is reached, unstarted jobs
+        are never scheduled and the other workers are cancelled, so
+        fetches still in flight are abandoned instead of drained.
+        Results are handed to on_result instead of being collected, so
+        memory stays O(concurrency) as well.
     """
-    semaphore = asyncio.Semaphore(config.httpx_max_concurrency)
-    results: list[FetchResult] = []
+    gate = (
+        ctx.concurrency
+        if ctx.concurrency is not None
+        else AdaptiveConcurrency.from_config(config)
+    )
+    pending = iter(jobs)
     success_count = 0
     processed_count = 0
     stop_processing = False
     target_reached_logged = False
+    workers: list[asyncio.Task[None]] = []
+    # Per-success progress lines are the only per-job log call; decide
+    # once whether they are emitted instead of on every success.
+    log_progress = logger.isEnabledFor(logging.INFO)
 
-    async def process_job(job: UrlJob) -> FetchResult | None:
-        """
-        Process a single URL job with early termination support.
-
-        Args:
-            job: URL job to process
-
-        Returns:
-            FetchResult if processed, None if skipped due to early termination
-        """
+    async def worker() -> None:
+        """Process jobs until they run out or the success target is hit."""
         nonlocal success_count, processed_count, stop_processing, target_reached_logged
 
-        if stop_processing:
-            return None
-
-        async with semaphore:
+        for job in pending:
             if stop_processing:
-                return None
+                return
+
+            async with gate:
+                if stop_processing:
+                    return
+
+                result = await route_and_fetch(job, ctx, browser)
 
-            result = await route_and_fetch(job, ctx, browser)
             processed_count += 1
 
-            if result.get("status") == "success":
+            if result.status == "success":
                 success_count += 1
 
                 # Early-stop condition: log once when we first hit the target.
@@ -117,7 +137,11 @@ async def _process_jobs(
                             "Reached target of %s successful URLs",
                             target_success,
                         )
-                elif not target_reached_logged:
+                        current = asyncio.current_task()
+                        for task in workers:
+                            if task is not current:
+                                task.cancel()
+                elif log_progress and not target_reached_logged:
                     logger.info(
                         "Success %s/%s (processed %s)",
                         success_count,
@@ -125,11 +149,11 @@ async def _process_jobs(
                         processed_count,
                     )
 
-            return result
+            on_result(result)
 
-    tasks = [process_job(job) for job in jobs]
-    completed_results = await asyncio.gather(*tasks)
-    results = [r for r in completed_results if r is not None]
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(config.concurrency_max, len(jobs))):
+            workers.append(tg.create_task(worker()))
 
     logger.info(
         "Completed: %s successful out of %s processed",
@@ -137,7 +161,7 @@ async def _process_jobs(
         processed_count,
     )
 
-    return results
+    return processed_count
 
 
 
@@ -161,8 +185,9 @@ async def run_batch(
     2. Creates URL jobs from input list
     3. Initializes shared resources (scheduler, robots client, HTTP client)
     4. Optionally launches browser for fallback
-    5. Processes all jobs concurrently
-    6. Persists statistics and summary
+    5. Processes all jobs concurrently, streaming each result's
+       statistics to disk and into the running summary
+    6. Persists the summary
 
     Args:
         urls: List of URLs to process
@@ -198,12 +223,20 @@ async def run_batch(
     )
 
     # --► CONTEXT INITIALIZATION
+    # The AIMD gate is the only global admission control: every
+    # scheduler slot is taken inside a gate permit, so a second
+    # global semaphore could never block.
     scheduler = DomainScheduler(
-        global_limit=config.httpx_max_concurrency,
-        per_domain_limits={"www.google.com": 1, "www.bing.com": 1},
+        global_limit=None,
+        per_domain_limits={"*.google.com": 1, "*.bing.com": 1},
+        default_domain_limit=config.httpx_max_connections_per_host,
+        domain_latency_target_ms=config.latency_target_ms,
+        default_domain_rate=config.domain_rps,
     )
-    robots_client = await make_robots_client(config, proxy_config)
     http_client = make_http_client(config, proxy_manager)
+    robots_client = await make_robots_client(
+        config, proxy_config, shared_client=http_client
+    )
 
     ctx = RunnerContext(
         run_config=config,
@@ -211,39 +244,55 @@ async def run_batch(
         scheduler=scheduler,
         robots_client=robots_client,
         http_client=http_client,
+        concurrency=AdaptiveConcurrency.from_config(config),
     )
 
-    # --► JOB PROCESSING
-    if use_browser:
-        from tavily_scraper.pipelines.browser_fetcher import browser_lifecycle
-
-        async with browser_lifecycle(config, proxy_manager) as browser:
-            results = await _process_jobs(
-                jobs,
-                ctx,
-                browser,
-                config,
-                target_success,
-            )
-    else:
-        results = await _process_jobs(jobs, ctx, None, config, target_success)
-
-    # --► STATISTICS PERSISTENCE
-    stats = [fetch_result_to_url_stats(r) for r in results]
-
-    stats_path = config.data_dir / f"stats{stats_suffix}.jsonl"
-    write_stats_jsonl(stats, stats_path)
-    logger.info("Wrote %s stats to %s", len(stats), stats_path)
-
-    # --► SUMMARY COMPUTATION
-    summary = compute_run_summary(stats)
-    summary_path = config.data_dir / f"run_summary{stats_suffix}.json"
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-    logger.info("Wrote run summary to %s", summary_path)
-
-    # --► RESOURCE CLEANUP
-    await http_client.aclose()
-    await robots_client._client.aclose()
+    try:
+        # --► STREAMING STATISTICS SINK
+        # Each result is converted, written and summarized as it
+        # completes; nothing per-URL outlives its own job.
+        stats_path = config.data_dir / f"stats{stats_suffix}.{config.stats_format}"
+        stats_path.unlink(missing_ok=True)
+        store = ResultStore(stats_path, background=True)
+        accumulator = SummaryAccumulator()
+
+        def on_result(result: FetchResult) -> None:
+            stat = fetch_result_to_url_stats(result)
+            release_fetch_result(result)
+            store.write(stat)
+            accumulator.add(stat)
+
+        # --► JOB PROCESSING
+        try:
+            if use_browser:
+                from tavily_scraper.pipelines.browser_fetcher import browser_pool
+
+                async with browser_pool(config, proxy_manager) as browser:
+                    await _process_jobs(
+                        jobs,
+                        ctx,
+                        browser,
+                        config,
+                        target_success,
+                        on_result,
+                    )
+            else:
+                await _process_jobs(
+                    jobs, ctx, None, config, target_success, on_result
+                )
+        finally:
+            await asyncio.to_thread(store.close)
+
+        logger.info("Wrote %s stats to %s", accumulator.total, stats_path)
+
+        # --► SUMMARY COMPUTATION
+        summary = accumulator.finalize()
+        summary_path = config.data_dir / f"run_summary{stats_suffix}.json"
+        await asyncio.to_thread(write_run_summary, summary, summary_path)
+        logger.info("Wrote run summary to %s", summary_path)
+    finally:
+        # --► RESOURCE CLEANUP
+        await asyncio.gather(robots_client.aclose(), http_client.aclose())
 
     return summary
 
@@ -268,7 +317,7 @@ async def run_all(
     2. Reads URLs from configured path
     3. Executes batch processing
     4. Writes output files:
-       - data/stats.jsonl: Per-URL statistics
+       - data/stats.jsonl (or stats.msgpack): Per-URL statistics
        - data/run_summary.json: Aggregate metrics
 
     Args:
@@ -301,6 +350,68 @@ async def run_all(
     )
 
 
+
+
+async def _run_shards(
+    jobs: list[UrlJob],
+    run_id: str,
+    ctx: RunnerContext,
+    journal: CheckpointJournal,
+    browser: Browser | BrowserPool | None,
+) -> list[UrlStats]:
+    """
+    Run jobs shard by shard, sizing each shard from observed content.
+
+    Args:
+        jobs: All URL jobs for the run
+        run_id: Unique run identifier
+        ctx: Runner context with shared resources
+        journal: Run-wide checkpoint journal
+        browser: Optional browser or browser pool for fallback
+
+    Returns:
+        URL statistics for every processed job
+
+    Note:
+        The first shard uses shard_size URLs. Later shards hold about
+        shard_bytes_target bytes of content at the average page size
+        seen so far, so runs of heavy pages checkpoint and release
+        memory sooner while runs of small pages use fewer, larger shards.
+    """
+    from tavily_scraper.pipelines.shard_runner import run_shard
+
+    config = ctx.run_config
+    all_stats: list[UrlStats] = []
+    shard_size = config.shard_size
+    urls_seen = 0
+    bytes_seen = 0
+    start = 0
+    shard_id = 0
+
+    while start < len(jobs):
+        shard_jobs = jobs[start : start + shard_size]
+        for job in shard_jobs:
+            job.shard_id = shard_id
+
+        shard_stats = await run_shard(run_id, shard_id, shard_jobs, ctx, journal, browser)
+        all_stats.extend(shard_stats)
+
+        urls_seen += len(shard_stats)
+        bytes_seen += sum(stat.content_len for stat in shard_stats)
+        shard_size = adaptive_shard_size(
+            urls_seen,
+            bytes_seen,
+            current=shard_size,
+            target_bytes=config.shard_bytes_target,
+        )
+        start += len(shard_jobs)
+        shard_id += 1
+
+    return all_stats
+
+
+
+
 async def run_all_sharded(
     config: RunConfig | None = None,
     *,
@@ -318,9 +429,6 @@ async def run_all_sharded(
     Returns:
         RunSummary containing aggregate metrics
     """
-    from tavily_scraper.pipelines.shard_runner import run_shard
-    from tavily_scraper.utils.io import make_shards
-
     config = config or load_run_config()
     urls = load_urls_from_txt(config.urls_path)
 
@@ -329,7 +437,6 @@ async def run_all_sharded(
         raise RuntimeError(msg)
 
     jobs = make_url_jobs(urls)
-    shards = make_shards(jobs, config.shard_size)
 
     # Setup context
     proxy_config = None
@@ -338,9 +445,16 @@ async def run_all_sharded(
         proxy_config = load_proxy_config_from_json(config.proxy_config_path)
         proxy_manager = ProxyManager.from_proxy_config(proxy_config)
 
-    scheduler = DomainScheduler(global_limit=config.httpx_max_concurrency)
-    robots_client = await make_robots_client(config, proxy_config)
+    scheduler = DomainScheduler(
+        global_limit=None,
+        default_domain_limit=config.httpx_max_connections_per_host,
+        domain_latency_target_ms=config.latency_target_ms,
+        default_domain_rate=config.domain_rps,
+    )
     http_client = make_http_client(config, proxy_manager)
+    robots_client = await make_robots_client(
+        config, proxy_config, shared_client=http_client
+    )
 
     ctx = RunnerContext(
         run_config=config,
@@ -348,43 +462,36 @@ async def run_all_sharded(
         scheduler=scheduler,
         robots_client=robots_client,
         http_client=http_client,
+        concurrency=AdaptiveConcurrency.from_config(config),
     )
 
-    all_stats: list[UrlStats] = []
-    run_id = datetime.now(UTC).isoformat()
-    checkpoints_dir = config.data_dir / "checkpoints"
-    checkpoints_dir.mkdir(parents=True, exist_ok=True)
-
-    if use_browser:
-        from tavily_scraper.pipelines.browser_fetcher import browser_lifecycle
-
-        async with browser_lifecycle(config, proxy_manager) as browser:
-            for shard_id, shard_jobs in enumerate(shards):
-                checkpoint_path = checkpoints_dir / f"{run_id}_shard_{shard_id}.json"
-                shard_stats = await run_shard(
-                    run_id, shard_id, shard_jobs, ctx, checkpoint_path, browser
-                )
-                all_stats.extend(shard_stats)
-    else:
-        for shard_id, shard_jobs in enumerate(shards):
-            checkpoint_path = checkpoints_dir / f"{run_id}_shard_{shard_id}.json"
-            shard_stats = await run_shard(
-                run_id, shard_id, shard_jobs, ctx, checkpoint_path, None
-            )
-            all_stats.extend(shard_stats)
-
-    # Write stats
-    stats_path = config.data_dir / "stats.jsonl"
-    write_stats_jsonl(all_stats, stats_path)
-
-    # Compute summary
-    summary = compute_run_summary(all_stats)
-    summary_path = config.data_dir / "run_summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-
-    # Cleanup
-    await http_client.aclose()
-    await robots_client._client.aclose()
+    try:
+        # --► SHARD PROCESSING
+        run_id = datetime.now(UTC).isoformat()
+        journal = CheckpointJournal(config.data_dir / "checkpoints.msgpack")
+
+        try:
+            if use_browser:
+                from tavily_scraper.pipelines.browser_fetcher import browser_pool
+
+                async with browser_pool(config, proxy_manager) as browser:
+                    all_stats = await _run_shards(jobs, run_id, ctx, journal, browser)
+            else:
+                all_stats = await _run_shards(jobs, run_id, ctx, journal, None)
+        finally:
+            journal.close()
+
+        # Write stats
+        stats_path = config.data_dir / f"stats.{config.stats_format}"
+        await asyncio.to_thread(write_stats, all_stats, stats_path)
+
+        # Compute summary
+        summary = compute_run_summary(all_stats)
+        summary_path = config.data_dir / "run_summary.json"
+        await asyncio.to_thread(write_run_summary, summary, summary_path)
+    finally:
+        # Cleanup
+        await asyncio.gather(robots_client.aclose(), http_client.aclose())
 
     return summary
 
@@ -408,7 +515,7 @@ async def main() -> None:
     print("\nResults:")
     print(f"  Total URLs processed: {summary['total_urls']}")
     print(
-        f"  Successful: {int(summary['total_urls'] * summary['success_rate'])}"
+        f"  Successful: {summary['success_count']}"
     )
     print(f"  Success rate: {summary['success_rate']:.2%}")
     print(f"  HTTP share: {summary['httpx_share']:.2%}")
@@ -420,4 +527,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    from tavily_scraper.utils.event_loop import install_event_loop
+
+    install_event_loop(load_run_config().event_loop)
     asyncio.run(main())
@@ -13,12 +13,24 @@ This module implements the fallback (slow path) browser fetching strategy with:
 from __future__ import annotations
 
 import asyncio
+import re
+import sys
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from time import perf_counter
 from urllib.parse import urlparse
 
-from playwright.async_api import Browser, Page, Request, Route, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Request,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+    async_playwright,
+)
 
 from tavily_scraper.config.constants import DEFAULT_MAX_CONTENT_BYTES
 from tavily_scraper.config.proxies import ProxyManager
@@ -31,6 +43,7 @@ from tavily_scraper.core.models import (
 )
 from tavily_scraper.utils.captcha import detect_captcha_http, detect_captcha_playwright
 from tavily_scraper.utils.logging import get_logger
+from tavily_scraper.utils.timing import backoff_delay
 
 logger = get_logger(__name__)
 
@@ -45,6 +58,50 @@ MAX_BROWSER_RETRIES: int = 1
 MAX_CONTENT_BYTES: int = DEFAULT_MAX_CONTENT_BYTES
 """Maximum content size in bytes before marking as 'too_large'."""
 
+MAX_CONTEXT_USES: int = 50
+"""Fetches served by one pooled BrowserContext before it is recycled."""
+
+MAX_WARM_CONTEXTS: int = 4
+"""Per-domain warm contexts kept by each pooled browser (LRU evicted)."""
+
+NAV_SETTLE_TIMEOUT_MS: int = 2_000
+"""Longest wait for a page to settle after an early navigation milestone."""
+
+BLOCKED_EXTENSIONS: frozenset[str] = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".svg"}  # images
+    | {".woff", ".woff2", ".ttf", ".otf", ".eot"}  # fonts
+    | {".mp4", ".webm", ".mov", ".m4v", ".mp3", ".m4a", ".ogg", ".wav"}  # media
+)
+"""URL path suffixes (any case) aborted by the resource blocking route."""
+
+_BLOCKED_ASSET_RE: re.Pattern[str] = re.compile(
+    r"^[^?#]*\.(?:"
+    + "|".join(sorted(ext[1:] for ext in BLOCKED_EXTENSIONS))
+    + r")(?:[?#]|$)",
+    re.IGNORECASE,
+)
+"""Path ending in a blocked extension; query and fragment ignored."""
+
+BLOCKING_LAUNCH_ARGS: tuple[str, ...] = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+    "--autoplay-policy=user-gesture-required",
+)
+"""
+Chromium switches that stop images, web fonts and autoplaying media
+inside the renderer, whatever their URL, so assets the driver-side
+regex cannot recognise (no extension) are still never downloaded.
+"""
+
+_UTF8_COUNT_CHUNK: int = 65_536
+"""Characters encoded per step when measuring non-ASCII content."""
+
+_PAGE_READY_JS: str = (
+    "() => document.readyState === 'complete'"
+    " || (document.body !== null && document.body.innerText.length > 500)"
+)
+"""Settled once loaded, or as soon as the body holds substantial text."""
+
 
 
 
@@ -74,6 +131,33 @@ async def browser_lifecycle(
         Browser is automatically closed when context exits,
         even if exceptions occur during usage.
     """
+    async with async_playwright() as p:
+        browser = await _launch_browser(p, run_config, proxy_manager)
+
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
+
+
+async def _launch_browser(
+    playwright: Playwright,
+    run_config: RunConfig,
+    proxy_manager: ProxyManager | None,
+) -> Browser:
+    """
+    Launch one headless Chromium with run-level proxy and stealth flags.
+
+    Args:
+        playwright: Started Playwright driver
+        run_config: Runtime configuration with browser settings
+        proxy_manager: Optional proxy manager for routing browser traffic
+
+    Returns:
+        Browser: Freshly launched browser instance
+    """
     proxy_dict = (
         proxy_manager.playwright_proxy() if proxy_manager is not None else None
     )
@@ -81,18 +165,223 @@ async def browser_lifecycle(
     launch_args = []
     if run_config.stealth_config and run_config.stealth_config.enabled:
         launch_args.append("--disable-blink-features=AutomationControlled")
+    if _blocks_resources(run_config):
+        launch_args.extend(BLOCKING_LAUNCH_ARGS)
+
+    return await playwright.chromium.launch(
+        headless=run_config.playwright_headless,
+        proxy=proxy_dict,  # type: ignore[arg-type]
+        args=launch_args,
+    )
+
+
+
+
+# ==== BROWSER POOL ==== #
+
+class BrowserPool:
+    """
+    Fixed-size pool of long-lived browsers shared across fallback fetches.
+
+    Browsers are launched lazily, on first demand, up to ``size`` and
+    then reused for the whole run, so the 1-2 s Chromium launch is paid
+    at most ``size`` times per run instead of per job. Checkout also
+    caps concurrent browser fetches at ``size``
+    (playwright_max_concurrency).
+
+    Each browser also keeps warm BrowserContexts, with the resource
+    blocking route already installed, keyed by domain. acquire_context()
+    hands the same context out again for the same host, so later
+    fetches reuse its open HTTP/2 connections, TLS sessions and cookies
+    and open and close only a Page. At most MAX_WARM_CONTEXTS domains
+    stay warm per browser (least recently used closed first), and a
+    context is recycled after MAX_CONTEXT_USES fetches to bound its
+    memory and cookie growth.
+
+    Attributes:
+        size: Maximum number of browsers (and concurrent checkouts)
+        _playwright: Started Playwright driver used for launches
+        _run_config: Runtime configuration with browser settings
+        _proxy_manager: Optional proxy manager for browser traffic
+        _browsers: Every browser launched so far
+        _idle: Browsers not currently checked out
+        _launching: Launches reserved but possibly still in progress
+        _contexts: Warm contexts of each browser by domain, oldest first
+        _context_uses: Fetches served by each live pooled context
+    """
+
+    def __init__(
+        self,
+        playwright: Playwright,
+        run_config: RunConfig,
+        proxy_manager: ProxyManager | None,
+        size: int,
+    ) -> None:
+        """
+        Initialize an empty pool; no browser is launched yet.
+
+        Args:
+            playwright: Started Playwright driver
+            run_config: Runtime configuration with browser settings
+            proxy_manager: Optional proxy manager for browser traffic
+            size: Maximum number of browsers (at least 1)
+        """
+        self.size = max(1, size)
+        self._playwright = playwright
+        self._run_config = run_config
+        self._proxy_manager = proxy_manager
+        self._browsers: list[Browser] = []
+        self._idle: asyncio.Queue[Browser] = asyncio.Queue()
+        self._launching = 0
+        self._contexts: dict[Browser, OrderedDict[str, BrowserContext]] = {}
+        self._context_uses: dict[BrowserContext, int] = {}
+
+
+
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Browser]:
+        """
+        Check out a browser for the duration of the ``async with`` block.
+
+        Yields:
+            Browser: Idle pooled browser, launched now if under ``size``
+
+        Note:
+            Callers must close the contexts they open; the browser
+            itself stays alive and returns to the pool on exit.
+        """
+        if self._idle.empty() and self._launching < self.size:
+            self._launching += 1
+            try:
+                browser = await _launch_browser(
+                    self._playwright, self._run_config, self._proxy_manager
+                )
+            except BaseException:
+                self._launching -= 1
+                raise
+            self._browsers.append(browser)
+        else:
+            browser = await self._idle.get()
+
+        try:
+            yield browser
+        finally:
+            self._idle.put_nowait(browser)
+
+
+
+
+    @asynccontextmanager
+    async def acquire_context(
+        self, domain: str = "default"
+    ) -> AsyncIterator[BrowserContext]:
+        """
+        Check out a browser together with its warm context for a domain.
+
+        Args:
+            domain: Host the fetch targets; fetches of the same host
+                share a context (default: "default")
+
+        Yields:
+            BrowserContext: Reused route-blocking context of the
+            checked-out browser for ``domain``, created now if the
+            browser has none
+
+        Note:
+            Callers open and close their own pages but must not close
+            the context. A context that closes anyway (crash, browser
+            disconnect) is forgotten and replaced on the next checkout.
+        """
+        async with self.acquire() as browser:
+            warm = self._contexts.setdefault(browser, OrderedDict())
+            context = warm.pop(domain, None)
+            if context is None or context not in self._context_uses:
+                context = await new_blocking_context(browser, self._run_config)
+                self._context_uses[context] = 0
+                context.once("close", self._forget_context)
+
+            try:
+                yield context
+            finally:
+                uses = self._context_uses.get(context)
+                if uses is not None:
+                    if uses + 1 >= MAX_CONTEXT_USES:
+                        del self._context_uses[context]
+                        await context.close()
+                    else:
+                        self._context_uses[context] = uses + 1
+                        warm[domain] = context
+                        if len(warm) > MAX_WARM_CONTEXTS:
+                            await self._evict(warm)
+
+
+
+
+    async def _evict(self, warm: OrderedDict[str, BrowserContext]) -> None:
+        """Close the least recently used warm context of a browser."""
+        _, context = warm.popitem(last=False)
+        self._context_uses.pop(context, None)
+        await context.close()
+
+
+
+
+    def _forget_context(self, context: BrowserContext) -> None:
+        """Drop a context that closed so it is never handed out again."""
+        self._context_uses.pop(context, None)
+
+
+
+
+    async def close(self) -> None:
+        """
+        Close every browser launched by the pool.
+
+        Returns:
+            None
+
+        Note:
+            Closing a browser also closes its pooled contexts.
+        """
+        self._contexts.clear()
+        self._context_uses.clear()
+        browsers, self._browsers = self._browsers, []
+        await asyncio.gather(
+            *(browser.close() for browser in browsers),
+            return_exceptions=True,
+        )
+
+
+
+
+@asynccontextmanager
+async def browser_pool(
+    run_config: RunConfig,
+    proxy_manager: ProxyManager | None,
+) -> AsyncIterator[BrowserPool]:
+    """
+    Manage a BrowserPool sized by ``playwright_max_concurrency``.
 
+    Args:
+        run_config: Runtime configuration with browser settings
+        proxy_manager: Optional proxy manager for routing browser traffic
+
+    Yields:
+        BrowserPool: Pool whose browsers are closed when the context exits
+    """
     async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=run_config.playwright_headless,
-            proxy=proxy_dict,  # type: ignore[arg-type]
-            args=launch_args,
+        pool = BrowserPool(
+            p,
+            run_config,
+            proxy_manager,
+            run_config.playwright_max_concurrency,
         )
 
         try:
-            yield browser
+            yield pool
         finally:
-            await browser.close()
+            await pool.close()
 
 
 
@@ -106,18 +395,48 @@ async def create_page_with_blocking(
     """
     Create browser page with aggressive resource blocking.
 
-    This function creates a new page with request interception
-    to block heavy static assets that aren't needed for content
-    extraction:
-    - Images (png, jpg, jpeg, gif, svg)
-    - Fonts (woff, woff2)
-    - Media (mp4, webm)
+    Opens a dedicated blocking context (see new_blocking_context) and
+    one page in it; closing the page's context is up to the caller.
 
     Args:
         browser: Playwright browser instance
+        run_config: Runtime configuration with stealth/session settings
 
     Returns:
         Page: Configured page with resource blocking enabled
+    """
+    context = await new_blocking_context(browser, run_config)
+    return await create_page(context, run_config)
+
+
+
+
+async def new_blocking_context(
+    browser: Browser,
+    run_config: RunConfig,
+) -> BrowserContext:
+    """
+    Create browser context with aggressive resource blocking.
+
+    The context gets the stealth fingerprint and stored session state
+    and a single request interception route that blocks heavy static
+    assets that aren't needed for content extraction, by URL path
+    suffix (BLOCKED_EXTENSIONS):
+    - Images (png, jpg, jpeg, gif, svg)
+    - Fonts (woff, woff2, ttf, otf, eot)
+    - Media (mp4, webm, mov, m4v, mp3, m4a, ogg, wav)
+
+    Extension-less images and web fonts are stopped in the renderer by
+    BLOCKING_LAUNCH_ARGS, which also keeps media from autoplaying;
+    extension-less media that is never played may still fetch its
+    metadata.
+
+    Args:
+        browser: Playwright browser instance
+        run_config: Runtime configuration with stealth/session settings
+
+    Returns:
+        BrowserContext: Context whose pages all share the blocking route
 
     Note:
         Blocking these resources significantly reduces:
@@ -175,46 +494,55 @@ async def create_page_with_blocking(
 
     context = await browser.new_context(**context_kwargs)  # type: ignore[arg-type]
 
-    async def route_handler(route: Route, request: Request) -> None:
-        """
-        Intercept and filter requests based on resource type.
+    # Block heavy static assets when allowed by stealth config. The
+    # regex is matched inside the Playwright driver, so only requests
+    # that will be aborted ever reach Python; everything else loads
+    # without a round trip.
+    if _blocks_resources(run_config):
+        await context.route(_BLOCKED_ASSET_RE, _abort_route)
 
-        Args:
-            route: Playwright route object
-            request: Playwright request object
+    return context
+
+
+
+
+def _blocks_resources(run_config: RunConfig) -> bool:
+    """Whether heavy static assets should be blocked for this run."""
+    return (
+        run_config.stealth_config is None
+        or run_config.stealth_config.block_resources
+    )
+
+
+
+
+async def _abort_route(route: Route, request: Request) -> None:
+    """
+    Abort a request matched by the resource blocking route.
+
+    Args:
+        route: Playwright route object
+        request: Playwright request object
+
+    Returns:
+        None
+    """
+    await route.abort()
 
-        Returns:
-            None
-        """
-        url = request.url
 
-        # Block heavy static assets when allowed by stealth config.
-        should_block = (
-            run_config.stealth_config is None
-            or run_config.stealth_config.block_resources
-        )
 
-        if should_block and any(
-            url.endswith(ext)
-            for ext in (
-                ".png",
-                ".jpg",
-                ".jpeg",
-                ".gif",
-                ".svg",
-                ".woff",
-                ".woff2",
-                ".mp4",
-                ".webm",
-                ".webm",
-            )
-        ):
-            await route.abort()
-            return
 
-        await route.continue_()
+async def create_page(context: BrowserContext, run_config: RunConfig) -> Page:
+    """
+    Open a page in a blocking context and apply per-page stealth.
+
+    Args:
+        context: Context from new_blocking_context
+        run_config: Runtime configuration with stealth settings
 
-    await context.route("**/*", route_handler)
+    Returns:
+        Page: New page ready for navigation
+    """
     page = await context.new_page()
 
     if run_config.stealth_config and run_config.stealth_config.enabled:
@@ -262,6 +590,38 @@ async def create_page_with_blocking(
 
 # ==== HELPER FUNCTIONS ==== #
 
+def utf8_len(text: str, limit: int) -> int:
+    """
+    Measure text's UTF-8 size without encoding it all at once.
+
+    Args:
+        text: Rendered page content
+        limit: Size beyond which the exact value no longer matters
+
+    Returns:
+        Exact UTF-8 byte length (undecodable code points skipped), or
+        some value above limit once the count exceeds it
+
+    Note:
+        ASCII text (most HTML) is measured by str.isascii() without any
+        allocation. Other text is encoded in _UTF8_COUNT_CHUNK-character
+        slices, so at most one slice's bytes exist at a time instead of
+        a second full copy of the page.
+    """
+    if text.isascii():
+        return len(text)
+
+    total = 0
+    for offset in range(0, len(text), _UTF8_COUNT_CHUNK):
+        chunk = text[offset : offset + _UTF8_COUNT_CHUNK]
+        total += len(chunk.encode("utf-8", errors="ignore"))
+        if total > limit:
+            break
+    return total
+
+
+
+
 async def _handle_captcha(
     page: Page,
     url: str,
@@ -277,14 +637,14 @@ async def _handle_captcha(
         (should_return, updated_content): If should_return is True, caller should return immediately.
     """
     detection = detect_captcha_http(
-        result.get("http_status") or 0,
+        result.http_status or 0,
         url,
         {},
         content,
     )
 
     if not detection["present"]:
-        detection = await detect_captcha_playwright(page)
+        detection = await detect_captcha_playwright(page, content)
 
     if not detection["present"]:
         return False, content
@@ -297,12 +657,11 @@ async def _handle_captcha(
         solved = await solver.solve(page)
 
     if not solved:
-        result["captcha_detected"] = True
-        result["status"] = "captcha_detected"
-        result["block_type"] = "captcha"  # type: ignore[typeddict-unknown-key]
-        result["block_vendor"] = detection["vendor"]  # type: ignore[typeddict-unknown-key]
-        ctx.scheduler.record_captcha(domain)
-        ctx.scheduler.release(domain)
+        result.captcha_detected = True
+        result.status = "captcha_detected"
+        result.block_type = "captcha"
+        result.block_vendor = detection["vendor"]
+        ctx.scheduler.record_captcha(domain, browser=True, congested=True)
         return True, content
     
     # If solved, re-extract content
@@ -315,39 +674,96 @@ async def _handle_navigation(
     url: str,
     ctx: RunnerContext,
     result: FetchResult,
-) -> bool:
-    """Handle browser navigation and stealth behavior. Returns True on success."""
-    try:
-        response = await page.goto(
-            url,
-            timeout=ctx.run_config.httpx_timeout_seconds * 1000,
-            wait_until="networkidle",
-        )
+) -> None:
+    """
+    Navigate to url, run behavioral stealth and classify the response.
 
-        # --► BEHAVIORAL STEALTH
-        if ctx.run_config.stealth_config and ctx.run_config.stealth_config.enabled:
-            if ctx.run_config.stealth_config.simulate_human_behavior:
-                from tavily_scraper.stealth.behavior import (
-                    human_mouse_move,
-                    human_scroll,
-                )
-                await human_mouse_move(page, config=ctx.run_config.stealth_config)
-                await human_scroll(page, config=ctx.run_config.stealth_config)
-
-        # --► RESPONSE STATUS CLASSIFICATION
-        if response:
-            result["http_status"] = response.status
-            result["status"] = (
-                "success" if 200 <= response.status < 400 else "http_error"
+    Raises:
+        playwright.async_api.Error: Navigation failed; a
+            PlaywrightTimeoutError marks the attempt as retriable
+
+    Note:
+        With an early wait_until ("commit" or "domcontentloaded") the
+        page then gets up to NAV_SETTLE_TIMEOUT_MS to finish loading or
+        render substantial text. Content is read either way, so ad and
+        tracker traffic never holds a fetch open the way networkidle did.
+    """
+    wait_until = ctx.run_config.nav_wait_until
+
+    response = await page.goto(
+        url,
+        timeout=ctx.run_config.httpx_timeout_seconds * 1000,
+        wait_until=wait_until,
+    )
+
+    if wait_until in ("commit", "domcontentloaded"):
+        try:
+            await page.wait_for_function(
+                _PAGE_READY_JS, timeout=NAV_SETTLE_TIMEOUT_MS
             )
-        else:
-            result["status"] = "http_error"
+        except PlaywrightTimeoutError:
+            pass
 
-        return True
+    # --► BEHAVIORAL STEALTH
+    if ctx.run_config.stealth_config and ctx.run_config.stealth_config.enabled:
+        if ctx.run_config.stealth_config.simulate_human_behavior:
+            from tavily_scraper.stealth.behavior import (
+                human_mouse_move,
+                human_scroll,
+            )
+            await human_mouse_move(page, config=ctx.run_config.stealth_config)
+            await human_scroll(page, config=ctx.run_config.stealth_config)
+
+    # --► RESPONSE STATUS CLASSIFICATION
+    if response:
+        result.http_status = response.status
+        result.status = (
+            "success" if 200 <= response.status < 400 else "http_error"
+        )
 
-    except Exception:
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > MAX_CONTENT_BYTES:
+            result.status = "too_large"
+    else:
+        result.status = "http_error"
+
+
+
+
+async def _open_page(
+    target: Browser | BrowserContext,
+    run_config: RunConfig,
+) -> Page:
+    """Open a page in a borrowed context, or in a new context on a browser."""
+    if isinstance(target, Browser):
+        return await create_page_with_blocking(target, run_config)
+    return await create_page(target, run_config)
+
+
+
+
+def _wants_content(result: FetchResult) -> bool:
+    """
+    Decide whether a navigated page is worth serializing.
+
+    Args:
+        result: Result after response classification
+
+    Returns:
+        False when the declared Content-Length already exceeds
+        MAX_CONTENT_BYTES or the server answered with a 5xx other than
+        503, so page.content() (a full DOM serialization) is skipped
+
+    Note:
+        503 bodies are kept: Cloudflare and similar vendors serve their
+        challenge pages with 503, and CAPTCHA detection needs them.
+    """
+    if result.status == "too_large":
         return False
 
+    status = result.http_status or 0
+    return not (result.status == "http_error" and status >= 500 and status != 503)
+
 
 
 
@@ -356,7 +772,7 @@ async def _handle_navigation(
 async def fetch_one(
     job: UrlJob,
     ctx: RunnerContext,
-    browser: Browser,
+    browser: Browser | BrowserPool,
 ) -> FetchResult:
     """
     Fetch a single URL using Playwright browser with retry logic.
@@ -365,7 +781,7 @@ async def fetch_one(
     1. Checks robots.txt compliance
     2. Creates page with resource blocking
     3. Acquires domain-level rate limit slot
-    4. Navigates to URL with networkidle wait
+    4. Navigates to URL, waiting for run_config.nav_wait_until
     5. Extracts rendered HTML content
     6. Detects CAPTCHAs in rendered content
     7. Handles errors with limited retry
@@ -373,29 +789,61 @@ async def fetch_one(
     Args:
         job: URL job to fetch
         ctx: Runner context with shared resources
-        browser: Playwright browser instance
+        browser: Playwright browser, or a pool to check one out from
 
     Returns:
         FetchResult containing status, content, and metadata
 
     Note:
         Browser fetches are expensive (CPU, memory, time).
-        Only one retry is attempted for timeouts.
+        Only one retry is attempted for timeouts. With a pool, pages
+        open in the browser's reused context for the URL's host; a bare
+        browser gets a fresh context per attempt that is closed with
+        its page.
+    """
+    if isinstance(browser, BrowserPool):
+        domain = urlparse(job.url).netloc or "default"
+        async with browser.acquire_context(domain) as context:
+            return await _fetch_in(job, ctx, context)
+
+    return await _fetch_in(job, ctx, browser)
+
+
+
+
+async def _fetch_in(
+    job: UrlJob,
+    ctx: RunnerContext,
+    target: Browser | BrowserContext,
+) -> FetchResult:
+    """
+    Run the fetch_one workflow with pages opened on target.
+
+    Args:
+        job: URL job to fetch
+        ctx: Runner context with shared resources
+        target: Borrowed context to open pages in, or a browser to open
+            an owned context (closed after each attempt) on
+
+    Returns:
+        FetchResult containing status, content, and metadata
     """
     result = make_initial_fetch_result(job, method="playwright", stage="fallback")
 
-    url = str(job["url"])
+    url = job.url
     parsed = urlparse(url)
-    domain = parsed.netloc
-    result["domain"] = domain
+    # Interned: one shared string per host across all results and
+    # scheduler/metrics dict keys instead of one copy per URL
+    domain = sys.intern(parsed.netloc)
+    result.domain = domain
 
     # --► ROBOTS.TXT COMPLIANCE CHECK
     can_fetch = await ctx.robots_client.can_fetch(url)
 
     if not can_fetch:
-        result["status"] = "robots_blocked"
-        result["robots_disallowed"] = True
-        result["block_type"] = "robots"  # type: ignore[typeddict-unknown-key]
+        result.status = "robots_blocked"
+        result.robots_disallowed = True
+        result.block_type = "robots"
         return result
 
     # --► RETRY LOOP WITH EXPONENTIAL BACKOFF
@@ -406,73 +854,72 @@ async def fetch_one(
         page: Page | None = None
 
         try:
-            page = await create_page_with_blocking(browser, ctx.run_config)
+            page = await _open_page(target, ctx.run_config)
 
-            await ctx.scheduler.acquire(domain)
-            start = perf_counter()
-
-            try:
-                # --► BROWSER NAVIGATION
+            async with ctx.scheduler.slot(domain):
                 start = perf_counter()
-                nav_success = await _handle_navigation(page, url, ctx, result)
-                elapsed_ms = int((perf_counter() - start) * 1000)
-                result["latency_ms"] = elapsed_ms
-
-                if not nav_success:
-                    raise Exception("Navigation failed")
-
-                # --► CONTENT EXTRACTION
-                content = await page.content()
-                result["content"] = content
-                result["content_len"] = len(
-                    content.encode("utf-8", errors="ignore")
-                )
 
-                # --► SIZE GUARDRAIL CHECK
-                if result["content_len"] > MAX_CONTENT_BYTES:
-                    result["status"] = "too_large"
-                    result["content"] = None
-                    ctx.scheduler.release(domain)
-                    return result
+                try:
+                    # --► BROWSER NAVIGATION
+                    await _handle_navigation(page, url, ctx, result)
+                    elapsed_ms = int((perf_counter() - start) * 1000)
+                    result.latency_ms = elapsed_ms
+
+                    if not _wants_content(result):
+                        return result
+
+                    # --► CONTENT EXTRACTION
+                    content = await page.content()
+                    result.content_len = utf8_len(content, MAX_CONTENT_BYTES)
+
+                    # --► SIZE GUARDRAIL CHECK
+                    if result.content_len > MAX_CONTENT_BYTES:
+                        result.status = "too_large"
+                        return result
+
+                    result.content = content
+
+                    # --► CAPTCHA DETECTION AND SOLVING
+                    should_return, content = await _handle_captcha(page, url, content, result, ctx, domain)
+                    if should_return:
+                        return result
+
+                    # A solved CAPTCHA yields the page behind it
+                    result.content = content
+                    result.content_len = utf8_len(content, MAX_CONTENT_BYTES)
+
+                # ⚠️ NAVIGATION ERROR HANDLING
+                except Exception as exc:
+                    elapsed_ms = int((perf_counter() - start) * 1000)
+                    result.latency_ms = elapsed_ms
+                    is_timeout = isinstance(exc, PlaywrightTimeoutError)
+                    result.status = "timeout" if is_timeout else "http_error"
+                    result.error_kind = type(exc).__name__
+                    result.error_message = str(exc)[:200]
+                    if is_timeout:
+                        ctx.scheduler.record_latency(
+                            domain, elapsed_ms, congested=True
+                        )
+
+                    # Retry only timeouts (once), after giving the slot back
+                    if not (is_timeout and attempt < MAX_BROWSER_RETRIES):
+                        ctx.scheduler.record_error(domain, browser=True)
+                        return result
 
-                # --► CAPTCHA DETECTION AND SOLVING
-                should_return, content = await _handle_captcha(page, url, content, result, ctx, domain)
-                if should_return:
-                    return result
-                
-                result["content"] = content
-                result["content_len"] = len(content.encode("utf-8", errors="ignore"))
-
-            # ⚠️ NAVIGATION ERROR HANDLING
-            except Exception as exc:
-                elapsed_ms = int((perf_counter() - start) * 1000)
-                result["latency_ms"] = elapsed_ms
-                is_timeout = "timeout" in str(exc).lower()
-                result["status"] = "timeout" if is_timeout else "http_error"
-                result["error_kind"] = type(exc).__name__
-                result["error_message"] = str(exc)[:200]
-
-                # Retry only timeouts (once)
-                if is_timeout and attempt < MAX_BROWSER_RETRIES:
                     attempt += 1
-                    result["retries"] = attempt
-                    ctx.scheduler.release(domain)
-                    await asyncio.sleep(backoff_base * (2 ** (attempt - 1)))
-                    continue
-
-                ctx.scheduler.record_error(domain)
+                    result.retries = attempt
 
-            finally:
-                ctx.scheduler.release(domain)
+                else:
+                    return result
 
-            return result
+            await asyncio.sleep(backoff_delay(attempt, backoff_base))
 
         # ⚠️ PAGE CREATION ERROR HANDLING
         except Exception as exc:
-            result["status"] = "http_error"
-            result["error_kind"] = type(exc).__name__
-            result["error_message"] = str(exc)[:200]
-            ctx.scheduler.record_error(domain)
+            result.status = "http_error"
+            result.error_kind = type(exc).__name__
+            result.error_message = str(exc)[:200]
+            ctx.scheduler.record_error(domain, browser=True)
             return result
 
         # --► RESOURCE CLEANUP
@@ -488,5 +935,5 @@ async def fetch_one(
                         logger.warning(f"Failed to save session: {e}")
 
                 await page.close()
-                if page.context:
+                if isinstance(target, Browser):
                     await page.context.close()
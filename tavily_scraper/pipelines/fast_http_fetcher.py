@@ -6,20 +6,30 @@ This module implements the primary (fast path) HTTP fetching strategy with:
 - User-Agent and Accept-Language rotation
 - Exponential backoff retry logic for transient errors
 - CAPTCHA detection and classification
-- Content size guardrails
+- Streamed body reads that stop at the content size guardrail
 - Robots.txt compliance
+- Reactive throttling from rate-limit response headers
+- Optional RFC 9111 response cache (hishel, SQLite-backed)
 """
 
 from __future__ import annotations
 
 import asyncio
 import random
+import re
+import sys
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
 from time import perf_counter
 from urllib.parse import urlparse
 
 import httpx
 
-from tavily_scraper.config.constants import DEFAULT_MAX_CONTENT_BYTES
+from tavily_scraper.config.constants import (
+    DEFAULT_CACHE_FILENAME,
+    DEFAULT_MAX_CONTENT_BYTES,
+)
 from tavily_scraper.config.proxies import ProxyManager
 from tavily_scraper.core.models import (
     FetchResult,
@@ -29,6 +39,7 @@ from tavily_scraper.core.models import (
     make_initial_fetch_result,
 )
 from tavily_scraper.utils.parsing import extract_visible_text_lower
+from tavily_scraper.utils.timing import backoff_delay
 
 # ==== USER AGENT ROTATION POOL ==== #
 
@@ -73,9 +84,134 @@ HTTP status codes considered transient and worth retrying.
 - 429: Too Many Requests (rate limit)
 """
 
+CONGESTION_ERRORS: tuple[type[httpx.HTTPError], ...] = (
+    httpx.TimeoutException,
+    httpx.RemoteProtocolError,
+    httpx.ReadError,
+    httpx.WriteError,
+)
+"""
+Transport errors treated as congestion by the adaptive concurrency gate.
+
+Timeouts and connection resets signal overload; DNS or TLS failures
+do not, so they leave the concurrency limit untouched.
+"""
+
 MAX_CONTENT_BYTES: int = DEFAULT_MAX_CONTENT_BYTES
 """Maximum content size in bytes before marking as 'too_large'."""
 
+CONNECT_TIMEOUT_SECONDS: float = 5.0
+"""Connect/write timeout cap; reads use httpx_timeout_seconds."""
+
+
+
+
+# ==== RATE-LIMIT HEADER PARSING ==== #
+
+MAX_RATE_LIMIT_DELAY_SECONDS: float = 60.0
+"""Upper bound on any header-driven per-domain pause."""
+
+_REMAINING_HEADERS: tuple[str, ...] = (
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Remaining-Requests",
+    "RateLimit-Remaining",
+)
+_LIMIT_HEADERS: tuple[str, ...] = (
+    "X-RateLimit-Limit",
+    "X-RateLimit-Limit-Requests",
+    "RateLimit-Limit",
+)
+_RESET_HEADERS: tuple[str, ...] = (
+    "X-RateLimit-Reset",
+    "X-RateLimit-Reset-Requests",
+    "RateLimit-Reset",
+)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS: dict[str, float] = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+
+
+def _first_header(headers: Mapping[str, str], names: tuple[str, ...]) -> str | None:
+    """Return the first present header value among names."""
+    for name in names:
+        value = headers.get(name)
+        if value:
+            return value.strip()
+    return None
+
+
+
+
+def _parse_seconds(value: str) -> float | None:
+    """
+    Parse a delay expressed as seconds, epoch seconds or a duration.
+
+    Accepts "30", "1.5", "1700000000" (epoch), "6m0s" / "250ms"
+    (duration) and HTTP-dates as used by Retry-After.
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Seconds from now (may be <= 0), or None if unparseable
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        parts = _DURATION_PART.findall(value)
+        if parts:
+            return sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+
+    # Large values are absolute epoch timestamps rather than deltas
+    return number - time.time() if number > 1_000_000_000 else number
+
+
+
+
+def rate_limit_delay(headers: Mapping[str, str], floor: int) -> float:
+    """
+    Compute how long to pause a domain based on rate-limit headers.
+
+    Retry-After always wins. Otherwise, when the remaining request budget
+    drops to max(floor, 10% of the limit), the domain is paused until
+    the advertised reset.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+        floor: Remaining-request count at or below which to pause
+
+    Returns:
+        Delay in seconds (0.0 when no pause is needed), capped at
+        MAX_RATE_LIMIT_DELAY_SECONDS
+    """
+    delay: float | None = None
+    retry_after = headers.get("Retry-After")
+
+    if retry_after:
+        delay = _parse_seconds(retry_after.strip())
+    else:
+        remaining_raw = _first_header(headers, _REMAINING_HEADERS)
+        if remaining_raw is None or not remaining_raw.isdigit():
+            return 0.0
+
+        limit_raw = _first_header(headers, _LIMIT_HEADERS)
+        limit = int(limit_raw) if limit_raw and limit_raw.isdigit() else 0
+        if int(remaining_raw) > max(floor, limit // 10):
+            return 0.0
+
+        reset_raw = _first_header(headers, _RESET_HEADERS)
+        delay = _parse_seconds(reset_raw) if reset_raw else None
+
+    if delay is None or delay <= 0:
+        return 0.0
+    return min(delay, MAX_RATE_LIMIT_DELAY_SECONDS)
+
 
 
 
@@ -118,13 +254,34 @@ def make_http_client(
         Client is configured with:
         - HTTP/2 support enabled
         - Automatic redirect following
-        - Configurable timeout
-        - Connection pooling based on concurrency limits
+        - Configurable read timeout, 5 s connect/write, no pool timeout
+        - Connection pooling sized for the adaptive concurrency ceiling,
+          with httpx_max_keepalive idle connections kept for reuse
         - Optional proxy routing
+        - Optional on-disk response cache when cache_ttl_seconds > 0
     """
     proxy = proxy_manager.httpx_proxy() if proxy_manager is not None else None
-    timeout = httpx.Timeout(run_config.httpx_timeout_seconds)
-    limits = httpx.Limits(max_connections=run_config.httpx_max_concurrency * 2)
+    # Fail dead hosts fast on connect; never time out waiting for a pooled
+    # connection, since the concurrency gate already bounds the queue and
+    # a pool wait is not an origin timeout (it would mislead AIMD)
+    read_timeout = float(run_config.httpx_timeout_seconds)
+    timeout = httpx.Timeout(
+        read_timeout,
+        connect=min(CONNECT_TIMEOUT_SECONDS, read_timeout),
+        write=min(CONNECT_TIMEOUT_SECONDS, read_timeout),
+        pool=None,
+    )
+    limits = httpx.Limits(
+        max_connections=run_config.concurrency_max * 2,
+        max_keepalive_connections=run_config.httpx_max_keepalive,
+    )
+
+    if run_config.cache_ttl_seconds > 0:
+        return httpx.AsyncClient(
+            transport=_make_cache_transport(run_config, limits, proxy),
+            follow_redirects=True,
+            timeout=timeout,
+        )
 
     return httpx.AsyncClient(
         http2=True,
@@ -138,8 +295,175 @@ def make_http_client(
 
 
 
+def _make_cache_transport(
+    run_config: RunConfig,
+    limits: httpx.Limits,
+    proxy: str | None,
+) -> httpx.AsyncBaseTransport:
+    """
+    Wrap the network transport in a hishel HTTP cache.
+
+    Cached responses are reused while fresh per Cache-Control and
+    revalidated with ETag/Last-Modified (a 304 instead of a full body)
+    once stale. Entries are dropped after cache_ttl_seconds.
+
+    Args:
+        run_config: Runtime configuration with cache settings
+        limits: Connection pool limits for the network transport
+        proxy: Optional proxy URL
+
+    Returns:
+        Caching transport delegating misses to an HTTP/2 transport
+    """
+    import hishel
+    from hishel.httpx import AsyncCacheTransport
+
+    cache_path = run_config.cache_path or (
+        run_config.data_dir / DEFAULT_CACHE_FILENAME
+    )
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    network = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=limits,
+        proxy=proxy,
+        verify=False,  # Match the uncached client
+    )
+    return AsyncCacheTransport(
+        next_transport=network,
+        storage=hishel.AsyncSqliteStorage(
+            database_path=cache_path,
+            default_ttl=float(run_config.cache_ttl_seconds),
+        ),
+    )
+
+
+
+
 # ==== PRIMARY HTTP FETCH LOGIC ==== #
 
+def _observe_response(
+    ctx: RunnerContext,
+    domain: str,
+    resp: httpx.Response,
+    elapsed_ms: int,
+) -> bool:
+    """
+    Feed a response into load control and reactive throttling.
+
+    Args:
+        ctx: Runner context with scheduler and concurrency gate
+        domain: Domain the response came from
+        resp: Received response
+        elapsed_ms: Attempt latency in milliseconds
+
+    Returns:
+        True if the response was served from the HTTP cache
+
+    Note:
+        Cache hits say nothing about origin load or rate limits and
+        are ignored. Retries wait on any deadline set here.
+    """
+    if resp.extensions.get("hishel_from_cache"):
+        return True
+
+    _record_load(
+        ctx,
+        domain,
+        elapsed_ms,
+        congested=resp.status_code == 429 or resp.status_code >= 500,
+    )
+
+    pause = rate_limit_delay(resp.headers, ctx.run_config.rate_limit_floor)
+    if pause:
+        ctx.scheduler.record_throttle(domain, pause)
+
+    return False
+
+
+
+
+async def _read_body_capped(
+    resp: httpx.Response,
+    limit: int,
+    chunk_size: int,
+) -> tuple[bytearray | None, int]:
+    """
+    Read a streamed response body, giving up once it exceeds ``limit``.
+
+    Args:
+        resp: Response opened with ``stream=True``
+        limit: Maximum decoded body size in bytes
+        chunk_size: Bytes requested per read
+
+    Returns:
+        Tuple of (body, size); body is None when the declared
+        Content-Length or the bytes received exceed the limit
+
+    Note:
+        Oversized bodies are abandoned mid-stream, so at most
+        ``limit + chunk_size`` bytes are ever held per request.
+    """
+    declared = resp.headers.get("Content-Length", "")
+    if declared.isdigit() and int(declared) > limit:
+        return None, int(declared)
+
+    body = bytearray()
+    async for chunk in resp.aiter_bytes(chunk_size):
+        body += chunk
+        if len(body) > limit:
+            return None, len(body)
+
+    return body, len(body)
+
+
+
+
+def _decode_body(body: bytearray, encoding: str | None) -> str:
+    """
+    Decode a response body like ``httpx.Response.text``.
+
+    Args:
+        body: Raw (content-decoded) body bytes
+        encoding: Charset from the response, if any
+
+    Returns:
+        Decoded text; unknown charsets fall back to lossy UTF-8
+    """
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="ignore")
+
+
+
+
+def _record_load(
+    ctx: RunnerContext,
+    domain: str,
+    latency_ms: int,
+    *,
+    congested: bool,
+) -> None:
+    """
+    Report one attempt's outcome to the global and per-domain AIMD gates.
+
+    Args:
+        ctx: Runner context (global gate may be absent)
+        domain: Domain the attempt targeted
+        latency_ms: Attempt latency in milliseconds
+        congested: Whether the attempt signalled overload
+
+    Returns:
+        None
+    """
+    if ctx.concurrency is not None:
+        ctx.concurrency.record(latency_ms, congested=congested)
+    ctx.scheduler.record_latency(domain, latency_ms, congested=congested)
+
+
+
+
 async def fetch_one(job: UrlJob, ctx: RunnerContext) -> FetchResult:
     """
     Fetch a single URL using HTTP client with retry logic.
@@ -165,18 +489,20 @@ async def fetch_one(job: UrlJob, ctx: RunnerContext) -> FetchResult:
     """
     result = make_initial_fetch_result(job, method="httpx", stage="primary")
 
-    url = str(job["url"])
+    url = job.url
     parsed = urlparse(url)
-    domain = parsed.netloc
-    result["domain"] = domain
+    # Interned: one shared string per host across all results and
+    # scheduler/metrics dict keys instead of one copy per URL
+    domain = sys.intern(parsed.netloc)
+    result.domain = domain
 
     # --► ROBOTS.TXT COMPLIANCE CHECK
     can_fetch = await ctx.robots_client.can_fetch(url, user_agent=USER_AGENTS[0])
 
     if not can_fetch:
-        result["status"] = "robots_blocked"
-        result["robots_disallowed"] = True
-        result["block_type"] = "robots"  # type: ignore[typeddict-unknown-key]
+        result.status = "robots_blocked"
+        result.robots_disallowed = True
+        result.block_type = "robots"
         return result
 
     # --► RETRY LOOP WITH EXPONENTIAL BACKOFF
@@ -184,125 +510,140 @@ async def fetch_one(job: UrlJob, ctx: RunnerContext) -> FetchResult:
     backoff_base = 0.5
 
     while True:
-        await ctx.scheduler.acquire(domain)
-        start = perf_counter()
-
-        try:
-            resp = await ctx.http_client.get(url, headers=build_headers())
+        async with ctx.scheduler.slot(domain):
+            start = perf_counter()
 
-        # ⚠️ TIMEOUT EXCEPTION HANDLING
-        except httpx.TimeoutException as exc:
-            elapsed_ms = int((perf_counter() - start) * 1000)
-            result["latency_ms"] = elapsed_ms
-            result["status"] = "timeout"
-            result["error_kind"] = "Timeout"
-            result["error_message"] = str(exc)[:200]
+            try:
+                resp = await ctx.http_client.send(
+                    ctx.http_client.build_request("GET", url, headers=build_headers()),
+                    stream=True,
+                )
+                try:
+                    raw, size = await _read_body_capped(
+                        resp,
+                        MAX_CONTENT_BYTES,
+                        ctx.run_config.stream_chunk_bytes,
+                    )
+                finally:
+                    await resp.aclose()
+
+            # ⚠️ TIMEOUT EXCEPTION HANDLING
+            except httpx.TimeoutException as exc:
+                elapsed_ms = int((perf_counter() - start) * 1000)
+                result.latency_ms = elapsed_ms
+                result.status = "timeout"
+                result.error_kind = "Timeout"
+                result.error_message = str(exc)[:200]
+                _record_load(ctx, domain, elapsed_ms, congested=True)
+
+                if attempt >= MAX_HTTP_RETRIES:
+                    ctx.scheduler.record_error(domain)
+                    return result
 
-            if attempt < MAX_HTTP_RETRIES:
                 attempt += 1
-                result["retries"] = attempt
-                ctx.scheduler.release(domain)
-                await asyncio.sleep(backoff_base * (2 ** (attempt - 1)))
-                continue
-
-            ctx.scheduler.record_error(domain)
-            ctx.scheduler.release(domain)
-            return result
-
-        # ⚠️ HTTP ERROR EXCEPTION HANDLING
-        except httpx.HTTPError as exc:
-            elapsed_ms = int((perf_counter() - start) * 1000)
-            result["latency_ms"] = elapsed_ms
-            result["status"] = "http_error"
-            result["error_kind"] = type(exc).__name__
-            result["error_message"] = str(exc)[:200]
-
-            ctx.scheduler.record_error(domain)
-            ctx.scheduler.release(domain)
-            return result
-
-        # ⚠️ CATCH-ALL FOR PROXY AND UNEXPECTED ERRORS
-        except Exception as exc:
-            elapsed_ms = int((perf_counter() - start) * 1000)
-            result["latency_ms"] = elapsed_ms
-            result["status"] = "http_error"
-            result["error_kind"] = type(exc).__name__
-            result["error_message"] = str(exc)[:200]
-
-            ctx.scheduler.record_error(domain)
-            ctx.scheduler.release(domain)
-            return result
-
-        # --► SUCCESSFUL RESPONSE PROCESSING
-        else:
-            elapsed_ms = int((perf_counter() - start) * 1000)
-            result["latency_ms"] = elapsed_ms
-            result["http_status"] = resp.status_code
-            result["status"] = (
-                "success" if 200 <= resp.status_code < 400 else "http_error"
-            )
-
-            content_type = resp.headers.get("Content-Type", "")
-
-            # --► CONTENT EXTRACTION WITH FALLBACK
-            try:
-                body = resp.text
-            except Exception:
-                body = resp.content.decode("utf-8", errors="ignore")
-
-            result["content_len"] = len(body.encode("utf-8", errors="ignore"))
-            result["encoding"] = resp.encoding
-
-            # --► SIZE GUARDRAIL CHECK
-            if result["content_len"] > MAX_CONTENT_BYTES:
-                result["status"] = "too_large"
-                result["content"] = None
-                ctx.scheduler.release(domain)
+                result.retries = attempt
+
+            # ⚠️ HTTP ERROR EXCEPTION HANDLING
+            except httpx.HTTPError as exc:
+                elapsed_ms = int((perf_counter() - start) * 1000)
+                result.latency_ms = elapsed_ms
+                result.status = "http_error"
+                result.error_kind = type(exc).__name__
+                result.error_message = str(exc)[:200]
+                _record_load(
+                    ctx,
+                    domain,
+                    elapsed_ms,
+                    congested=isinstance(exc, CONGESTION_ERRORS),
+                )
+
+                ctx.scheduler.record_error(domain)
                 return result
 
-            # --► HTML CONTENT PROCESSING
-            if "text/html" in content_type or "application/xhtml+xml" in content_type:
-                result["content"] = body
+            # ⚠️ CATCH-ALL FOR PROXY AND UNEXPECTED ERRORS
+            except Exception as exc:
+                elapsed_ms = int((perf_counter() - start) * 1000)
+                result.latency_ms = elapsed_ms
+                result.status = "http_error"
+                result.error_kind = type(exc).__name__
+                result.error_message = str(exc)[:200]
 
-                # --► CAPTCHA DETECTION
-                from tavily_scraper.utils.captcha import detect_captcha_http
+                ctx.scheduler.record_error(domain)
+                return result
 
-                detection = detect_captcha_http(
-                    resp.status_code,
-                    str(resp.url),
-                    dict(resp.headers),
-                    body,
+            # --► SUCCESSFUL RESPONSE PROCESSING
+            else:
+                elapsed_ms = int((perf_counter() - start) * 1000)
+                result.latency_ms = elapsed_ms
+                result.http_status = resp.status_code
+                result.status = (
+                    "success" if 200 <= resp.status_code < 400 else "http_error"
                 )
+                result.from_cache = _observe_response(ctx, domain, resp, elapsed_ms)
+
+                content_type = resp.headers.get("Content-Type", "")
+                result.content_len = size
+                result.encoding = resp.encoding
 
-                if detection["present"]:
-                    result["captcha_detected"] = True
-                    result["status"] = "captcha_detected"
-                    result["block_type"] = "captcha"  # type: ignore[typeddict-unknown-key]
-                    result["block_vendor"] = detection["vendor"]  # type: ignore[typeddict-unknown-key]
-                    ctx.scheduler.record_captcha(domain)
-                    ctx.scheduler.release(domain)
+                # --► SIZE GUARDRAIL CHECK
+                if raw is None:
+                    result.status = "too_large"
+                    result.content = None
                     return result
-            else:
-                result["content"] = None
-
-            # --► TRANSIENT ERROR RETRY LOGIC
-            if (
-                result["status"] == "http_error"
-                and result.get("http_status") in TRANSIENT_STATUS_CODES
-                and attempt < MAX_HTTP_RETRIES
-            ):
-                attempt += 1
-                result["retries"] = attempt
-                ctx.scheduler.release(domain)
-                await asyncio.sleep(backoff_base * (2 ** (attempt - 1)))
-                continue
 
-            # --► FINAL STATUS CLASSIFICATION
-            if result["status"] == "http_error":
-                ctx.scheduler.record_error(domain)
+                # --► CONTENT DECODING
+                body = _decode_body(raw, resp.encoding)
+
+                # --► HTML CONTENT PROCESSING
+                if "text/html" in content_type or "application/xhtml+xml" in content_type:
+                    result.content = body
+
+                    # --► CAPTCHA DETECTION
+                    from tavily_scraper.utils.captcha import detect_captcha_http
+
+                    detection = detect_captcha_http(
+                        resp.status_code,
+                        str(resp.url),
+                        dict(resp.headers),
+                        body,
+                    )
+
+                    if detection["present"]:
+                        result.captcha_detected = True
+                        result.status = "captcha_detected"
+                        result.block_type = "captcha"
+                        result.block_vendor = detection["vendor"]
+                        # A challenge is an early overload signal unless
+                        # _observe_response() already counted the reply
+                        # (429/5xx) or skipped it (cache hit)
+                        ctx.scheduler.record_captcha(
+                            domain,
+                            congested=not (
+                                result.from_cache
+                                or resp.status_code == 429
+                                or resp.status_code >= 500
+                            ),
+                        )
+                        return result
+                else:
+                    result.content = None
+
+                # --► TRANSIENT ERROR RETRY LOGIC
+                if not (
+                    result.status == "http_error"
+                    and result.http_status in TRANSIENT_STATUS_CODES
+                    and attempt < MAX_HTTP_RETRIES
+                ):
+                    # --► FINAL STATUS CLASSIFICATION
+                    if result.status == "http_error":
+                        ctx.scheduler.record_error(domain, result.http_status)
+                    return result
+
+                attempt += 1
+                result.retries = attempt
 
-            ctx.scheduler.release(domain)
-            return result
+        # Retries back off only after the slot has been given back
+        await asyncio.sleep(backoff_delay(attempt, backoff_base))
 
 
 
@@ -328,13 +669,13 @@ def looks_incomplete_http(result: FetchResult) -> bool:
         Only inspects successful HTTP responses. Errors are
         handled separately by the router logic.
     """
-    if result.get("status") != "success":
+    if result.status != "success":
         return False
 
-    if result.get("content_len", 0) < 1024:
+    if result.content_len < 1024:
         return True
 
-    html = result.get("content") or ""
+    html = result.content or ""
     # Use Selectolax to inspect visible text only (script/style excluded).
     lower = extract_visible_text_lower(html) if html else ""
 
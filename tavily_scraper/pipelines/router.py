@@ -13,13 +13,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from urllib.parse import urlsplit, urlunsplit
 
-from tavily_scraper.core.models import FetchResult, RunnerContext, UrlJob
+from tavily_scraper.core.models import (
+    FetchResult,
+    RunnerContext,
+    UrlJob,
+    release_fetch_result,
+)
 from tavily_scraper.pipelines.fast_http_fetcher import fetch_one, looks_incomplete_http
 from tavily_scraper.utils.logging import get_logger
 
 if TYPE_CHECKING:
     from playwright.async_api import Browser
 
+    from tavily_scraper.pipelines.browser_fetcher import BrowserPool
+
 
 logger = get_logger(__name__)
 
@@ -51,7 +58,7 @@ def needs_browser(result: FetchResult) -> bool:
         are expensive, so we only retry when there's a reasonable
         chance of success.
     """
-    status = result.get("status")
+    status = result.status
 
     # --► NEVER RETRY CONDITIONS
     # Robots blocks and CAPTCHAs won't improve with browser
@@ -70,7 +77,7 @@ def needs_browser(result: FetchResult) -> bool:
 
     # --► SELECTIVE HTTP ERROR RETRY
     if status == "http_error":
-        http_status = result.get("http_status") or 0
+        http_status = result.http_status or 0
 
         # These status codes are almost never improved by JavaScript:
         # - 401: Authentication required (credentials needed)
@@ -96,7 +103,7 @@ def needs_browser(result: FetchResult) -> bool:
 async def route_and_fetch(
     job: UrlJob,
     ctx: RunnerContext,
-    browser: Browser | None = None,
+    browser: Browser | BrowserPool | None = None,
 ) -> FetchResult:
     """
     Route URL through HTTP-first strategy with optional browser fallback.
@@ -110,7 +117,7 @@ async def route_and_fetch(
     Args:
         job: URL job to process
         ctx: Runner context with shared resources
-        browser: Optional Playwright browser instance
+        browser: Optional Playwright browser or browser pool
 
     Returns:
         FetchResult from either HTTP or browser attempt
@@ -118,7 +125,7 @@ async def route_and_fetch(
     Note:
         Browser fallback is only attempted if:
         - needs_browser() returns True
-        - Browser instance is provided
+        - Browser or browser pool is provided
         - Domain hasn't exceeded browser attempt limits
     """
     # --► PRIMARY HTTP ATTEMPT
@@ -126,16 +133,20 @@ async def route_and_fetch(
 
     # --► BROWSER FALLBACK DECISION
     if needs_browser(result):
-        domain = result.get("domain", "")
-
-        # Check domain-level browser attempt limits
-        domain_ok_for_browser = (
-            not domain or ctx.scheduler.should_try_browser(domain)
-        )
+        domain = result.domain
+
+        # Check domain-level browser attempt limits, only when a browser
+        # can run: past the cool-down, should_try_browser() hands out the
+        # breaker's single half-open probe (None = not checked)
+        domain_ok_for_browser: bool | None = None
+        if browser is not None:
+            domain_ok_for_browser = (
+                not domain or ctx.scheduler.should_try_browser(domain)
+            )
 
         # --► URL SANITIZATION FOR LOGGING
         # Strip query/fragment and truncate for safe logging
-        raw_url = str(job["url"])
+        raw_url = job.url
         parts = urlsplit(raw_url)
         safe_url = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
         safe_url = safe_url[:80]
@@ -145,19 +156,25 @@ async def route_and_fetch(
             logger.info(
                 "Browser fallback for %s (status=%s)",
                 safe_url,
-                result.get("status"),
+                result.status,
             )
 
             from tavily_scraper.pipelines import browser_fetcher
 
+            # The HTTP attempt is superseded; recycle it for the fallback
+            release_fetch_result(result)
             result = await browser_fetcher.fetch_one(job, ctx, browser)
+            if result.status == "success" and domain:
+                # Closes a half-open breaker after a successful probe
+                ctx.scheduler.record_success(domain)
 
         else:
             logger.debug(
                 "Browser needed but not used for %s "
-                "(status=%s, domain_ok_for_browser=%s)",
+                "(status=%s, has_browser=%s, domain_ok_for_browser=%s)",
                 safe_url,
-                result.get("status"),
+                result.status,
+                browser is not None,
                 domain_ok_for_browser,
             )
 
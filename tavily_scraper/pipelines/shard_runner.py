@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import asyncio
 from datetime import UTC, datetime
-from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING
 
 from playwright.async_api import Browser
 
+from tavily_scraper.core.concurrency import AdaptiveConcurrency
 from tavily_scraper.core.models import (
     FetchResult,
     RunnerContext,
@@ -16,9 +16,13 @@ from tavily_scraper.core.models import (
     UrlJob,
     UrlStats,
     fetch_result_to_url_stats,
+    release_fetch_result,
 )
 from tavily_scraper.pipelines.router import route_and_fetch
-from tavily_scraper.utils.io import load_checkpoint, save_checkpoint
+
+if TYPE_CHECKING:
+    from tavily_scraper.pipelines.browser_fetcher import BrowserPool
+    from tavily_scraper.utils.io import CheckpointJournal
 
 
 async def run_shard(
@@ -26,8 +30,8 @@ async def run_shard(
     shard_id: int,
     jobs: list[UrlJob],
     ctx: RunnerContext,
-    checkpoint_path: Path,
-    browser: Browser | None = None,
+    journal: CheckpointJournal,
+    browser: Browser | BrowserPool | None = None,
 ) -> list[UrlStats]:
     """
     Process a single shard of URL jobs with checkpoint support.
@@ -37,14 +41,18 @@ async def run_shard(
         shard_id: Shard number
         jobs: List of URL jobs in this shard
         ctx: Runner context with shared resources
-        checkpoint_path: Path to checkpoint file
-        browser: Optional browser instance for fallback
+        journal: Run-wide checkpoint journal
+        browser: Optional browser or browser pool for fallback
 
     Returns:
         List of URL statistics for processed jobs
+
+    Note:
+        Progress updates are batched by the journal; only the shard's
+        completion is synced to disk immediately.
     """
-    existing = load_checkpoint(checkpoint_path)
-    if existing and existing.get("status") == "completed":
+    existing = journal.get(run_id, shard_id)
+    if existing and existing["status"] == "completed":
         return []
 
     checkpoint: ShardCheckpoint = {
@@ -55,27 +63,32 @@ async def run_shard(
         "last_updated_at": datetime.now(UTC).isoformat(),
         "status": "in_progress",
     }
-    save_checkpoint(cast(dict[str, Any], checkpoint), checkpoint_path)
+    journal.record(checkpoint)
 
-    semaphore = asyncio.Semaphore(ctx.run_config.httpx_max_concurrency)
+    gate = (
+        ctx.concurrency
+        if ctx.concurrency is not None
+        else AdaptiveConcurrency.from_config(ctx.run_config)
+    )
     results: list[UrlStats] = []
 
     async def _process_job(job: UrlJob) -> None:
         nonlocal checkpoint
-        async with semaphore:
+        async with gate:
             fetch_result: FetchResult = await route_and_fetch(job, ctx, browser)
             stats = fetch_result_to_url_stats(fetch_result)
+            release_fetch_result(fetch_result)
             results.append(stats)
 
             checkpoint["urls_done"] += 1
             checkpoint["last_updated_at"] = datetime.now(UTC).isoformat()
-            save_checkpoint(cast(dict[str, Any], checkpoint), checkpoint_path)
+            journal.record(checkpoint)
 
     await asyncio.gather(*(_process_job(job) for job in jobs))
 
     checkpoint["status"] = "completed"
     checkpoint["last_updated_at"] = datetime.now(UTC).isoformat()
-    save_checkpoint(cast(dict[str, Any], checkpoint), checkpoint_path)
+    journal.record(checkpoint, durable=True)
 
     return results
 
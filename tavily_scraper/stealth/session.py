@@ -1,11 +1,11 @@
 """
 Session management for persisting browser state (cookies, storage) across runs.
 """
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+import orjson
 from playwright.async_api import BrowserContext
 
 logger = logging.getLogger(__name__)
@@ -37,8 +37,7 @@ class SessionManager:
             
             # Atomic write
             temp_path = path.with_suffix(".tmp")
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+            temp_path.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
             temp_path.replace(path)
             
             logger.info(f"Saved session '{session_id}' to {path}")
@@ -59,8 +58,7 @@ class SessionManager:
             return None
 
         try:
-            with open(path, encoding="utf-8") as f:
-                state: dict[str, Any] = json.load(f)
+            state: dict[str, Any] = orjson.loads(path.read_bytes())
             logger.info(f"Loaded session '{session_id}' from {path}")
             return state
         except Exception as e:
@@ -80,8 +78,9 @@ class SessionManager:
         try:
             path = self._get_profile_path(session_id)
             temp_path = path.with_suffix(".tmp")
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(profile_data, f, indent=2)
+            temp_path.write_bytes(
+                orjson.dumps(profile_data, option=orjson.OPT_INDENT_2)
+            )
             temp_path.replace(path)
             logger.info(f"Saved profile for '{session_id}'")
         except Exception as e:
@@ -97,9 +96,8 @@ class SessionManager:
             return None
             
         try:
-            with open(path, encoding="utf-8") as f:
-                profile: dict[str, Any] = json.load(f)
-                return profile
+            profile: dict[str, Any] = orjson.loads(path.read_bytes())
+            return profile
         except Exception as e:
             logger.warning(f"Failed to load profile for '{session_id}': {e}")
             return None
@@ -207,7 +207,10 @@ def is_captcha_page(content: str | None) -> bool:
     return detection["present"]
 
 
-async def detect_captcha_playwright(page) -> CaptchaDetection:  # type: ignore[no-untyped-def]
+async def detect_captcha_playwright(  # type: ignore[no-untyped-def]
+    page,
+    content: str | None = None,
+) -> CaptchaDetection:
     """
     Detect CAPTCHA from Playwright page after JS execution.
 
@@ -218,12 +221,16 @@ async def detect_captcha_playwright(page) -> CaptchaDetection:  # type: ignore[n
 
     Args:
         page: Playwright Page object
+        content: Already serialized page HTML, if the caller has it;
+            saves a second page.content() round trip
 
     Returns:
         CaptchaDetection with presence, vendor, confidence, and reason
     """
     url = page.url
-    content = (await page.content()).lower()
+    if content is None:
+        content = await page.content()
+    content = content.lower()
     frames = page.frames
 
     vendor: CaptchaVendor | None = None
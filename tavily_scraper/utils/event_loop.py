@@ -0,0 +1,47 @@
+"""
+Event loop selection for the scraper entry points.
+
+This module provides:
+- Installation of uvloop as the asyncio event loop policy
+- Graceful fallback to the stock asyncio loop where uvloop is unavailable
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from tavily_scraper.config.constants import EventLoop
+from tavily_scraper.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# ==== EVENT LOOP POLICY ==== #
+
+def install_event_loop(preferred: EventLoop) -> EventLoop:
+    """
+    Install the preferred event loop policy before ``asyncio.run``.
+
+    Args:
+        preferred: Requested loop implementation ("uvloop" or "asyncio")
+
+    Returns:
+        Loop implementation actually installed
+
+    Note:
+        uvloop replaces the selector-based loop with libuv, cutting
+        per-callback and socket readiness overhead for the many
+        concurrent httpx connections. It is skipped on Windows and
+        when the package is not installed.
+    """
+    if preferred != "uvloop" or sys.platform == "win32":
+        return "asyncio"
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed; using default asyncio loop")
+        return "asyncio"
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return "uvloop"
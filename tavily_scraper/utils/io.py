@@ -3,22 +3,63 @@ I/O utilities for reading and writing scraping data.
 
 This module provides:
 - URL loading from text and CSV files
+- Streaming reservoir sampling of CSV URLs
 - URL validation and job creation
-- JSONL statistics persistence
-- Buffered writing for performance
-- Checkpoint management for resumability
+- JSONL and MessagePack statistics persistence
+- Buffered, syscall-batched stats writing for performance
+- Append-only checkpoint journal for resumability
+- Run summary persistence
 """
 
 from __future__ import annotations
 
-import csv
-import json
+import math
+import os
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
 
+import msgspec
 from yarl import URL
 
-from tavily_scraper.core.models import UrlJob, UrlStats, UrlStr
+from tavily_scraper.config.constants import SHARD_MAX_SIZE, SHARD_MIN_SIZE
+from tavily_scraper.core.models import (
+    URL_STATS_ENCODER,
+    RunSummary,
+    ShardCheckpoint,
+    UrlJob,
+    UrlStats,
+    UrlStr,
+    decode_url_stats,
+)
+
+_WRITE_BUFFER_BYTES: int = 1 << 20
+"""File buffer for JSONL stats writes (1 MiB)."""
+
+_ENCODE_BATCH: int = 4096
+"""UrlStats encoded per msgspec call when writing JSONL."""
+
+_JSON_ENCODER = msgspec.json.Encoder()
+"""Shared JSON encoder for run summaries."""
+
+_CHECKPOINT_MSGPACK_DECODER = msgspec.msgpack.Decoder(ShardCheckpoint)
+"""Typed decoder for CheckpointJournal frames."""
+
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+"""Data-only sync where the platform has it (not macOS), else fsync."""
+
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+"""Shared MessagePack encoder for UrlStats frames."""
+
+_MSGPACK_DECODER = msgspec.msgpack.Decoder(UrlStats)
+"""Typed MessagePack decoder producing UrlStats records."""
+
+_FRAME_HEADER_BYTES: int = 4
+"""Big-endian length prefix in front of each MessagePack frame."""
+
+_FRAME_HEADER: bytes = b"\x00" * _FRAME_HEADER_BYTES
+"""Placeholder header patched with the frame length after encoding."""
 
 # ==== URL LOADING ==== #
 
@@ -47,13 +88,19 @@ def load_urls_from_txt(path: Path) -> list[str]:
 
 
 
-def load_urls_from_csv(path: Path, url_column: str = "url") -> list[str]:
+def load_urls_from_csv(
+    path: Path,
+    url_column: str = "url",
+    *,
+    limit: int | None = None,
+) -> list[str]:
     """
     Load URLs from CSV file.
 
     Args:
         path: Path to CSV file
         url_column: Name of column containing URLs (default: "url")
+        limit: Maximum number of CSV rows to read (default: all)
 
     Returns:
         List of URL strings from specified column
@@ -61,17 +108,122 @@ def load_urls_from_csv(path: Path, url_column: str = "url") -> list[str]:
     Raises:
         FileNotFoundError: If path doesn't exist
         KeyError: If url_column not found in CSV
+
+    Note:
+        Parsing is done by pandas' C reader restricted to url_column,
+        so only that column is materialized. Blank cells are dropped
+        after the first `limit` rows have been read.
     """
-    urls: list[str] = []
+    import pandas as pd
+
+    try:
+        frame = pd.read_csv(
+            path,
+            usecols=lambda column: column == url_column,
+            dtype=str,
+            keep_default_na=False,
+            nrows=limit,
+            encoding="utf-8",
+        )
+    except pd.errors.EmptyDataError:
+        return []
+
+    if url_column not in frame.columns:
+        raise KeyError(url_column)
 
-    with path.open(encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            url = (row.get(url_column) or "").strip()
-            if url:
-                urls.append(url)
+    urls = frame[url_column].str.strip()
+    result: list[str] = urls[urls != ""].tolist()
+    return result
 
-    return urls
+
+
+
+def sample_urls_from_csv(
+    path: Path,
+    k: int,
+    url_column: str = "url",
+    *,
+    chunksize: int = 65_536,
+    rng: random.Random | None = None,
+) -> tuple[list[str], int]:
+    """
+    Draw a uniform random sample of URLs from a CSV in one streaming pass.
+
+    Args:
+        path: Path to CSV file
+        k: Sample size
+        url_column: Name of column containing URLs (default: "url")
+        chunksize: CSV rows parsed per pandas chunk (default: 65536)
+        rng: Random generator (default: a fresh unseeded one)
+
+    Returns:
+        Tuple of (sampled URLs in random order, total non-blank URLs seen)
+
+    Raises:
+        FileNotFoundError: If path doesn't exist
+        KeyError: If url_column not found in CSV
+
+    Note:
+        Uses reservoir sampling (Algorithm L): memory is O(k + chunksize)
+        rather than O(N). The reservoir jumps straight to the next row to
+        replace, so Python-level work is O(k log(N/k)); the per-row work
+        stays inside pandas' C reader. Returns every URL, shuffled,
+        when the file holds no more than k.
+    """
+    import pandas as pd
+
+    rng = rng if rng is not None else random.Random()
+    reservoir: list[str] = []
+    seen = 0
+
+    if k <= 0:
+        return reservoir, len(load_urls_from_csv(path, url_column))
+
+    def uniform() -> float:
+        # Open interval (0, 1) so the logarithms below stay finite
+        u = rng.random()
+        while u == 0.0:
+            u = rng.random()
+        return u
+
+    w = math.exp(math.log(uniform()) / k)
+    next_pick = k + math.floor(math.log(uniform()) / math.log1p(-w))
+
+    try:
+        reader = pd.read_csv(
+            path,
+            usecols=lambda column: column == url_column,
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8",
+            chunksize=chunksize,
+        )
+    except pd.errors.EmptyDataError:
+        return reservoir, 0
+
+    with reader:
+        for chunk in reader:
+            if url_column not in chunk.columns:
+                raise KeyError(url_column)
+
+            urls = chunk[url_column].str.strip()
+            values = urls[urls != ""].to_numpy()
+            n = len(values)
+
+            # --► FILL PHASE: first k URLs go straight into the reservoir
+            if len(reservoir) < k:
+                reservoir.extend(values[: k - len(reservoir)].tolist())
+
+            # --► SKIP PHASE: replace only at geometrically spaced rows
+            while next_pick < seen + n:
+                reservoir[rng.randrange(k)] = values[next_pick - seen]
+                w *= math.exp(math.log(uniform()) / k)
+                next_pick += math.floor(math.log(uniform()) / math.log1p(-w)) + 1
+
+            seen += n
+
+    rng.shuffle(reservoir)
+    return reservoir, seen
 
 
 
@@ -159,13 +311,30 @@ def write_stats_jsonl(stats: list[UrlStats], path: Path) -> None:
 
     Note:
         Creates parent directories if needed.
-        Each stat is written as one JSON line.
+        Each stat is written as one JSON line, encoded by msgspec in
+        batches straight to UTF-8 bytes through a 1 MiB file buffer.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with path.open("w", encoding="utf-8") as f:
-        for stat in stats:
-            f.write(json.dumps(stat) + "\n")
+    _append_jsonl(stats, path, "wb")
+
+
+
+
+def _append_jsonl(stats: list[UrlStats], path: Path, mode: str) -> None:
+    """
+    Encode stats as JSON lines and write them in one buffered pass.
+
+    Args:
+        stats: UrlStats to write
+        path: Output file path
+        mode: "wb" to truncate, "ab" to append
+    """
+    encode_lines = URL_STATS_ENCODER.encode_lines
+
+    with path.open(mode, buffering=_WRITE_BUFFER_BYTES) as f:
+        for start in range(0, len(stats), _ENCODE_BATCH):
+            f.write(encode_lines(stats[start : start + _ENCODE_BATCH]))
 
 
 
@@ -186,14 +355,160 @@ def read_stats_jsonl(path: Path) -> list[UrlStats]:
     if not path.exists():
         return []
 
-    stats: list[UrlStats] = []
+    with path.open("rb") as f:
+        return [decode_url_stats(line) for line in f if line.strip()]
+
+
+
+
+def encode_stats_frames(stats: list[UrlStats]) -> bytearray:
+    """
+    Encode stats as length-prefixed MessagePack frames.
+
+    Args:
+        stats: List of UrlStats to encode
+
+    Returns:
+        Concatenated frames, each a 4-byte big-endian length
+        followed by one MessagePack-encoded UrlStats
+
+    Note:
+        Frames are encoded in place into one growing buffer, so no
+        per-record bytes objects are allocated.
+    """
+    buf = bytearray()
+
+    for stat in stats:
+        _encode_frame_into(stat, buf)
+
+    return buf
+
+
+
+
+def _encode_frame_into(record: UrlStats | ShardCheckpoint, buf: bytearray) -> None:
+    """Append one length-prefixed MessagePack frame to buf."""
+    start = len(buf)
+    buf += _FRAME_HEADER
+    _MSGPACK_ENCODER.encode_into(record, buf, -1)
+    size = len(buf) - start - _FRAME_HEADER_BYTES
+    buf[start : start + _FRAME_HEADER_BYTES] = size.to_bytes(
+        _FRAME_HEADER_BYTES, "big"
+    )
+
+
+
+
+def _encode_line_into(stat: UrlStats, buf: bytearray) -> None:
+    """Append one JSON line to buf."""
+    URL_STATS_ENCODER.encode_into(stat, buf, -1)
+    buf += b"\n"
+
+
+
+
+def write_stats_msgpack(stats: list[UrlStats], path: Path) -> None:
+    """
+    Write statistics as length-prefixed MessagePack frames.
+
+    Args:
+        stats: List of UrlStats to write
+        path: Output file path
+
+    Note:
+        Creates parent directories if needed.
+        Frames are smaller and faster to encode and decode than
+        JSON lines; see read_stats_msgpack() for the reader.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_stats_frames(stats))
+
+
+
+
+def read_stats_msgpack(path: Path) -> list[UrlStats]:
+    """
+    Read statistics from a length-prefixed MessagePack file.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        List of UrlStats objects (empty if file doesn't exist)
+
+    Raises:
+        ValueError: If the file ends in a truncated frame
+    """
+    if not path.exists():
+        return []
+
+    data = memoryview(path.read_bytes())
+    frames, end = _split_frames(data)
+    if end != len(data):
+        raise ValueError(f"Truncated stats frame at byte {end} in {path}")
+
+    decode = _MSGPACK_DECODER.decode
+    return [decode(frame) for frame in frames]
+
+
+
+
+def _split_frames(data: memoryview) -> tuple[list[memoryview], int]:
+    """
+    Split a buffer into length-prefixed frame payloads.
+
+    Args:
+        data: Concatenated frames
+
+    Returns:
+        (payloads, end) where end is the offset after the last
+        complete frame; end < len(data) means a truncated tail
+    """
+    frames: list[memoryview] = []
+    pos = 0
+
+    while pos + _FRAME_HEADER_BYTES <= len(data):
+        start = pos + _FRAME_HEADER_BYTES
+        end = start + int.from_bytes(data[pos:start], "big")
+        if end > len(data):
+            break
+        frames.append(data[start:end])
+        pos = end
+
+    return frames, pos
 
-    with path.open(encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                stats.append(json.loads(line))
 
-    return stats
+
+
+def write_stats(stats: list[UrlStats], path: Path) -> None:
+    """
+    Write statistics in the format implied by the file suffix.
+
+    Args:
+        stats: List of UrlStats to write
+        path: Output path ending in .msgpack or .jsonl
+    """
+    if path.suffix == ".msgpack":
+        write_stats_msgpack(stats, path)
+    else:
+        write_stats_jsonl(stats, path)
+
+
+
+
+def read_stats(path: Path) -> list[UrlStats]:
+    """
+    Read statistics in the format implied by the file suffix.
+
+    Args:
+        path: Input path ending in .msgpack or .jsonl
+
+    Returns:
+        List of UrlStats objects (empty if file doesn't exist)
+    """
+    if path.suffix == ".msgpack":
+        return read_stats_msgpack(path)
+    return read_stats_jsonl(path)
 
 
 
@@ -202,28 +517,61 @@ def read_stats_jsonl(path: Path) -> list[UrlStats]:
 
 class ResultStore:
     """
-    Buffered JSONL writer for UrlStats.
+    Buffered JSONL or MessagePack writer for UrlStats.
 
-    This class provides efficient batch writing to reduce
-    I/O overhead during high-throughput scraping.
+    Stats are encoded as they arrive into one in-memory bytearray
+    and written with a single os.write() once enough bytes, records
+    or time have accumulated, so a long run issues roughly one
+    syscall per megabyte instead of one per record.
+
+    With background=True a full buffer is handed to a single writer
+    thread and encoding continues into a fresh one, so an event loop
+    calling write() never blocks on disk unless the previous flush
+    is still in progress.
 
     Attributes:
-        path: Output file path
-        buffer_size: Number of stats to buffer before flush
-        buffer: In-memory buffer of pending stats
+        path: Output file path (.msgpack selects MessagePack frames)
+        buffer_size: Records to buffer before auto-flush
+        flush_bytes: Encoded bytes to buffer before auto-flush
+        flush_secs: Maximum age of buffered records before auto-flush
+        buffer: Encoded records not yet written
+        pending: Number of records in buffer
     """
 
-    def __init__(self, path: Path, buffer_size: int = 100):
+    def __init__(
+        self,
+        path: Path,
+        buffer_size: int = 4096,
+        *,
+        flush_bytes: int = _WRITE_BUFFER_BYTES,
+        flush_secs: float = 1.0,
+        background: bool = False,
+    ):
         """
         Initialize buffered writer.
 
         Args:
             path: Output file path
-            buffer_size: Stats to buffer before auto-flush (default: 100)
+            buffer_size: Records to buffer before auto-flush (default: 4096)
+            flush_bytes: Encoded bytes before auto-flush (default: 1 MiB)
+            flush_secs: Seconds before buffered records are flushed
+                on the next write (default: 1.0)
+            background: Write flushed buffers from a worker thread
+                (default: False)
         """
         self.path = path
         self.buffer_size = buffer_size
-        self.buffer: list[UrlStats] = []
+        self.flush_bytes = flush_bytes
+        self.flush_secs = flush_secs
+        self.buffer = bytearray()
+        self.pending = 0
+        self._encode = (
+            _encode_frame_into if path.suffix == ".msgpack" else _encode_line_into
+        )
+        self._fd: int | None = None
+        self._last_flush = time.monotonic()
+        self._writer = ThreadPoolExecutor(max_workers=1) if background else None
+        self._in_progress: Future[None] | None = None
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
@@ -231,17 +579,24 @@ class ResultStore:
 
     def write(self, stat: UrlStats) -> None:
         """
-        Write single stat (buffered).
+        Encode single stat into the buffer.
 
         Args:
             stat: UrlStats to write
 
         Note:
-            Automatically flushes when buffer reaches buffer_size.
+            Automatically flushes when the buffer reaches buffer_size
+            records or flush_bytes bytes, or when the oldest buffered
+            record is older than flush_secs.
         """
-        self.buffer.append(stat)
-
-        if len(self.buffer) >= self.buffer_size:
+        self._encode(stat, self.buffer)
+        self.pending += 1
+
+        if (
+            self.pending >= self.buffer_size
+            or len(self.buffer) >= self.flush_bytes
+            or time.monotonic() - self._last_flush >= self.flush_secs
+        ):
             self.flush()
 
 
@@ -251,17 +606,41 @@ class ResultStore:
         """
         Flush buffer to disk.
 
-        Writes all buffered stats and clears buffer.
+        Writes all buffered bytes and clears buffer.
         Safe to call multiple times.
+
+        Note:
+            In background mode the bytes are only queued; the previous
+            background write is awaited first, which bounds memory to
+            two buffers and re-raises any write error it hit.
         """
+        self._last_flush = time.monotonic()
         if not self.buffer:
             return
 
-        with self.path.open("a", encoding="utf-8") as f:
-            for stat in self.buffer:
-                f.write(json.dumps(stat) + "\n")
+        if self._fd is None:
+            self._fd = os.open(
+                self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+
+        data, self.buffer = self.buffer, bytearray()
+        self.pending = 0
+
+        if self._writer is None:
+            _write_all(self._fd, data)
+            return
+
+        self._wait_for_writer()
+        self._in_progress = self._writer.submit(_write_all, self._fd, data)
+
+
 
-        self.buffer.clear()
+
+    def _wait_for_writer(self) -> None:
+        """Block until the queued background write (if any) completes."""
+        if self._in_progress is not None:
+            in_progress, self._in_progress = self._in_progress, None
+            in_progress.result()
 
 
 
@@ -273,68 +652,224 @@ class ResultStore:
         Should be called when done writing to ensure
         all buffered data is persisted.
         """
-        self.flush()
+        try:
+            self.flush()
+            self._wait_for_writer()
+        finally:
+            if self._writer is not None:
+                self._writer.shutdown(wait=True)
+                self._writer = None
+
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+
+
+def _write_all(fd: int, data: bytearray) -> None:
+    """
+    Write every byte of data to fd, retrying short writes.
+
+    Args:
+        fd: Open file descriptor
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+    view.release()
 
 
 
 
 # ==== CHECKPOINT MANAGEMENT ==== #
 
-def make_shards(jobs: list[UrlJob], shard_size: int) -> list[list[UrlJob]]:
+def adaptive_shard_size(
+    urls_seen: int,
+    bytes_seen: int,
+    *,
+    current: int,
+    target_bytes: int,
+) -> int:
     """
-    Split URL jobs into shards and assign shard metadata.
+    Size the next shard from the content volume observed so far.
 
     Args:
-        jobs: List of URL jobs to shard
-        shard_size: Maximum number of jobs per shard
+        urls_seen: URLs processed in earlier shards
+        bytes_seen: Content bytes those URLs returned
+        current: Size of the previous shard
+        target_bytes: Content bytes a shard should fetch (0 = fixed)
 
     Returns:
-        List of shards, each containing a list of jobs with shard_id set
+        URLs for the next shard, clamped to [SHARD_MIN_SIZE, SHARD_MAX_SIZE]
+
+    Example:
+        Pages averaging 1 MiB with a 256 MiB target give 256-URL
+        shards; 20 KiB pages hit the 5000-URL ceiling.
+
+    Note:
+        Keeps the current size until at least one URL returned content,
+        or when adaptation is disabled.
     """
-    shards: list[list[UrlJob]] = []
-    for start in range(0, len(jobs), shard_size):
-        shard_jobs = list(jobs[start : start + shard_size])
-        shard_id = len(shards)
-        for job in shard_jobs:
-            job["shard_id"] = shard_id
-        shards.append(shard_jobs)
-    return shards
+    if target_bytes <= 0 or urls_seen <= 0 or bytes_seen <= 0:
+        return current
+
+    size = target_bytes * urls_seen // bytes_seen
+    return max(SHARD_MIN_SIZE, min(SHARD_MAX_SIZE, size))
+
 
 
-def save_checkpoint(checkpoint: dict[str, Any], path: Path) -> None:
+
+class CheckpointJournal:
     """
-    Save checkpoint to JSON file.
+    Append-only MessagePack log of shard checkpoints for a whole run.
 
-    Args:
-        checkpoint: Checkpoint data dictionary
-        path: Output file path
+    Replaces one JSON file per shard rewritten after every URL. Updates
+    are framed into an in-memory buffer and made durable in batches:
+    one write() plus one fdatasync() per flush_every updates or
+    flush_secs seconds, whichever comes first. The latest state per
+    (run_id, shard_id) is rebuilt by replaying the log on open.
 
-    Note:
-        Creates parent directories if needed.
-        Formatted with indentation for readability.
+    Attributes:
+        path: Journal file path
+        flush_every: Updates buffered before a durable flush
+        flush_secs: Maximum age of buffered updates before a flush
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(checkpoint, indent=2), encoding="utf-8")
 
+    def __init__(
+        self,
+        path: Path,
+        *,
+        flush_every: int = 256,
+        flush_secs: float = 1.0,
+    ) -> None:
+        """
+        Open (or create) a journal and replay its existing entries.
+
+        Args:
+            path: Journal file path
+            flush_every: Updates buffered before flushing (default: 256)
+            flush_secs: Seconds before buffered updates are flushed
+                on the next record (default: 1.0)
+
+        Note:
+            A torn final frame left by a crash is ignored on replay
+            and truncated away before new entries are appended.
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_secs = flush_secs
+        self._latest: dict[tuple[str, int], ShardCheckpoint] = {}
+        self._buffer = bytearray()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = memoryview(path.read_bytes() if path.exists() else b"")
+        frames, end = _split_frames(data)
+        for frame in frames:
+            checkpoint = _CHECKPOINT_MSGPACK_DECODER.decode(frame)
+            self._latest[(checkpoint["run_id"], checkpoint["shard_id"])] = checkpoint
+
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+        os.ftruncate(self._fd, end)
+        os.lseek(self._fd, end, os.SEEK_SET)
+
+
+
+
+    def get(self, run_id: str, shard_id: int) -> ShardCheckpoint | None:
+        """
+        Return the latest recorded checkpoint for a shard.
+
+        Args:
+            run_id: Run identifier
+            shard_id: Shard number
+
+        Returns:
+            Latest checkpoint or None if the shard was never recorded
+        """
+        return self._latest.get((run_id, shard_id))
+
+
+
+
+    def record(self, checkpoint: ShardCheckpoint, *, durable: bool = False) -> None:
+        """
+        Append a checkpoint update.
+
+        Args:
+            checkpoint: Current shard state (copied into the log)
+            durable: Flush and sync immediately, e.g. on completion
+
+        Note:
+            Non-durable updates are flushed once flush_every are
+            pending or flush_secs have passed since the last flush.
+        """
+        self._latest[(checkpoint["run_id"], checkpoint["shard_id"])] = (
+            ShardCheckpoint(**checkpoint)
+        )
+        _encode_frame_into(checkpoint, self._buffer)
+        self._pending += 1
+
+        if (
+            durable
+            or self._pending >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_secs
+        ):
+            self.flush()
 
 
 
-def load_checkpoint(path: Path) -> dict[str, Any] | None:
+
+    def flush(self) -> None:
+        """
+        Write buffered updates in one call and sync them to disk.
+
+        Safe to call multiple times.
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        view = memoryview(self._buffer)
+        while view:
+            view = view[os.write(self._fd, view) :]
+        view.release()
+        _fdatasync(self._fd)
+
+        self._buffer.clear()
+        self._pending = 0
+
+
+
+
+    def close(self) -> None:
+        """Flush pending updates and close the journal file."""
+        if self._fd < 0:
+            return
+
+        self.flush()
+        os.close(self._fd)
+        self._fd = -1
+
+
+
+
+# ==== RUN SUMMARY ==== #
+
+def write_run_summary(summary: RunSummary, path: Path) -> None:
     """
-    Load checkpoint from JSON file.
+    Write run summary as indented JSON.
 
     Args:
-        path: Checkpoint file path
-
-    Returns:
-        Checkpoint dictionary or None if file doesn't exist
+        summary: Aggregate run metrics
+        path: Output file path
 
     Note:
-        Returns None rather than raising error for missing files
-        to simplify first-run logic.
+        Encoded with msgspec, then indented for the notebook and
+        one-pager readers.
     """
-    if not path.exists():
-        return None
-
-    data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
-    return data
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(msgspec.json.format(_JSON_ENCODER.encode(summary), indent=2))
@@ -4,6 +4,7 @@ Metrics computation and aggregation for scraping runs.
 This module provides:
 - Percentile calculation for latency analysis
 - Run summary computation from URL statistics
+- Streaming, bounded-memory summary accumulation
 - Success/error rate calculations
 - Method distribution analysis (HTTP vs browser)
 - Content size statistics
@@ -11,9 +12,10 @@ This module provides:
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Iterable
-from statistics import mean
 
+from tavily_scraper.config.constants import STATUS_CODES, StatusCode
 from tavily_scraper.core.models import RunSummary, UrlStats
 
 # ==== STATISTICAL UTILITIES ==== #
@@ -52,8 +54,198 @@ def percentile(values: list[int], p: float) -> int | None:
 
 
 
+def _histogram_percentile(histogram: Counter[int], p: float) -> int | None:
+    """
+    Calculate nearest-rank percentile from a value histogram.
+
+    Gives the same result as percentile() on the expanded values, in
+    memory proportional to the number of distinct values.
+
+    Args:
+        histogram: Mapping of value -> occurrence count
+        p: Percentile to calculate (0-100)
+
+    Returns:
+        Percentile value or None if histogram is empty
+    """
+    n = histogram.total()
+    if not n:
+        return None
+
+    k = max(0, min(n - 1, int(round((p / 100.0) * (n - 1)))))
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen > k:
+            return value
+    return None
+
+
+
+
 # ==== RUN SUMMARY COMPUTATION ==== #
 
+class SummaryAccumulator:
+    """
+    Single-pass RunSummary builder with memory bounded by distinct values.
+
+    Rows are added one at a time as they are produced, so a run never
+    needs to hold its UrlStats to summarize them. Latencies are kept
+    as per-method histograms (exact percentiles; at most one entry per
+    distinct millisecond value) and content sizes as running sums.
+
+    Attributes:
+        total: Rows added so far
+        counts: Row count per StatusCode
+        cache_hits: Rows served from the HTTP cache
+        httpx_count: Rows fetched with httpx
+        playwright_count: Rows fetched with Playwright
+        httpx_latencies: Histogram of non-zero httpx latencies
+        playwright_latencies: Histogram of non-zero Playwright latencies
+        httpx_content_total: Sum of non-zero httpx content lengths
+        httpx_content_rows: Rows counted in httpx_content_total
+        playwright_content_total: Sum of non-zero Playwright content lengths
+        playwright_content_rows: Rows counted in playwright_content_total
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self.total = 0
+        self.counts = [0] * len(StatusCode)
+        self.cache_hits = 0
+        self.httpx_count = 0
+        self.playwright_count = 0
+        self.httpx_latencies: Counter[int] = Counter()
+        self.playwright_latencies: Counter[int] = Counter()
+        self.httpx_content_total = 0
+        self.httpx_content_rows = 0
+        self.playwright_content_total = 0
+        self.playwright_content_rows = 0
+
+
+
+
+    def add(self, r: UrlStats) -> None:
+        """
+        Fold one row into the running totals.
+
+        Args:
+            r: UrlStats row to add
+
+        Returns:
+            None
+        """
+        self.total += 1
+        self.counts[STATUS_CODES.get(r.status, StatusCode.OTHER)] += 1
+        if r.from_cache:
+            self.cache_hits += 1
+
+        method = r.method
+        latency = r.latency_ms
+        content_len = r.content_len
+
+        if method == "httpx":
+            self.httpx_count += 1
+            if latency:
+                self.httpx_latencies[latency] += 1
+            if content_len:
+                self.httpx_content_total += content_len
+                self.httpx_content_rows += 1
+        elif method == "playwright":
+            self.playwright_count += 1
+            if latency:
+                self.playwright_latencies[latency] += 1
+            if content_len:
+                self.playwright_content_total += content_len
+                self.playwright_content_rows += 1
+
+
+
+
+    def finalize(self) -> RunSummary:
+        """
+        Build the RunSummary for all rows added so far.
+
+        Returns:
+            RunSummary with aggregate metrics (zero-filled if empty)
+        """
+        total = self.total
+
+        # --► HANDLE EMPTY INPUT
+        if total == 0:
+            return RunSummary(
+                total_urls=0,
+                stats_rows=0,
+                success_count=0,
+                http_error_count=0,
+                timeout_count=0,
+                captcha_count=0,
+                robots_count=0,
+                success_rate=0.0,
+                stealth_stats=None,
+                http_error_rate=0.0,
+                timeout_rate=0.0,
+                captcha_rate=0.0,
+                robots_block_rate=0.0,
+                httpx_share=0.0,
+                playwright_share=0.0,
+                p50_latency_httpx_ms=None,
+                p95_latency_httpx_ms=None,
+                p50_latency_playwright_ms=None,
+                p95_latency_playwright_ms=None,
+                avg_content_len_httpx=None,
+                avg_content_len_playwright=None,
+                cache_hit_rate=0.0,
+            )
+
+        counts = self.counts
+        success_count = counts[StatusCode.SUCCESS]
+        http_error_count = counts[StatusCode.HTTP_ERROR]
+        timeout_count = counts[StatusCode.TIMEOUT]
+        captcha_count = counts[StatusCode.CAPTCHA]
+        robots_count = counts[StatusCode.ROBOTS]
+        httpx_n = self.httpx_content_rows
+        playwright_n = self.playwright_content_rows
+
+        # --► CONSTRUCT SUMMARY
+        return RunSummary(
+            total_urls=total,
+            stats_rows=total,
+            success_count=success_count,
+            http_error_count=http_error_count,
+            timeout_count=timeout_count,
+            captcha_count=captcha_count,
+            robots_count=robots_count,
+            success_rate=success_count / total,
+            stealth_stats=None,
+            http_error_rate=http_error_count / total,
+            timeout_rate=timeout_count / total,
+            captcha_rate=captcha_count / total,
+            robots_block_rate=robots_count / total,
+            httpx_share=self.httpx_count / total,
+            playwright_share=self.playwright_count / total,
+            p50_latency_httpx_ms=_histogram_percentile(self.httpx_latencies, 50),
+            p95_latency_httpx_ms=_histogram_percentile(self.httpx_latencies, 95),
+            p50_latency_playwright_ms=_histogram_percentile(
+                self.playwright_latencies, 50
+            ),
+            p95_latency_playwright_ms=_histogram_percentile(
+                self.playwright_latencies, 95
+            ),
+            avg_content_len_httpx=(
+                self.httpx_content_total // httpx_n if httpx_n else None
+            ),
+            avg_content_len_playwright=(
+                self.playwright_content_total // playwright_n
+                if playwright_n
+                else None
+            ),
+            cache_hit_rate=self.cache_hits / total,
+        )
+
+
+
+
 def compute_run_summary(stats: Iterable[UrlStats]) -> RunSummary:
     """
     Compute aggregate run summary from URL statistics.
@@ -71,87 +263,11 @@ def compute_run_summary(stats: Iterable[UrlStats]) -> RunSummary:
         RunSummary with aggregate metrics
 
     Note:
-        Returns zero-filled summary if no stats provided.
+        Returns zero-filled summary if no stats provided. Rows are read
+        in a single pass through a SummaryAccumulator, so a generator
+        input is never materialized.
     """
-    rows = list(stats)
-    total = len(rows)
-
-    # --► HANDLE EMPTY INPUT
-    if total == 0:
-        return RunSummary(
-            total_urls=0,
-            stats_rows=0,
-            success_rate=0.0,
-            stealth_stats=None,
-            http_error_rate=0.0,
-            timeout_rate=0.0,
-            captcha_rate=0.0,
-            robots_block_rate=0.0,
-            httpx_share=0.0,
-            playwright_share=0.0,
-            p50_latency_httpx_ms=None,
-            p95_latency_httpx_ms=None,
-            p50_latency_playwright_ms=None,
-            p95_latency_playwright_ms=None,
-            avg_content_len_httpx=None,
-            avg_content_len_playwright=None,
-        )
-
-    # --► COUNT BY STATUS
-    success_count = sum(1 for r in rows if r["status"] == "success")
-    http_error_count = sum(1 for r in rows if r["status"] == "http_error")
-    timeout_count = sum(1 for r in rows if r["status"] == "timeout")
-    captcha_count = sum(1 for r in rows if r["status"] == "captcha_detected")
-    robots_count = sum(1 for r in rows if r["status"] == "robots_blocked")
-
-    # --► COUNT BY METHOD
-    httpx_count = sum(1 for r in rows if r["method"] == "httpx")
-    playwright_count = sum(1 for r in rows if r["method"] == "playwright")
-
-    # --► COLLECT LATENCIES BY METHOD
-    httpx_latencies = [
-        r["latency_ms"]
-        for r in rows
-        if r["method"] == "httpx" and r["latency_ms"]
-    ]
-    playwright_latencies = [
-        r["latency_ms"]
-        for r in rows
-        if r["method"] == "playwright" and r["latency_ms"]
-    ]
-
-    # --► COLLECT CONTENT LENGTHS BY METHOD
-    httpx_content_lens = [
-        r["content_len"]
-        for r in rows
-        if r["method"] == "httpx" and r["content_len"]
-    ]
-    playwright_content_lens = [
-        r["content_len"]
-        for r in rows
-        if r["method"] == "playwright" and r["content_len"]
-    ]
-
-    # --► CONSTRUCT SUMMARY
-    return RunSummary(
-        total_urls=total,
-        stats_rows=total,
-        success_rate=success_count / total if total > 0 else 0.0,
-        stealth_stats=None,
-        http_error_rate=http_error_count / total if total > 0 else 0.0,
-        timeout_rate=timeout_count / total if total > 0 else 0.0,
-        captcha_rate=captcha_count / total if total > 0 else 0.0,
-        robots_block_rate=robots_count / total if total > 0 else 0.0,
-        httpx_share=httpx_count / total if total > 0 else 0.0,
-        playwright_share=playwright_count / total if total > 0 else 0.0,
-        p50_latency_httpx_ms=percentile(httpx_latencies, 50),
-        p95_latency_httpx_ms=percentile(httpx_latencies, 95),
-        p50_latency_playwright_ms=percentile(playwright_latencies, 50),
-        p95_latency_playwright_ms=percentile(playwright_latencies, 95),
-        avg_content_len_httpx=(
-            int(mean(httpx_content_lens)) if httpx_content_lens else None
-        ),
-        avg_content_len_playwright=(
-            int(mean(playwright_content_lens)) if playwright_content_lens else None
-        ),
-    )
+    accumulator = SummaryAccumulator()
+    for r in stats:
+        accumulator.add(r)
+    return accumulator.finalize()
@@ -1,3 +1,34 @@
 """Timing utilities."""
 
 from __future__ import annotations
+
+import random
+
+BACKOFF_JITTER: float = 0.2
+"""Relative spread applied to every retry delay (±20%)."""
+
+
+
+
+# ==== RETRY BACKOFF ==== #
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """
+    Exponential retry delay with multiplicative jitter.
+
+    Args:
+        attempt: 1-based retry number
+        base: Delay in seconds before the first retry
+
+    Returns:
+        base * 2**(attempt - 1), scaled by a random factor within
+        ±BACKOFF_JITTER
+
+    Note:
+        Fetches that fail together (a domain timing out under load)
+        would otherwise all retry at the same instant and hit the
+        domain again as one burst; the jitter spreads them out.
+    """
+    return base * (1 << (attempt - 1)) * random.uniform(
+        1.0 - BACKOFF_JITTER, 1.0 + BACKOFF_JITTER
+    )
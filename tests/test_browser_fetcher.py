@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, cast
 
 import pytest
 
-from tavily_scraper.core.models import RunConfig, RunnerContext, UrlJob, UrlStr
+from tavily_scraper.core.models import (
+    FetchResult,
+    RunConfig,
+    RunnerContext,
+    UrlJob,
+    UrlStr,
+)
 from tavily_scraper.core.scheduler import DomainScheduler
-from tavily_scraper.pipelines.browser_fetcher import browser_lifecycle, fetch_one
+from tavily_scraper.pipelines.browser_fetcher import (
+    _BLOCKED_ASSET_RE,
+    BLOCKING_LAUNCH_ARGS,
+    MAX_CONTEXT_USES,
+    MAX_WARM_CONTEXTS,
+    BrowserPool,
+    _wants_content,
+    browser_lifecycle,
+    fetch_one,
+    utf8_len,
+)
 
 
 class _SimpleHandler(BaseHTTPRequestHandler):
@@ -96,17 +114,17 @@ async def test_fetch_one_renders_dynamic_content() -> None:
 
     try:
         async with browser_lifecycle(ctx.run_config, None) as browser:
-            job: UrlJob = {
-                "url": UrlStr(url),
-                "is_dynamic_hint": None,
-                "shard_id": 0,
-                "index_in_shard": 0,
-            }
+            job = UrlJob(
+                url=UrlStr(url),
+                is_dynamic_hint=None,
+                shard_id=0,
+                index_in_shard=0,
+            )
             result = await fetch_one(job, ctx, browser)
 
-        assert result["status"] == "success"
-        assert result["method"] == "playwright"
-        assert result["content_len"] > 0
+        assert result.status == "success"
+        assert result.method == "playwright"
+        assert result.content_len > 0
         # Final HTML should contain the dynamically inserted text.
         assert "Dynamic content" in (result.get("content") or "")
     finally:
@@ -128,19 +146,219 @@ async def test_fetch_one_captcha_page_sets_status() -> None:
 
     try:
         async with browser_lifecycle(ctx.run_config, None) as browser:
-            job: UrlJob = {
-                "url": UrlStr(url),
-                "is_dynamic_hint": None,
-                "shard_id": 0,
-                "index_in_shard": 0,
-            }
+            job = UrlJob(
+                url=UrlStr(url),
+                is_dynamic_hint=None,
+                shard_id=0,
+                index_in_shard=0,
+            )
             result = await fetch_one(job, ctx, browser)
 
-        assert result["status"] == "captcha_detected"
-        assert result["captcha_detected"] is True
+        assert result.status == "captcha_detected"
+        assert result.captcha_detected is True
         # block_type and vendor are stored in optional fields.
         assert result.get("block_type") == "captcha"
         assert result.get("block_vendor") is not None
     finally:
         server.shutdown()
 
+
+class _FakeContext:
+    """Stand-in for a Playwright BrowserContext tracking routes and close()."""
+
+    def __init__(self) -> None:
+        self.routes: list[object] = []
+        self.closed = False
+        self.on_close: list[Any] = []
+
+    async def route(self, pattern: object, handler: object) -> None:
+        self.routes.append(pattern)
+
+    def once(self, event: str, handler: Any) -> None:
+        self.on_close.append(handler)
+
+    async def close(self) -> None:
+        self.closed = True
+        for handler in self.on_close:
+            handler(self)
+
+
+class _FakeBrowser:
+    """Stand-in for a Playwright Browser that tracks contexts and close()."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self.contexts: list[_FakeContext] = []
+
+    async def new_context(self, **kwargs: object) -> _FakeContext:
+        context = _FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeChromium:
+    """Stand-in for playwright.chromium counting launches."""
+
+    def __init__(self) -> None:
+        self.launched: list[_FakeBrowser] = []
+        self.launch_kwargs: list[dict[str, Any]] = []
+
+    async def launch(self, **kwargs: Any) -> _FakeBrowser:
+        self.launch_kwargs.append(kwargs)
+        await asyncio.sleep(0)
+        browser = _FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class _FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = _FakeChromium()
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_launches_lazily_and_reuses() -> None:
+    """Test pool launches at most `size` browsers and caps checkouts."""
+    fake = _FakePlaywright()
+    pool = BrowserPool(cast(Any, fake), RunConfig(), None, size=2)
+    assert fake.chromium.launched == []
+
+    in_use = 0
+    peak = 0
+
+    async def use() -> None:
+        nonlocal in_use, peak
+        async with pool.acquire():
+            in_use += 1
+            peak = max(peak, in_use)
+            await asyncio.sleep(0.01)
+            in_use -= 1
+
+    await asyncio.gather(*(use() for _ in range(6)))
+    assert len(fake.chromium.launched) == 2
+    assert peak == 2
+
+    await pool.close()
+    assert all(b.closed for b in fake.chromium.launched)
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_reuses_and_recycles_contexts() -> None:
+    """Test a pooled context is routed once, reused, then recycled."""
+    fake = _FakePlaywright()
+    pool = BrowserPool(cast(Any, fake), RunConfig(), None, size=1)
+
+    seen = []
+    for _ in range(MAX_CONTEXT_USES + 1):
+        async with pool.acquire_context() as context:
+            seen.append(context)
+
+    contexts = fake.chromium.launched[0].contexts
+    assert len(contexts) == 2
+    assert seen[: MAX_CONTEXT_USES] == [contexts[0]] * MAX_CONTEXT_USES
+    assert contexts[0].closed and contexts[0].routes == [_BLOCKED_ASSET_RE]
+    assert seen[-1] is contexts[1]
+
+    # A context that dies mid-fetch is never handed out again
+    async with pool.acquire_context() as context:
+        await context.close()
+    async with pool.acquire_context() as context:
+        assert context is contexts[2]
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_keeps_warm_context_per_domain() -> None:
+    """Test same-host fetches share a context and cold hosts are LRU evicted."""
+    fake = _FakePlaywright()
+    pool = BrowserPool(cast(Any, fake), RunConfig(), None, size=1)
+
+    async with pool.acquire_context("a.example") as first:
+        pass
+    for index in range(MAX_WARM_CONTEXTS):
+        async with pool.acquire_context(f"{index}.example"):
+            pass
+
+    contexts = fake.chromium.launched[0].contexts
+    assert len(contexts) == MAX_WARM_CONTEXTS + 1
+    assert first.closed
+    assert not any(context.closed for context in contexts[1:])
+
+    async with pool.acquire_context("0.example") as context:
+        assert context is contexts[1]
+
+    await pool.close()
+
+
+def test_blocked_asset_pattern_ignores_query_and_case() -> None:
+    """Test the routed pattern matches suffixes past queries and in any case."""
+
+    def blocked(url: str) -> bool:
+        return _BLOCKED_ASSET_RE.match(url) is not None
+
+    assert blocked("https://cdn.example.com/a/logo.PNG?v=3")
+    assert blocked("https://example.com/font.woff2#x")
+    assert not blocked("https://example.com/page.html?img=a.png")
+    assert not blocked("https://example.com")
+    assert not blocked("https://example.com/logo.png.html")
+    assert blocked("https://example.com/fonts/inter.TTF")
+    assert blocked("https://cdn.example.com/audio/intro.mp3?t=1")
+
+
+@pytest.mark.asyncio
+async def test_blocking_launch_args_cover_extensionless_assets() -> None:
+    """Test images, fonts and media are also stopped in the renderer."""
+    from tavily_scraper.stealth.config import StealthConfig
+
+    fake = _FakePlaywright()
+    blocking = BrowserPool(cast(Any, fake), RunConfig(), None, size=1)
+    async with blocking.acquire():
+        pass
+    assert set(BLOCKING_LAUNCH_ARGS) <= set(fake.chromium.launch_kwargs[0]["args"])
+    assert "--disable-remote-fonts" in BLOCKING_LAUNCH_ARGS
+
+    allowing = BrowserPool(
+        cast(Any, fake),
+        RunConfig(stealth_config=StealthConfig(block_resources=False)),
+        None,
+        size=1,
+    )
+    async with allowing.acquire():
+        pass
+    assert not set(BLOCKING_LAUNCH_ARGS) & set(fake.chromium.launch_kwargs[1]["args"])
+
+
+def test_utf8_len_matches_encoding_and_stops_past_limit() -> None:
+    """Test byte counts equal a full encode and stop early past the limit."""
+    ascii_page = "<p>hello</p>" * 1000
+    mixed_page = "é€😀\ud800" * 50_000
+
+    assert utf8_len(ascii_page, 10**9) == len(ascii_page)
+    assert utf8_len(mixed_page, 10**9) == len(
+        mixed_page.encode("utf-8", errors="ignore")
+    )
+    assert 100 < utf8_len(mixed_page, 100) < len(mixed_page.encode("utf-8", "ignore"))
+
+
+def test_wants_content_skips_server_errors_but_not_challenges() -> None:
+    """Test 5xx and oversized responses skip serialization; 503 and 4xx do not."""
+
+    def classified(status: Any, http_status: int) -> FetchResult:
+        return FetchResult(
+            url=UrlStr("https://example.com"),
+            method="playwright",
+            stage="fallback",
+            status=status,
+            http_status=http_status,
+        )
+
+    assert _wants_content(classified("success", 200))
+    assert _wants_content(classified("http_error", 403))
+    assert _wants_content(classified("http_error", 503))
+    assert not _wants_content(classified("http_error", 502))
+    assert not _wants_content(classified("too_large", 200))
@@ -1,6 +1,8 @@
 """Tests for CAPTCHA detection."""
 
-from tavily_scraper.utils.captcha import detect_captcha_http
+import pytest
+
+from tavily_scraper.utils.captcha import detect_captcha_http, detect_captcha_playwright
 
 
 def test_detect_recaptcha() -> None:
@@ -67,3 +69,22 @@ def test_no_false_positive_single_phrase() -> None:
     html = "<html><body><p>Our TOS: we deny automation tools.</p></body></html>"
     result = detect_captcha_http(200, "https://example.com", {}, html)
     assert not result["present"]  # Only 1 phrase, not 2+
+
+
+class _SerializedPage:
+    """Page stand-in whose DOM must not be serialized again."""
+
+    url = "https://example.com"
+    frames: list[object] = []
+
+    async def content(self) -> str:
+        raise AssertionError("page.content() called twice")
+
+
+@pytest.mark.asyncio
+async def test_detect_playwright_reuses_serialized_content() -> None:
+    """Test already-extracted HTML is inspected without another round trip."""
+    html = '<div class="cf-turnstile" data-sitekey="test"></div>'
+    result = await detect_captcha_playwright(_SerializedPage(), html)
+    assert result["present"]
+    assert result["vendor"] == "turnstile"
@@ -0,0 +1,59 @@
+"""Tests for adaptive (AIMD) concurrency gate."""
+
+import asyncio
+
+import pytest
+
+from tavily_scraper.core.concurrency import AdaptiveConcurrency
+
+
+@pytest.mark.asyncio
+async def test_gate_bounds_in_flight() -> None:
+    """Test that no more than `limit` holders run at once."""
+    gate = AdaptiveConcurrency(2, minimum=2, maximum=2, latency_target_ms=1000)
+    peak = 0
+
+    async def hold() -> None:
+        nonlocal peak
+        async with gate:
+            peak = max(peak, gate.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(hold() for _ in range(6)))
+    assert peak == 2
+    assert gate.in_flight == 0
+
+
+def test_gate_additive_increase_capped_at_maximum() -> None:
+    """Test healthy responses grow the limit up to the ceiling."""
+    gate = AdaptiveConcurrency(4, minimum=1, maximum=6, latency_target_ms=1000)
+
+    for _ in range(200):
+        gate.record(100)
+
+    assert gate.limit == 6
+
+
+def test_gate_multiplicative_decrease_once_per_epoch() -> None:
+    """Test congestion halves the limit once per epoch, never below floor."""
+    gate = AdaptiveConcurrency(16, minimum=3, maximum=32, latency_target_ms=1000)
+
+    # First epoch: 16 responses before the first cut is allowed
+    for _ in range(16):
+        gate.record(None, congested=True)
+    assert gate.limit == 8
+
+    # A burst shorter than the new epoch does not cut again
+    for _ in range(4):
+        gate.record(None, congested=True)
+    assert gate.limit == 8
+
+    for _ in range(100):
+        gate.record(None, congested=True)
+    assert gate.limit == 3
+
+    # Slow-but-successful responses also count as congestion
+    slow = AdaptiveConcurrency(16, minimum=1, maximum=32, latency_target_ms=100)
+    for _ in range(16):
+        slow.record(500)
+    assert slow.limit == 8
@@ -1,6 +1,7 @@
 """Tests for configuration loading."""
 
 import os
+from pathlib import Path
 
 from tavily_scraper.config.env import load_run_config
 
@@ -14,6 +15,7 @@ def test_load_run_config_defaults() -> None:
         "HTTPX_MAX_CONCURRENCY",
         "PLAYWRIGHT_MAX_CONCURRENCY",
         "SHARD_SIZE",
+        "TAVILY_SHARD_BYTES_TARGET",
     ]:
         os.environ.pop(key, None)
 
@@ -23,6 +25,13 @@ def test_load_run_config_defaults() -> None:
     assert config.httpx_max_concurrency == 32
     assert config.playwright_max_concurrency == 2
     assert config.shard_size == 500
+    assert config.shard_bytes_target == 256 * 1024 * 1024
+
+    os.environ["TAVILY_SHARD_BYTES_TARGET"] = "0"
+    assert load_run_config().shard_bytes_target == 0
+    os.environ["TAVILY_SHARD_BYTES_TARGET"] = "1"
+    assert load_run_config().shard_bytes_target == 1 << 20
+    os.environ.pop("TAVILY_SHARD_BYTES_TARGET", None)
 
 
 def test_load_run_config_custom() -> None:
@@ -63,3 +72,136 @@ def test_load_run_config_clamps_extreme_values() -> None:
         "SHARD_SIZE",
     ]:
         os.environ.pop(key, None)
+
+
+def test_load_run_config_connection_pool() -> None:
+    """Keep-alive tracks the concurrency ceiling; per-host slots are clamped."""
+    for key in ("HTTPX_MAX_KEEPALIVE", "HTTPX_MAX_CONN_PER_HOST"):
+        os.environ.pop(key, None)
+    os.environ["TAVILY_CONCURRENCY_MAX"] = "64"
+
+    config = load_run_config()
+    assert config.httpx_max_keepalive == 64
+    assert config.httpx_max_connections_per_host == 4
+
+    os.environ["HTTPX_MAX_KEEPALIVE"] = "10"
+    os.environ["HTTPX_MAX_CONN_PER_HOST"] = "1000"
+    config = load_run_config()
+    assert config.httpx_max_keepalive == 10
+    assert config.httpx_max_connections_per_host == 64
+
+    for key in (
+        "HTTPX_MAX_KEEPALIVE",
+        "HTTPX_MAX_CONN_PER_HOST",
+        "TAVILY_CONCURRENCY_MAX",
+    ):
+        os.environ.pop(key, None)
+
+
+def test_load_run_config_event_loop() -> None:
+    """TAVILY_EVENT_LOOP selects the loop; unknown values fall back to asyncio."""
+    os.environ.pop("TAVILY_EVENT_LOOP", None)
+    assert load_run_config().event_loop == "uvloop"
+
+    os.environ["TAVILY_EVENT_LOOP"] = "AsyncIO"
+    assert load_run_config().event_loop == "asyncio"
+
+    os.environ["TAVILY_EVENT_LOOP"] = "trio"
+    assert load_run_config().event_loop == "asyncio"
+
+    os.environ.pop("TAVILY_EVENT_LOOP", None)
+
+
+def test_load_run_config_stats_format() -> None:
+    """TAVILY_STATS_FORMAT selects msgpack; unknown values keep jsonl."""
+    os.environ.pop("TAVILY_STATS_FORMAT", None)
+    assert load_run_config().stats_format == "jsonl"
+
+    os.environ["TAVILY_STATS_FORMAT"] = "MsgPack"
+    assert load_run_config().stats_format == "msgpack"
+
+    os.environ["TAVILY_STATS_FORMAT"] = "parquet"
+    assert load_run_config().stats_format == "jsonl"
+
+    os.environ.pop("TAVILY_STATS_FORMAT", None)
+
+
+def test_load_run_config_nav_wait_until() -> None:
+    """TAVILY_NAV_WAIT_UNTIL picks the milestone; unknown values keep the default."""
+    os.environ.pop("TAVILY_NAV_WAIT_UNTIL", None)
+    assert load_run_config().nav_wait_until == "domcontentloaded"
+
+    os.environ["TAVILY_NAV_WAIT_UNTIL"] = "NetworkIdle"
+    assert load_run_config().nav_wait_until == "networkidle"
+
+    os.environ["TAVILY_NAV_WAIT_UNTIL"] = "idle"
+    assert load_run_config().nav_wait_until == "domcontentloaded"
+
+    os.environ.pop("TAVILY_NAV_WAIT_UNTIL", None)
+
+
+def test_load_run_config_domain_rps() -> None:
+    """TAVILY_DOMAIN_RPS accepts fractional rates and clamps negatives to 0."""
+    os.environ.pop("TAVILY_DOMAIN_RPS", None)
+    assert load_run_config().domain_rps == 0.0
+
+    os.environ["TAVILY_DOMAIN_RPS"] = "0.5"
+    assert load_run_config().domain_rps == 0.5
+
+    os.environ["TAVILY_DOMAIN_RPS"] = "-3"
+    assert load_run_config().domain_rps == 0.0
+
+    os.environ.pop("TAVILY_DOMAIN_RPS", None)
+
+
+def test_proxy_manager_precomputes_formats() -> None:
+    """Proxy formats are built once and the manager is immutable."""
+    import dataclasses
+
+    import pytest
+
+    from tavily_scraper.config.proxies import ProxyManager
+    from tavily_scraper.core.models import ProxyConfig
+
+    manager = ProxyManager.from_proxy_config(
+        ProxyConfig(
+            host="proxy.local",
+            http_port=8080,
+            https_port=8443,
+            socks5_port=1080,
+            username="u",
+            password="p",
+        )
+    )
+
+    assert manager.httpx_proxy() == "socks5://u:p@proxy.local:1080"
+    assert manager.playwright_proxy() == {
+        "server": "http://proxy.local:8080",
+        "username": "u",
+        "password": "p",
+    }
+    assert manager.playwright_proxy() is manager.playwright_proxy()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        manager.config = manager.config  # type: ignore[misc]
+
+
+def test_load_proxy_config_cached_until_file_changes(tmp_path: Path) -> None:
+    """Unchanged proxy files are parsed once; edits are picked up."""
+    from tavily_scraper.config.env import load_proxy_config_from_json
+
+    path = tmp_path / "proxy.json"
+    payload = (
+        '{"proxy": {"hostname": "%s:1", "port": '
+        '{"http": 1, "https": 2, "socks5": 3}}}'
+    )
+    path.write_text(payload % "a.local")
+
+    first = load_proxy_config_from_json(path)
+    assert first.host == "a.local"
+    assert load_proxy_config_from_json(path) is first
+
+    path.write_text(payload % "b.local")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_proxy_config_from_json(path).host == "b.local"
@@ -42,15 +42,15 @@ async def test_e2e_basic_http_fetch() -> None:
     # Fetch first URL
     if jobs:
         result = await fetch_one(jobs[0], ctx)
-        assert result["url"] == jobs[0]["url"]
-        assert result["domain"]
-        assert result["status"] in [
+        assert result.url == jobs[0].url
+        assert result.domain
+        assert result.status in [
             "success",
             "http_error",
             "timeout",
             "robots_blocked",
         ]
-        assert result["latency_ms"] is not None or result["status"] == "robots_blocked"
+        assert result.latency_ms is not None or result.status == "robots_blocked"
 
     await http_client.aclose()
     await robots_client._client.aclose()
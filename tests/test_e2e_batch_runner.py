@@ -89,3 +89,48 @@ async def test_run_all_small_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPat
 
     loaded_summary = json.loads(summary_path.read_text(encoding="utf-8"))
     assert loaded_summary["total_urls"] == len(urls)
+
+
+@pytest.mark.asyncio
+async def test_process_jobs_bounded_workers_and_early_stop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Workers stop pulling jobs once the success target is reached."""
+    import asyncio
+
+    from tavily_scraper.core.models import (
+        FetchResult,
+        RunConfig,
+        RunnerContext,
+        UrlJob,
+        UrlStr,
+    )
+    from tavily_scraper.pipelines import batch_runner
+
+    calls: list[str] = []
+
+    async def fake_route_and_fetch(job: UrlJob, ctx: object, browser: object) -> FetchResult:
+        calls.append(job.url)
+        # Later jobs hang: the early stop must cancel them, not wait
+        await asyncio.sleep(0 if len(calls) <= 3 else 3600)
+        return FetchResult(url=job.url, status="success")
+
+    monkeypatch.setattr(batch_runner, "route_and_fetch", fake_route_and_fetch)
+
+    config = RunConfig(concurrency_min=2, concurrency_max=2, httpx_max_concurrency=2)
+    ctx = RunnerContext(
+        run_config=config,
+        proxy_manager=None,
+        scheduler=None,  # type: ignore[arg-type]
+        robots_client=None,  # type: ignore[arg-type]
+        http_client=None,  # type: ignore[arg-type]
+    )
+    jobs = [UrlJob(url=UrlStr(f"https://example.com/{i}"), shard_id=0) for i in range(50)]
+
+    seen: list[FetchResult] = []
+    processed = await asyncio.wait_for(
+        batch_runner._process_jobs(
+            jobs, ctx, None, config, target_success=3, on_result=seen.append
+        ),
+        timeout=5,
+    )
+
+    assert 3 <= processed == len(seen) <= len(calls) <= 4
@@ -1,5 +1,7 @@
 """Tests for fast HTTP fetcher."""
 
+from pathlib import Path
+
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -24,35 +26,38 @@ def test_make_http_client() -> None:
     config = RunConfig()
     client = make_http_client(config, None)
     assert client is not None
+    assert client.timeout.read == config.httpx_timeout_seconds
+    assert client.timeout.connect == 5.0
+    assert client.timeout.pool is None
 
 
 def test_looks_incomplete_http() -> None:
     """Test incomplete HTTP detection."""
     from tavily_scraper.core.models import FetchResult
 
-    result: FetchResult = {
-        "url": UrlStr("https://example.com"),
-        "domain": "example.com",
-        "method": "httpx",
-        "stage": "primary",
-        "status": "success",
-        "http_status": 200,
-        "latency_ms": 100,
-        "content_len": 500,  # too small
-        "encoding": "utf-8",
-        "retries": 0,
-        "captcha_detected": False,
-        "robots_disallowed": False,
-        "error_kind": None,
-        "error_message": None,
-        "started_at": "2025-01-01T00:00:00Z",
-        "finished_at": "2025-01-01T00:00:00Z",
-        "shard_id": 0,
-        "content": "<html>test</html>",
-    }
+    result = FetchResult(
+        url=UrlStr("https://example.com"),
+        domain="example.com",
+        method="httpx",
+        stage="primary",
+        status="success",
+        http_status=200,
+        latency_ms=100,
+        content_len=500,  # too small
+        encoding="utf-8",
+        retries=0,
+        captcha_detected=False,
+        robots_disallowed=False,
+        error_kind=None,
+        error_message=None,
+        started_at="2025-01-01T00:00:00Z",
+        finished_at="2025-01-01T00:00:00Z",
+        shard_id=0,
+        content="<html>test</html>",
+    )
     assert looks_incomplete_http(result)
 
-    result["content_len"] = 2000
+    result.content_len = 2000
     assert not looks_incomplete_http(result)
 
 
@@ -84,18 +89,18 @@ async def test_fetch_one_success(httpx_mock: HTTPXMock) -> None:
         http_client=http_client,
     )
 
-    job: UrlJob = {
-        "url": UrlStr("https://example.com/page"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com/page"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
 
     result = await fetch_one(job, ctx)
-    assert result["status"] == "success"
-    assert result["http_status"] == 200
-    assert result["domain"] == "example.com"
-    assert result["content_len"] > 0
+    assert result.status == "success"
+    assert result.http_status == 200
+    assert result.domain == "example.com"
+    assert result.content_len > 0
     await http_client.aclose()
     await robots_client._client.aclose()
 
@@ -135,20 +140,20 @@ async def test_fetch_one_timeout_retries(httpx_mock: HTTPXMock) -> None:
         http_client=http_client,
     )
 
-    job: UrlJob = {
-        "url": UrlStr("https://example.com/page"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com/page"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
 
     result = await fetch_one(job, ctx)
     await http_client.aclose()
     await robots_client._client.aclose()
 
-    assert result["status"] == "success"
+    assert result.status == "success"
     # At least one retry should have been attempted
-    assert result.get("retries", 0) >= 1
+    assert result.retries >= 1
 
 
 @pytest.mark.asyncio
@@ -174,21 +179,21 @@ async def test_fetch_one_robots_blocked_short_circuits(httpx_mock: HTTPXMock) ->
         http_client=http_client,
     )
 
-    job: UrlJob = {
-        "url": UrlStr("https://example.com/page"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com/page"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
 
     result = await fetch_one(job, ctx)
     await http_client.aclose()
     await robots_client._client.aclose()
 
-    assert result["status"] == "robots_blocked"
-    assert result["robots_disallowed"] is True
-    assert result.get("http_status") is None
-    assert result.get("content_len", 0) == 0
+    assert result.status == "robots_blocked"
+    assert result.robots_disallowed is True
+    assert result.http_status is None
+    assert result.content_len == 0
 
 
 @pytest.mark.asyncio
@@ -220,22 +225,72 @@ async def test_fetch_one_connection_error_maps_to_http_error(
         http_client=http_client,
     )
 
-    job: UrlJob = {
-        "url": UrlStr("https://example.com/page"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com/page"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
 
     result = await fetch_one(job, ctx)
     await http_client.aclose()
     await robots_client._client.aclose()
 
-    assert result["status"] == "http_error"
-    assert result["error_kind"] == "ConnectError"
+    assert result.status == "http_error"
+    assert result.error_kind == "ConnectError"
     # For client-level HTTP errors there is no HTTP status code
-    assert result.get("http_status") is None
-    assert result.get("latency_ms") is not None
+    assert result.http_status is None
+    assert result.latency_ms is not None
+
+
+@pytest.mark.asyncio
+async def test_fetch_one_non_congestion_errors_keep_domain_limit(
+    httpx_mock: HTTPXMock,
+) -> None:
+    """404s and connect failures count as errors but do not cut concurrency."""
+    import httpx
+
+    httpx_mock.add_response(
+        url="https://example.com/robots.txt",
+        text="User-agent: *\nAllow: /\n",
+    )
+    httpx_mock.add_response(
+        url="https://example.com/missing",
+        status_code=404,
+        is_reusable=True,
+    )
+    httpx_mock.add_exception(
+        url="https://example.com/down",
+        exception=httpx.ConnectError("simulated DNS failure"),
+        is_reusable=True,
+    )
+
+    scheduler = DomainScheduler(global_limit=10, default_domain_limit=4)
+    robots_client = RobotsClient(httpx.AsyncClient())
+    http_client = httpx.AsyncClient()
+    ctx = RunnerContext(
+        run_config=RunConfig(),
+        proxy_manager=None,
+        scheduler=scheduler,
+        robots_client=robots_client,
+        http_client=http_client,
+    )
+
+    for path in ["missing"] * 8 + ["down"] * 8:
+        job = UrlJob(
+            url=UrlStr(f"https://example.com/{path}"),
+            is_dynamic_hint=None,
+            shard_id=0,
+            index_in_shard=0,
+        )
+        result = await fetch_one(job, ctx)
+        assert result.status == "http_error"
+
+    await http_client.aclose()
+    await robots_client._client.aclose()
+
+    assert scheduler._error_counts["example.com"] == 16
+    assert scheduler._domain_gates["example.com"].limit == 4
 
 
 @pytest.mark.asyncio
@@ -269,18 +324,139 @@ async def test_fetch_one_too_large_classification(httpx_mock: HTTPXMock) -> None
         http_client=http_client,
     )
 
-    job: UrlJob = {
-        "url": UrlStr("https://example.com/big"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com/big"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
 
     result = await fetch_one(job, ctx)
     await http_client.aclose()
     await robots_client._client.aclose()
 
-    assert result["status"] == "too_large"
-    assert result["content_len"] == DEFAULT_MAX_CONTENT_BYTES + 1
+    assert result.status == "too_large"
+    assert result.content_len == DEFAULT_MAX_CONTENT_BYTES + 1
     # content should not be kept in memory or persisted
-    assert result.get("content") is None
+    assert result.content is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_one_streamed_body_aborts_at_limit(
+    httpx_mock: HTTPXMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Chunked bodies without Content-Length stop reading past the cap."""
+    import httpx
+    from pytest_httpx import IteratorStream
+
+    from tavily_scraper.pipelines import fast_http_fetcher
+
+    monkeypatch.setattr(fast_http_fetcher, "MAX_CONTENT_BYTES", 100)
+
+    httpx_mock.add_response(
+        url="https://example.com/robots.txt",
+        text="User-agent: *\nAllow: /\n",
+    )
+    httpx_mock.add_response(
+        url="https://example.com/stream",
+        stream=IteratorStream([b"a" * 64] * 10),
+        headers={"Content-Type": "text/html"},
+    )
+
+    config = RunConfig(stream_chunk_bytes=64)
+    robots_client = RobotsClient(httpx.AsyncClient())
+    http_client = httpx.AsyncClient()
+    ctx = RunnerContext(
+        run_config=config,
+        proxy_manager=None,
+        scheduler=DomainScheduler(global_limit=10),
+        robots_client=robots_client,
+        http_client=http_client,
+    )
+
+    job = UrlJob(
+        url=UrlStr("https://example.com/stream"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
+
+    result = await fetch_one(job, ctx)
+    await http_client.aclose()
+    await robots_client._client.aclose()
+
+    assert result.status == "too_large"
+    assert result.content is None
+    # Stopped after the chunk that crossed the cap, not at 640 bytes
+    assert result.content_len == 128
+
+
+def test_rate_limit_delay_headers() -> None:
+    """Test Retry-After and X-RateLimit-* parsing."""
+    import httpx
+
+    from tavily_scraper.pipelines.fast_http_fetcher import rate_limit_delay
+
+    assert rate_limit_delay(httpx.Headers({"Retry-After": "5"}), floor=2) == 5.0
+    assert rate_limit_delay(httpx.Headers({}), floor=2) == 0.0
+
+    # Budget still healthy: no pause
+    healthy = httpx.Headers(
+        {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "30"}
+    )
+    assert rate_limit_delay(healthy, floor=2) == 0.0
+
+    # Budget below 10% of limit: pause until reset (duration syntax too)
+    low = httpx.Headers(
+        {"x-ratelimit-limit": "100", "x-ratelimit-remaining": "9", "x-ratelimit-reset": "1m30s"}
+    )
+    assert rate_limit_delay(low, floor=2) == 60.0  # capped
+
+    low_short = httpx.Headers({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "3"})
+    assert rate_limit_delay(low_short, floor=2) == 3.0
+
+
+@pytest.mark.asyncio
+async def test_fetch_one_http_cache_hit(httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    """Fresh cacheable responses are served from the on-disk cache on repeat."""
+    import httpx
+
+    httpx_mock.add_response(
+        url="https://example.com/robots.txt",
+        text="User-agent: *\nAllow: /\n",
+    )
+    httpx_mock.add_response(
+        url="https://example.com/page",
+        text="<html><body>" + "cached " * 200 + "</body></html>",
+        headers={"Content-Type": "text/html", "Cache-Control": "max-age=600"},
+    )
+
+    config = RunConfig(cache_ttl_seconds=600, cache_path=tmp_path / "cache.sqlite")
+    robots_client = RobotsClient(httpx.AsyncClient())
+    http_client = make_http_client(config, None)
+
+    ctx = RunnerContext(
+        run_config=config,
+        proxy_manager=None,
+        scheduler=DomainScheduler(global_limit=10),
+        robots_client=robots_client,
+        http_client=http_client,
+    )
+    job = UrlJob(
+        url=UrlStr("https://example.com/page"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
+
+    first = await fetch_one(job, ctx)
+    second = await fetch_one(job, ctx)
+    await http_client.aclose()
+    await robots_client._client.aclose()
+
+    assert first.status == second.status == "success"
+    assert first.from_cache is False
+    assert second.from_cache is True
+    page_requests = [r for r in httpx_mock.get_requests() if r.url.path == "/page"]
+    assert len(page_requests) == 1
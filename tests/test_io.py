@@ -1,14 +1,27 @@
 """Tests for I/O utilities."""
 
+import json
+import random
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from tavily_scraper.core.models import ShardCheckpoint, UrlStats
 from tavily_scraper.utils.io import (
+    CheckpointJournal,
+    ResultStore,
+    adaptive_shard_size,
     ensure_canonical_urls_file,
     load_urls_from_csv,
     load_urls_from_txt,
     make_url_jobs,
+    read_stats,
+    read_stats_jsonl,
+    sample_urls_from_csv,
+    write_run_summary,
+    write_stats,
+    write_stats_jsonl,
 )
+from tavily_scraper.utils.metrics import compute_run_summary
 
 
 def test_load_urls_from_txt() -> None:
@@ -29,6 +42,40 @@ def test_load_urls_from_csv() -> None:
         assert urls == ["https://example.com", "https://test.com"]
 
 
+def test_load_urls_from_csv_limit_and_blanks() -> None:
+    """Test row limit, whitespace stripping and blank-cell skipping."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "urls.csv"
+        path.write_text("url\n https://a.com \n\nhttps://b.com\nhttps://c.com\n")
+        assert load_urls_from_csv(path) == [
+            "https://a.com",
+            "https://b.com",
+            "https://c.com",
+        ]
+        assert load_urls_from_csv(path, limit=2) == ["https://a.com", "https://b.com"]
+
+
+def test_sample_urls_from_csv() -> None:
+    """Test reservoir sampling across chunks returns distinct file URLs."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "urls.csv"
+        all_urls = [f"https://site{i}.com" for i in range(50)]
+        path.write_text("url\n" + "\n\n".join(all_urls) + "\n")
+
+        sample, total = sample_urls_from_csv(
+            path, 10, chunksize=7, rng=random.Random(0)
+        )
+        assert total == 50
+        assert len(sample) == 10
+        assert len(set(sample)) == 10
+        assert set(sample) <= set(all_urls)
+
+        # Fewer URLs than requested: everything comes back
+        sample, total = sample_urls_from_csv(path, 100, rng=random.Random(0))
+        assert total == 50
+        assert sorted(sample) == sorted(all_urls)
+
+
 def test_ensure_canonical_urls_file() -> None:
     """Test canonical URL file creation."""
     with TemporaryDirectory() as tmpdir:
@@ -47,6 +94,171 @@ def test_make_url_jobs() -> None:
     urls = ["https://example.com", "https://test.com"]
     jobs = make_url_jobs(urls)
     assert len(jobs) == 2
-    assert jobs[0]["url"] == "https://example.com"
-    assert jobs[0]["shard_id"] == -1
-    assert jobs[0]["is_dynamic_hint"] is None
+    assert jobs[0].url == "https://example.com"
+    assert jobs[0].shard_id == -1
+    assert jobs[0].is_dynamic_hint is None
+
+
+def test_stats_jsonl_round_trip() -> None:
+    """Stats written in bulk and via ResultStore read back unchanged."""
+    stat = UrlStats(
+        url="https://example.com/é",
+        domain="example.com",
+        method="httpx",
+        stage="primary",
+        status="success",
+        http_status=200,
+        latency_ms=12,
+        content_len=100,
+        encoding="utf-8",
+        retries=0,
+        captcha_detected=False,
+        robots_disallowed=False,
+        error_kind=None,
+        error_message=None,
+        timestamp="2025-01-01T00:00:00Z",
+        shard_id=0,
+        block_type=None,
+        block_vendor=None,
+        from_cache=False,
+    )
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "out" / "stats.jsonl"
+        write_stats_jsonl([stat], path)
+
+        store = ResultStore(path, buffer_size=2)
+        store.write(stat)
+        store.close()
+
+        assert read_stats_jsonl(path) == [stat, stat]
+
+
+def test_stats_msgpack_round_trip(tmp_path: Path) -> None:
+    """Length-prefixed MessagePack frames read back unchanged."""
+    stats = [
+        UrlStats(
+            url=f"https://example.com/{i}",
+            domain="example.com",
+            method="httpx",
+            stage="primary",
+            status="success",
+            http_status=200,
+            latency_ms=i,
+        )
+        for i in range(3)
+    ]
+    path = tmp_path / "stats.msgpack"
+    write_stats(stats, path)
+
+    store = ResultStore(path, buffer_size=2)
+    store.write(stats[0])
+    store.close()
+
+    assert read_stats(path) == [*stats, stats[0]]
+    assert int.from_bytes(path.read_bytes()[:4], "big") > 0
+
+
+def test_result_store_flushes_by_bytes(tmp_path: Path) -> None:
+    """ResultStore holds encoded records until the byte budget is reached."""
+    path = tmp_path / "stats.jsonl"
+    store = ResultStore(path, flush_bytes=1024, flush_secs=3600.0)
+    stat = UrlStats(
+        url="https://example.com",
+        domain="example.com",
+        method="httpx",
+        stage="primary",
+        status="success",
+    )
+
+    store.write(stat)
+    assert store.pending == 1
+    assert not path.exists()
+
+    while store.pending:
+        store.write(stat)
+    assert path.stat().st_size >= 1024
+
+    store.write(stat)
+    store.close()
+    assert all(s == stat for s in read_stats_jsonl(path))
+
+
+def test_result_store_background_writer(tmp_path: Path) -> None:
+    """Background flushes keep record order and are all on disk after close."""
+    path = tmp_path / "stats.msgpack"
+    store = ResultStore(path, buffer_size=3, background=True)
+    stats = [
+        UrlStats(
+            url=f"https://example.com/{i}",
+            domain="example.com",
+            method="httpx",
+            stage="primary",
+            status="success",
+            latency_ms=i,
+        )
+        for i in range(10)
+    ]
+
+    for stat in stats:
+        store.write(stat)
+    store.close()
+
+    assert read_stats(path) == stats
+
+
+def test_run_summary_stays_readable(tmp_path: Path) -> None:
+    """Run summaries are written as indented, standard JSON."""
+    summary_path = tmp_path / "run_summary.json"
+    summary = compute_run_summary([])
+    write_run_summary(summary, summary_path)
+    text = summary_path.read_text(encoding="utf-8")
+    assert text.startswith('{\n  "total_urls": 0')
+    assert json.loads(text) == summary
+
+
+def test_checkpoint_journal_batches_and_replays(tmp_path: Path) -> None:
+    """Journal batches updates, keeps the latest per shard and drops torn tails."""
+    path = tmp_path / "checkpoints.msgpack"
+    journal = CheckpointJournal(path, flush_every=3, flush_secs=3600.0)
+
+    checkpoint: ShardCheckpoint = {
+        "run_id": "run",
+        "shard_id": 0,
+        "urls_total": 5,
+        "urls_done": 0,
+        "last_updated_at": "2025-01-01T00:00:00.000+00:00",
+        "status": "in_progress",
+    }
+    journal.record(checkpoint)
+    checkpoint["urls_done"] = 1
+    journal.record(checkpoint)
+    assert path.stat().st_size == 0
+    assert journal.get("run", 0) == checkpoint
+
+    checkpoint["urls_done"] = 5
+    checkpoint["status"] = "completed"
+    journal.record(checkpoint, durable=True)
+    journal.close()
+
+    with path.open("ab") as f:
+        f.write(b"\x00\x00\x01\x00torn")
+
+    reopened = CheckpointJournal(path)
+    assert reopened.get("run", 0) == checkpoint
+    assert reopened.get("run", 1) is None
+    reopened.close()
+    assert not path.read_bytes().endswith(b"torn")
+
+
+def test_adaptive_shard_size() -> None:
+    """Shard size follows the content byte target within fixed bounds."""
+    mib = 1 << 20
+    # No data yet, or adaptation disabled: keep the current size
+    assert adaptive_shard_size(0, 0, current=500, target_bytes=256 * mib) == 500
+    assert adaptive_shard_size(500, 500 * mib, current=500, target_bytes=0) == 500
+
+    # 1 MiB pages against a 256 MiB target
+    assert adaptive_shard_size(500, 500 * mib, current=500, target_bytes=256 * mib) == 256
+    # Huge pages floor at 50, tiny pages cap at 5000
+    assert adaptive_shard_size(10, 500 * mib, current=500, target_bytes=mib) == 50
+    assert adaptive_shard_size(500, 500 * 1024, current=500, target_bytes=256 * mib) == 5000
@@ -1,7 +1,19 @@
 """Tests for metrics computation."""
 
+from typing import get_args
+
+from tavily_scraper.config.constants import (
+    STATUS_CODES,
+    STATUS_NAMES,
+    Status,
+    StatusCode,
+)
 from tavily_scraper.core.models import UrlStats
-from tavily_scraper.utils.metrics import compute_run_summary, percentile
+from tavily_scraper.utils.metrics import (
+    SummaryAccumulator,
+    compute_run_summary,
+    percentile,
+)
 
 
 def test_percentile() -> None:
@@ -17,57 +29,93 @@ def test_compute_run_summary_empty() -> None:
     summary = compute_run_summary([])
     assert summary["total_urls"] == 0
     assert summary["success_rate"] == 0.0
+    assert summary["success_count"] == 0
 
 
 def test_compute_run_summary() -> None:
     """Test run summary computation."""
     stats: list[UrlStats] = [
-        {
-            "url": "https://example.com",
-            "domain": "example.com",
-            "method": "httpx",
-            "stage": "primary",
-            "status": "success",
-            "http_status": 200,
-            "latency_ms": 100,
-            "content_len": 1000,
-            "encoding": "utf-8",
-            "retries": 0,
-            "captcha_detected": False,
-            "robots_disallowed": False,
-            "error_kind": None,
-            "error_message": None,
-            "timestamp": "2025-01-01T00:00:00Z",
-            "shard_id": 0,
-            "block_type": None,
-            "block_vendor": None,
-        },
-        {
-            "url": "https://test.com",
-            "domain": "test.com",
-            "method": "playwright",
-            "stage": "fallback",
-            "status": "success",
-            "http_status": 200,
-            "latency_ms": 2000,
-            "content_len": 5000,
-            "encoding": "utf-8",
-            "retries": 0,
-            "captcha_detected": False,
-            "robots_disallowed": False,
-            "error_kind": None,
-            "error_message": None,
-            "timestamp": "2025-01-01T00:00:01Z",
-            "shard_id": 0,
-            "block_type": None,
-            "block_vendor": None,
-        },
+        UrlStats(
+            url="https://example.com",
+            domain="example.com",
+            method="httpx",
+            stage="primary",
+            status="success",
+            http_status=200,
+            latency_ms=100,
+            content_len=1000,
+            encoding="utf-8",
+            retries=0,
+            captcha_detected=False,
+            robots_disallowed=False,
+            error_kind=None,
+            error_message=None,
+            timestamp="2025-01-01T00:00:00Z",
+            shard_id=0,
+            block_type=None,
+            block_vendor=None,
+        ),
+        UrlStats(
+            url="https://test.com",
+            domain="test.com",
+            method="playwright",
+            stage="fallback",
+            status="success",
+            http_status=200,
+            latency_ms=2000,
+            content_len=5000,
+            encoding="utf-8",
+            retries=0,
+            captcha_detected=False,
+            robots_disallowed=False,
+            error_kind=None,
+            error_message=None,
+            timestamp="2025-01-01T00:00:01Z",
+            shard_id=0,
+            block_type=None,
+            block_vendor=None,
+        ),
     ]
 
     summary = compute_run_summary(stats)
     assert summary["total_urls"] == 2
     assert summary["success_rate"] == 1.0
+    assert summary["success_count"] == 2
     assert summary["httpx_share"] == 0.5
     assert summary["playwright_share"] == 0.5
     assert summary["p50_latency_httpx_ms"] == 100
     assert summary["p50_latency_playwright_ms"] == 2000
+
+
+def test_status_codes_cover_status_literal() -> None:
+    """StatusCode, STATUS_NAMES and the Status literal stay in lockstep."""
+    assert set(STATUS_NAMES) == set(get_args(Status))
+    assert len(StatusCode) == len(STATUS_NAMES)
+    for name in STATUS_NAMES:
+        assert STATUS_NAMES[STATUS_CODES[name]] == name
+    assert STATUS_NAMES[StatusCode.CAPTCHA] == "captcha_detected"
+
+
+def test_summary_accumulator_matches_exact_percentiles() -> None:
+    """Streaming histogram percentiles equal the sort-based ones."""
+    latencies = [120, 80, 80, 300, 95, 120, 5000, 80, 110, 130, 95]
+    accumulator = SummaryAccumulator()
+    for i, latency in enumerate(latencies):
+        accumulator.add(
+            UrlStats(
+                url=f"https://example.com/{i}",
+                domain="example.com",
+                method="httpx",
+                stage="primary",
+                status="success" if i % 2 else "timeout",
+                latency_ms=latency,
+                content_len=1000 + i,
+            )
+        )
+
+    summary = accumulator.finalize()
+    assert summary["total_urls"] == len(latencies)
+    assert summary["timeout_count"] == 6
+    assert summary["p50_latency_httpx_ms"] == percentile(latencies, 50)
+    assert summary["p95_latency_httpx_ms"] == percentile(latencies, 95)
+    assert summary["avg_content_len_httpx"] == 1005
@@ -1,50 +1,113 @@
 """Tests for core models."""
 
+from unittest.mock import patch
+
 from tavily_scraper.core.models import (
     UrlJob,
     UrlStr,
+    decode_url_stats,
+    encode_url_stats,
     fetch_result_to_url_stats,
     make_initial_fetch_result,
+    release_fetch_result,
 )
 
 
 def test_make_initial_fetch_result() -> None:
     """Test creating initial fetch result."""
-    job: UrlJob = {
-        "url": UrlStr("https://example.com"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
     result = make_initial_fetch_result(job, "httpx", "primary")
-    assert result["url"] == "https://example.com"
-    assert result["method"] == "httpx"
-    assert result["stage"] == "primary"
-    assert result["status"] == "other_error"
-    assert result["shard_id"] == 0
+    assert result.url == "https://example.com"
+    assert result.method == "httpx"
+    assert result.stage == "primary"
+    assert result.status == "other_error"
+    assert result.shard_id == 0
 
 
 def test_fetch_result_to_url_stats() -> None:
     """Test converting FetchResult to UrlStats."""
-    job: UrlJob = {
-        "url": UrlStr("https://example.com"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
     result = make_initial_fetch_result(job, "httpx", "primary")
-    result["domain"] = "example.com"
-    result["status"] = "success"
-    result["http_status"] = 200
-    result["latency_ms"] = 120
-    result["content_len"] = 2048
-    result["content"] = "<html>test</html>"  # should be stripped
+    result.domain = "example.com"
+    result.status = "success"
+    result.http_status = 200
+    result.latency_ms = 120
+    result.content_len = 2048
+    result.content = "<html>test</html>"  # should be stripped
 
     stats = fetch_result_to_url_stats(result)
-    assert stats["url"] == "https://example.com"
-    assert stats["domain"] == "example.com"
-    assert stats["status"] == "success"
-    assert stats["http_status"] == 200
-    assert stats["latency_ms"] == 120
-    assert stats["content_len"] == 2048
-    assert "content" not in stats  # content should not be in UrlStats
+    assert stats.url == "https://example.com"
+    assert stats.domain == "example.com"
+    assert stats.status == "success"
+    assert stats.http_status == 200
+    assert stats.latency_ms == 120
+    assert stats.content_len == 2048
+    assert not hasattr(stats, "content")  # content should not be in UrlStats
+
+
+def test_utc_now_iso_cached_per_millisecond() -> None:
+    """Test timestamps are reused within one millisecond tick."""
+    from datetime import datetime
+
+    from tavily_scraper.core import models
+
+    first = models._utc_now_iso()
+    assert datetime.fromisoformat(first).utcoffset() is not None
+
+    models._iso_tick = 0
+    models._iso_cached = "cached"
+    with patch("tavily_scraper.core.models.time.time_ns", return_value=0):
+        assert models._utc_now_iso() == "cached"
+    assert models._utc_now_iso() != "cached"
+
+
+def test_url_stats_json_round_trip() -> None:
+    """Test schema-bound encode/decode of UrlStats."""
+    job = UrlJob(url=UrlStr("https://example.com"), shard_id=0)
+    stats = fetch_result_to_url_stats(make_initial_fetch_result(job, "httpx", "primary"))
+
+    data = encode_url_stats(stats)
+    assert data.startswith(b'{"url":"https://example.com"')
+    assert decode_url_stats(data) == stats
+
+
+def test_url_job_encodes_as_array() -> None:
+    """Test UrlJob serializes positionally and round-trips."""
+    import msgspec
+
+    job = UrlJob(url=UrlStr("https://example.com"), shard_id=3, index_in_shard=7)
+    data = msgspec.msgpack.encode(job)
+    assert b"shard_id" not in data
+    assert msgspec.msgpack.decode(data, type=UrlJob) == job
+
+
+def test_released_fetch_result_is_reused_and_reset() -> None:
+    """Test pooled FetchResult instances come back with fresh defaults."""
+    job = UrlJob(url=UrlStr("https://a.example"), shard_id=1)
+    used = make_initial_fetch_result(job, "httpx", "primary")
+    used.status = "success"
+    used.http_status = 200
+    used.content = "<html></html>"
+    used.block_type = "captcha"
+    release_fetch_result(used)
+    assert used.content is None
+
+    other = UrlJob(url=UrlStr("https://b.example"), shard_id=2)
+    reused = make_initial_fetch_result(other, "playwright", "fallback")
+    assert reused is used
+    assert reused.url == "https://b.example"
+    assert reused.method == "playwright"
+    assert reused.status == "other_error"
+    assert reused.http_status is None
+    assert reused.block_type == "none"
+    assert reused.shard_id == 2
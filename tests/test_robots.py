@@ -50,3 +50,192 @@ async def test_robots_unreachable(httpx_mock: HTTPXMock) -> None:
     client = httpx.AsyncClient()
     robots = RobotsClient(client)
     assert await robots.can_fetch("https://example.com/page")
+
+
+@pytest.mark.asyncio
+async def test_robots_fetched_once_per_domain_and_lru_bounded(
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Test concurrent misses share one fetch and the cache is bounded."""
+    import asyncio
+
+    import httpx
+
+    for host in ("a.example", "b.example"):
+        httpx_mock.add_response(
+            url=f"https://{host}/robots.txt",
+            text="User-agent: *\nDisallow: /private\n",
+            is_reusable=True,
+        )
+
+    robots = RobotsClient(httpx.AsyncClient(), max_domains=1)
+    results = await asyncio.gather(
+        *(robots.can_fetch("https://a.example/page") for _ in range(5))
+    )
+    assert all(results)
+    assert len(httpx_mock.get_requests(url="https://a.example/robots.txt")) == 1
+
+    assert not await robots.can_fetch("https://b.example/private/x")
+    assert list(robots._parsers) == ["https://b.example"]
+    assert robots._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_robots_wildcard_rules(httpx_mock: HTTPXMock) -> None:
+    """Test RFC 9309 wildcard and end-anchor rules are honoured."""
+    httpx_mock.add_response(
+        url="https://example.com/robots.txt",
+        text="User-agent: *\nDisallow: /*.pdf$\n",
+    )
+
+    import httpx
+
+    robots = RobotsClient(httpx.AsyncClient())
+    assert not await robots.can_fetch("https://example.com/docs/a.pdf")
+    assert await robots.can_fetch("https://example.com/docs/a.pdf.html")
+
+
+@pytest.mark.asyncio
+async def test_robots_www_alias_shares_cache_entry(httpx_mock: HTTPXMock) -> None:
+    """Test www. and apex hosts share one robots.txt fetch."""
+    httpx_mock.add_response(
+        url="https://www.example.com/robots.txt",
+        text="User-agent: *\nDisallow: /private\n",
+    )
+
+    import httpx
+
+    robots = RobotsClient(httpx.AsyncClient())
+    assert not await robots.can_fetch("https://www.example.com/private/a")
+    assert not await robots.can_fetch("https://EXAMPLE.com:443/private/b")
+    assert list(robots._parsers) == ["https://example.com"]
+
+
+def test_cache_key_keeps_subdomains_ports_and_ips() -> None:
+    """Test only the www. alias and default ports are folded."""
+    from tavily_scraper.core.robots import _cache_key, _scheme_netloc
+
+    def key(url: str) -> str:
+        return _cache_key(*_scheme_netloc(url))
+
+    assert key("http://blog.example.com/x") == "http://blog.example.com"
+    assert key("http://example.com:8080/") == "http://example.com:8080"
+    assert key("https://[::1]:443/") == "https://[::1]"
+    assert key("http://10.0.0.1/") == "http://10.0.0.1"
+    assert key("https://user@www.example.com?q") == "https://example.com"
+    assert _scheme_netloc("/relative/path") == ("", "")
+
+
+@pytest.mark.asyncio
+async def test_robots_fetch_survives_cancelled_caller(httpx_mock: HTTPXMock) -> None:
+    """Test cancelling one waiter does not abort the shared fetch."""
+    import asyncio
+
+    import httpx
+
+    async def slow_robots(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, text="User-agent: *\nDisallow: /x\n")
+
+    httpx_mock.add_callback(slow_robots, url="https://example.com/robots.txt")
+
+    robots = RobotsClient(httpx.AsyncClient())
+    first = asyncio.create_task(robots.can_fetch("https://example.com/x/1"))
+    second = asyncio.create_task(robots.can_fetch("https://example.com/x/2"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second is False
+    assert first.cancelled()
+    assert list(robots._parsers) == ["https://example.com"]
+
+
+@pytest.mark.asyncio
+async def test_make_robots_client_shares_scraper_client() -> None:
+    """Test a shared client is reused and left open by aclose()."""
+    import httpx
+
+    from tavily_scraper.core.models import RunConfig
+    from tavily_scraper.core.robots import make_robots_client
+
+    shared = httpx.AsyncClient()
+    robots = await make_robots_client(RunConfig(), None, shared_client=shared)
+    assert robots._client is shared
+    await robots.aclose()
+    assert not shared.is_closed
+
+    owned = await make_robots_client(RunConfig(), None)
+    await owned.aclose()
+    assert owned._client.is_closed
+    await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_robots_fetch_sends_own_user_agent(httpx_mock: HTTPXMock) -> None:
+    """Test robots.txt is requested as the checked agent on a shared client."""
+    httpx_mock.add_response(
+        url="https://example.com/robots.txt",
+        match_headers={"User-Agent": "TavilyScraper"},
+        text="User-agent: *\nDisallow: /private\n",
+    )
+
+    import httpx
+
+    shared = httpx.AsyncClient(headers={"User-Agent": "Mozilla/5.0"})
+    robots = RobotsClient(shared, owns_client=False)
+    assert not await robots.can_fetch("https://example.com/private")
+    await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_robots_allow_all_cached_without_parser(httpx_mock: HTTPXMock) -> None:
+    """Test files without Disallow rules skip the rule matcher."""
+    httpx_mock.add_response(
+        url="https://open.example/robots.txt",
+        text="# comment\nUser-agent: *\nAllow: /\nSitemap: /s.xml\n",
+    )
+    httpx_mock.add_response(
+        url="https://typo.example/robots.txt",
+        text="User-agent: *\nDissallow: /private\n",
+    )
+
+    import httpx
+
+    robots = RobotsClient(httpx.AsyncClient())
+    assert await robots.can_fetch("https://open.example/private")
+    assert robots._parsers["https://open.example"][0] is None
+
+    assert not await robots.can_fetch("https://typo.example/private")
+    assert robots._parsers["https://typo.example"][0] is not None
+
+
+@pytest.mark.asyncio
+async def test_robots_negative_cache_ttl(httpx_mock: HTTPXMock) -> None:
+    """Test 4xx is cached for the run while 5xx is retried after expiry."""
+    import math
+
+    httpx_mock.add_response(
+        url="https://gone.example/robots.txt", status_code=404
+    )
+    httpx_mock.add_response(
+        url="https://flaky.example/robots.txt", status_code=503
+    )
+    httpx_mock.add_response(
+        url="https://flaky.example/robots.txt",
+        text="User-agent: *\nDisallow: /private\n",
+    )
+
+    import httpx
+
+    robots = RobotsClient(httpx.AsyncClient())
+    assert await robots.can_fetch("https://gone.example/private")
+    assert robots._parsers["https://gone.example"][1] == math.inf
+
+    assert await robots.can_fetch("https://flaky.example/private")
+    assert await robots.can_fetch("https://flaky.example/private")
+    assert len(httpx_mock.get_requests(url="https://flaky.example/robots.txt")) == 1
+
+    # Expire the 503 entry: the next lookup refetches and sees the rules
+    robots._parsers["https://flaky.example"] = (None, 0.0)
+    assert not await robots.can_fetch("https://flaky.example/private")
+    assert len(httpx_mock.get_requests(url="https://flaky.example/robots.txt")) == 2
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import cast
 
 import pytest
@@ -113,12 +114,12 @@ async def test_route_and_fetch_http_only(monkeypatch: pytest.MonkeyPatch) -> Non
     )
 
     ctx = _make_runner_context()
-    job: UrlJob = {
-        "url": UrlStr("https://example.com/page"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com/page"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
 
     # Pass a dummy browser object; needs_browser should return False so it is never used.
     dummy_browser = object()
@@ -126,8 +127,8 @@ async def test_route_and_fetch_http_only(monkeypatch: pytest.MonkeyPatch) -> Non
 
     assert calls["http"] == 1
     assert calls["browser"] == 0
-    assert result["method"] == "httpx"
-    assert result["status"] == "success"
+    assert result.method == "httpx"
+    assert result.status == "success"
 
 
 @pytest.mark.asyncio
@@ -143,8 +144,8 @@ async def test_route_and_fetch_uses_browser_fallback(monkeypatch: pytest.MonkeyP
     async def fake_browser_fetch_one(job: UrlJob, ctx: RunnerContext, browser: object) -> FetchResult:
         calls["browser"] += 1
         res = _make_fetch_result(status="success", http_status=200, content_len=30_000)
-        res["method"] = "playwright"
-        res["stage"] = "fallback"
+        res.method = "playwright"
+        res.stage = "fallback"
         return res
 
     monkeypatch.setattr(router, "fetch_one", fake_http_fetch_one)
@@ -154,17 +155,49 @@ async def test_route_and_fetch_uses_browser_fallback(monkeypatch: pytest.MonkeyP
     )
 
     ctx = _make_runner_context()
-    job: UrlJob = {
-        "url": UrlStr("https://example.com/page"),
-        "is_dynamic_hint": None,
-        "shard_id": 0,
-        "index_in_shard": 0,
-    }
+    job = UrlJob(
+        url=UrlStr("https://example.com/page"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
 
     dummy_browser = object()
     result = await router.route_and_fetch(job, ctx, dummy_browser)  # type: ignore[arg-type]
 
     assert calls["http"] == 1
     assert calls["browser"] == 1
-    assert result["method"] == "playwright"
-    assert result["status"] == "success"
+    assert result.method == "playwright"
+    assert result.status == "success"
+
+
+@pytest.mark.asyncio
+async def test_route_and_fetch_without_browser_keeps_probe(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a browser, the breaker's half-open probe is not consumed."""
+
+    async def fake_http_fetch_one(job: UrlJob, ctx: RunnerContext) -> FetchResult:
+        return _make_fetch_result(status="timeout", http_status=None)
+
+    monkeypatch.setattr(router, "fetch_one", fake_http_fetch_one)
+
+    ctx = replace(
+        _make_runner_context(),
+        scheduler=DomainScheduler(
+            global_limit=4,
+            max_errors_for_browser=1,
+            browser_cooldown_seconds=0.0,
+        ),
+    )
+    ctx.scheduler.record_error("example.com", 503)
+    job = UrlJob(
+        url=UrlStr("https://example.com/page"),
+        is_dynamic_hint=None,
+        shard_id=0,
+        index_in_shard=0,
+    )
+
+    for _ in range(3):
+        await router.route_and_fetch(job, ctx, None)
+
+    assert ctx.scheduler._breakers["example.com"][0] == "open"
+    assert ctx.scheduler.should_try_browser("example.com")
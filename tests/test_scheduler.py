@@ -1,6 +1,7 @@
 """Tests for domain scheduler."""
 
 import asyncio
+import time
 
 import pytest
 
@@ -66,3 +67,276 @@ def test_scheduler_should_try_browser() -> None:
     assert other.should_try_browser("captcha.com")
     other.record_captcha("captcha.com")
     assert not other.should_try_browser("captcha.com")
+
+    # Read-only checks never materialize counter entries
+    assert other.should_try_browser("clean.com")
+    assert "clean.com" not in other._error_counts
+    assert "clean.com" not in other._captcha_counts
+
+
+@pytest.mark.asyncio
+async def test_scheduler_defer_delays_domain() -> None:
+    """Test that a rate-limit deadline delays the next acquire for that domain only."""
+    scheduler = DomainScheduler(global_limit=10)
+    loop = asyncio.get_running_loop()
+    scheduler.defer("slow.com", 0.1)
+
+    start = loop.time()
+    await scheduler.acquire("fast.com")
+    scheduler.release("fast.com")
+    assert loop.time() - start < 0.05
+
+    await scheduler.acquire("slow.com")
+    scheduler.release("slow.com")
+    assert loop.time() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_scheduler_waiter_honours_extended_deadline() -> None:
+    """Test a deadline pushed out mid-wait holds the waiting request too."""
+    scheduler = DomainScheduler(global_limit=None)
+    loop = asyncio.get_running_loop()
+    scheduler.defer("slow.com", 0.05)
+
+    start = loop.time()
+    waiter = asyncio.create_task(scheduler.acquire("slow.com"))
+    await asyncio.sleep(0.01)
+    scheduler.defer("slow.com", 0.1)
+
+    await waiter
+    scheduler.release("slow.com")
+    assert loop.time() - start >= 0.1
+    assert "slow.com" not in scheduler._not_before
+
+
+@pytest.mark.asyncio
+async def test_scheduler_domain_limit_adapts() -> None:
+    """Test per-domain AIMD gate shrinks on congestion and recovers on success."""
+    scheduler = DomainScheduler(global_limit=10, default_domain_limit=4)
+    await scheduler.acquire("flaky.com")
+    gate = scheduler._domain_gates["flaky.com"]
+    assert gate.limit == 4
+
+    # Errors and unflagged CAPTCHAs feed the breaker, not the gate
+    for _ in range(8):
+        scheduler.record_error("flaky.com")
+        scheduler.record_captcha("flaky.com")
+    assert gate.limit == 4
+
+    for _ in range(4):
+        scheduler.record_latency("flaky.com", 100, congested=True)
+    assert gate.limit == 2
+
+    for _ in range(4):
+        scheduler.record_captcha("flaky.com", congested=True)
+    assert gate.limit == 1
+
+    for _ in range(20):
+        scheduler.record_latency("flaky.com", 100)
+    assert gate.limit == 4
+
+    # Other domains keep their own limit
+    await scheduler.acquire("calm.com")
+    assert scheduler._domain_gates["calm.com"].limit == 4
+    scheduler.release("calm.com")
+    scheduler.release("flaky.com")
+
+
+@pytest.mark.asyncio
+async def test_scheduler_without_global_limit() -> None:
+    """Test only per-domain gates apply when global_limit is None."""
+    scheduler = DomainScheduler(global_limit=None, default_domain_limit=2)
+
+    for i in range(5):
+        await asyncio.wait_for(scheduler.acquire(f"d{i}.com"), 0.1)
+    for i in range(5):
+        scheduler.release(f"d{i}.com")
+
+
+@pytest.mark.asyncio
+async def test_scheduler_token_bucket_paces_domain() -> None:
+    """Test requests beyond the burst wait for tokens at the domain rate."""
+    scheduler = DomainScheduler(
+        global_limit=None,
+        default_domain_limit=2,
+        per_domain_rates={"paced.com": 20.0},
+    )
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    # Burst of 2 goes straight through, the next two wait ~50ms each
+    for _ in range(4):
+        await scheduler.acquire("paced.com")
+        scheduler.release("paced.com")
+    assert loop.time() - start >= 0.09
+
+    # Unlisted domains have no rate cap
+    start = loop.time()
+    for _ in range(4):
+        await scheduler.acquire("free.com")
+        scheduler.release("free.com")
+    assert loop.time() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_scheduler_record_throttle_defers_and_shrinks() -> None:
+    """Test a rate-limit signal pauses the domain and cuts its concurrency."""
+    scheduler = DomainScheduler(global_limit=None, default_domain_limit=4)
+    await scheduler.acquire("api.com")
+    gate = scheduler._domain_gates["api.com"]
+
+    for _ in range(4):
+        scheduler.record_throttle("api.com", 0.05)
+    assert gate.limit == 2
+    scheduler.release("api.com")
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await scheduler.acquire("api.com")
+    scheduler.release("api.com")
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_scheduler_evicts_idle_healthy_gates() -> None:
+    """Test gates of idle healthy domains are dropped, troubled ones kept."""
+    scheduler = DomainScheduler(global_limit=None, default_domain_limit=2)
+
+    async def hold(domain: str) -> None:
+        await scheduler.acquire(domain)
+        await asyncio.sleep(0.01)
+        scheduler.release(domain)
+
+    await asyncio.gather(*(hold("ok.com") for _ in range(5)))
+    assert "ok.com" not in scheduler._domain_gates
+    assert "ok.com" not in scheduler._domain_users
+
+    await scheduler.acquire("bad.com")
+    scheduler.record_error("bad.com")
+    scheduler.release("bad.com")
+    assert "bad.com" in scheduler._domain_gates
+    assert "bad.com" not in scheduler._domain_users
+
+    # A cancelled waiter gives its slot back
+    await scheduler.acquire("one.com")
+    await scheduler.acquire("one.com")
+    waiter = asyncio.ensure_future(scheduler.acquire("one.com"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release("one.com")
+    scheduler.release("one.com")
+    assert "one.com" not in scheduler._domain_gates
+    assert "one.com" not in scheduler._domain_users
+
+
+
+@pytest.mark.asyncio
+async def test_scheduler_seeded_jitter_is_reproducible() -> None:
+    """Test the scheduler's private RNG makes jitter repeatable."""
+
+    def delays(seed: int) -> list[float]:
+        scheduler = DomainScheduler(
+            global_limit=None,
+            default_domain_limit=1,
+            jitter_range=(0.1, 0.2),
+            default_domain_rate=1_000.0,
+            seed=seed,
+        )
+        return [scheduler._take_token("x.com") for _ in range(5)]
+
+    first = delays(7)
+    assert all(d >= 0.1 for d in first[1:])
+    assert first == pytest.approx(delays(7), abs=1e-3)
+
+
+def test_scheduler_browser_breaker_half_open_probe() -> None:
+    """Test a tripped breaker reopens to a single probe after cool-down."""
+    scheduler = DomainScheduler(
+        global_limit=None,
+        max_errors_for_browser=2,
+        browser_cooldown_seconds=0.05,
+    )
+
+    # 401/403 are deterministic and never trip the breaker
+    for _ in range(5):
+        scheduler.record_error("auth.com", 403)
+    assert scheduler.should_try_browser("auth.com")
+
+    scheduler.record_error("down.com", 503)
+    scheduler.record_error("down.com")
+    assert not scheduler.should_try_browser("down.com")
+
+    # HTTP-path failures keep arriving but do not extend the cool-down
+    for _ in range(4):
+        time.sleep(0.02)
+        scheduler.record_error("down.com", 503)
+        scheduler.record_captcha("down.com")
+
+    # Cool-down elapsed: exactly one probe goes through
+    assert scheduler.should_try_browser("down.com")
+    assert not scheduler.should_try_browser("down.com")
+
+    # HTTP-path failures leave the probe alone; a failed probe re-opens
+    scheduler.record_error("down.com", 503)
+    assert scheduler._breakers["down.com"][0] == "half_open"
+    scheduler.record_error("down.com", browser=True)
+    assert not scheduler.should_try_browser("down.com")
+
+    # A successful probe closes the breaker and resets counts
+    time.sleep(0.06)
+    assert scheduler.should_try_browser("down.com")
+    scheduler.record_success("down.com")
+    assert "down.com" not in scheduler._breakers
+    assert "down.com" not in scheduler._error_counts
+    assert scheduler.should_try_browser("down.com")
+
+
+def test_scheduler_domain_limit_tiers() -> None:
+    """Test exact hosts beat wildcard suffixes, which beat the default."""
+    scheduler = DomainScheduler(
+        global_limit=None,
+        per_domain_limits={"*.google.com": 1, "*.co.uk": 2, "api.google.com": 3},
+        default_domain_limit=4,
+    )
+    assert scheduler._limit_for("google.com") == 1
+    assert scheduler._limit_for("www.google.com:443") == 1
+    assert scheduler._limit_for("api.google.com") == 3
+    assert scheduler._limit_for("news.bbc.co.uk") == 2
+    assert scheduler._limit_for("notgoogle.com") == 4
+
+
+def test_scheduler_domain_rate_tiers() -> None:
+    """Test request rates resolve through the same suffix tiers as limits."""
+    scheduler = DomainScheduler(
+        global_limit=None,
+        per_domain_rates={"*.google.com": 0.5, "api.google.com": 5.0},
+        default_domain_rate=2.0,
+    )
+    assert scheduler._rate_for("www.google.com") == 0.5
+    assert scheduler._rate_for("google.com:443") == 0.5
+    assert scheduler._rate_for("api.google.com") == 5.0
+    assert scheduler._rate_for("notgoogle.com") == 2.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_slot_releases_on_cancel() -> None:
+    """Test a slot held by a cancelled task is returned to the domain."""
+    scheduler = DomainScheduler(global_limit=1, default_domain_limit=1)
+    entered = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.slot("example.com"):
+            entered.set()
+            await asyncio.sleep(3600)
+
+    task = asyncio.create_task(hold())
+    await entered.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    async with asyncio.timeout(1):
+        async with scheduler.slot("example.com"):
+            pass
@@ -0,0 +1,12 @@
+"""Tests for timing utilities."""
+
+from tavily_scraper.utils.timing import BACKOFF_JITTER, backoff_delay
+
+
+def test_backoff_delay_doubles_within_jitter() -> None:
+    """Test delays double per attempt and stay inside the jitter band."""
+    for attempt, nominal in ((1, 0.5), (2, 1.0), (3, 2.0)):
+        delays = [backoff_delay(attempt, 0.5) for _ in range(200)]
+        assert min(delays) >= nominal * (1 - BACKOFF_JITTER)
+        assert max(delays) <= nominal * (1 + BACKOFF_JITTER)
+        assert len(set(delays)) > 1